@@ -0,0 +1,74 @@
+"""Resident memory per event: raw TheSportsDB dicts vs Event records.
+
+Raw events are parsed from a JSON document shaped like eventsday.php
+output, so every string is a separate object exactly as after
+response.json(). Sizes are measured with tracemalloc.
+
+    python benchmarks/bench_event_memory.py [--events 20000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+TEAMS = [f"Team {i}" for i in range(400)]
+LEAGUES = [f"League {i}" for i in range(40)]
+
+
+def api_event(i):
+    home, away = TEAMS[i % len(TEAMS)], TEAMS[(i * 7 + 1) % len(TEAMS)]
+    league = LEAGUES[i % len(LEAGUES)]
+    return {
+        "idEvent": str(1000000 + i), "idSoccerXML": None, "idAPIfootball": str(500000 + i),
+        "strEvent": f"{home} vs {away}", "strEventAlternate": f"{away} @ {home}",
+        "strFilename": f"{league} 2026-10-18 {home} vs {away}", "strSport": "Soccer",
+        "idLeague": str(4000 + i % 40), "strLeague": league, "strLeagueBadge": f"https://example.invalid/{league}.png",
+        "strSeason": "2026-2027", "strDescriptionEN": "", "strHomeTeam": home, "strAwayTeam": away,
+        "intHomeScore": str(i % 4), "intRound": str(i % 38), "intAwayScore": str(i % 3),
+        "intSpectators": None, "strOfficial": "", "strTimestamp": "2026-10-18T18:00:00",
+        "dateEvent": "2026-10-18", "dateEventLocal": "2026-10-18", "strTime": "18:00:00",
+        "strTimeLocal": "19:00:00", "strGroup": "", "idHomeTeam": str(130000 + i % 400),
+        "strHomeTeamBadge": f"https://example.invalid/{home}.png", "idAwayTeam": str(130000 + (i * 7 + 1) % 400),
+        "strAwayTeamBadge": f"https://example.invalid/{away}.png", "intScore": None, "intScoreVotes": None,
+        "strResult": "", "idVenue": str(20000 + i % 400), "strVenue": f"{home} Stadium", "strCountry": "England",
+        "strCity": "", "strPoster": "", "strSquare": "", "strFanart": None, "strThumb": "", "strBanner": "",
+        "strMap": None, "strTweet1": "", "strTweet2": "", "strTweet3": "", "strVideo": "",
+        "strStatus": "Match Finished" if i % 3 else "2H", "strPostponed": "no", "strLocked": "unlocked",
+        "strProgress": "67'"
+    }
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+    payload = json.dumps({"events": [api_event(i) for i in range(args.events)]})
+
+    raw, raw_bytes = traced(lambda: json.loads(payload)["events"])
+    del raw
+    records, record_bytes = traced(lambda: [core.Event.from_api(event) for event in json.loads(payload)["events"]])
+
+    print(f"events:        {args.events}")
+    print(f"raw dicts:     {raw_bytes / args.events:8.0f} bytes/event")
+    print(f"Event records: {record_bytes / args.events:8.0f} bytes/event")
+    print(f"reduction:     {raw_bytes / record_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""End-to-end freshness lag and request counts against fake_sportsdb.
+
+Each profile starts an in-process FakeSportsDB and runs a FeedPoller
+against it for --duration seconds. Freshness lag is the time from the
+server producing a data version until the poller holds that version or
+a newer one. Its maximum is the longest stretch a feed went without
+fresh data; versions never picked up count until the end of the run.
+Request counts come from the server, poll outcomes from the poller.
+
+    python benchmarks/bench_feed_faults.py [--duration 60] [--tick 10] [--profile clean flaky storm]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+from fake_sportsdb import FakeSportsDB, FaultProfile, GeneratedDays
+
+PROFILES = {
+    "clean": {},
+    "slow": {"latency": "lognormal:800:0.5"},
+    "flaky": {"error_rate": 0.2},
+    "storm": {"storm": (60, 20), "storm_code": 429, "retry_after": 5},
+    "truncated": {"truncate_rate": 0.1}
+}
+FEEDS = [("Soccer", None), ("Basketball", None)]
+
+
+class ProbedPoller(core.FeedPoller):
+    # Notes which server version each feed holds after every successful poll
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.held = {}
+
+    def fetch_live_events(self, feed):
+        self.local.feed = feed
+        self.local.version = None
+        super().fetch_live_events(feed)
+
+    def read_body(self, response, digest, stages):
+        self.local.version = int(response.headers.get("X-Data-Version", -1))
+        yield from super().read_body(response, digest, stages)
+
+    def count_poll(self, outcome):
+        if outcome in ("processed", "unchanged") and getattr(self.local, "version", None) is not None:
+            with self.lock:
+                self.held.setdefault(self.local.feed.key, []).append((time.time(), self.local.version))
+        super().count_poll(outcome)
+
+
+def freshness_lags(server, poller, ended):
+    lags = []
+    for sport, league in FEEDS:
+        held = poller.held.get((sport, league), [])
+        version = 0
+        while server.started + server.source.produced_at(sport, league, version) < ended:
+            produced = server.started + server.source.produced_at(sport, league, version)
+            caught_up = next((at for at, seen in held if seen >= version), ended)
+            lags.append((caught_up - produced) * 1000)
+            version += 1
+    return lags
+
+
+def run_profile(name, duration, tick, events):
+    source = GeneratedDays(events, 10, seed=1, tick=tick)
+    server = FakeSportsDB(("127.0.0.1", 0), source, FaultProfile(seed=1, **PROFILES[name]))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    core.API_BASE_URL = server.base_url
+    poller = ProbedPoller(FEEDS)
+    worker = threading.Thread(target=poller.run, daemon=True)
+    worker.start()
+    time.sleep(duration)
+    ended = time.time()
+    poller.stop()
+    worker.join(5)
+    server.shutdown()
+    server.server_close()
+    return freshness_lags(server, poller, ended), server.snapshot_stats(), dict(poller.poll_stats)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--tick", type=float, default=10, help="seconds between server data versions")
+    parser.add_argument("--events", type=int, default=200, help="events per sport")
+    parser.add_argument("--profile", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':>10} {'lag p50 s':>10} {'p95 s':>7} {'max s':>7} {'requests':>9} {'polls':>6} {'failed':>7}  server")
+    for name in args.profile:
+        lags, server_stats, poll_stats = run_profile(name, args.duration, args.tick, args.events)
+        summary = core.latency_summary(lags)
+        polls = sum(poll_stats.values())
+        other = {key: value for key, value in sorted(server_stats.items()) if key != "requests"}
+        print(f"{name:>10} {summary['p50_ms'] / 1000:>10.1f} {summary['p95_ms'] / 1000:>7.1f} {summary['max_ms'] / 1000:>7.1f} "
+              f"{server_stats.get('requests', 0):>9} {polls:>6} {poll_stats['failed']:>7}  {other}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
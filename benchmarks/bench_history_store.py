@@ -0,0 +1,113 @@
+"""Write throughput, disk footprint and range reads of the score history.
+
+Replays --polls polls of a --events event day in which live matches
+tick their clock every poll and occasionally score. "snapshots" is
+the naive archive that appends the whole JSON snapshot each poll, the
+way the cache row would look if it were never overwritten. "history"
+is HistoryStore fed the changed events of each poll, as FeedPoller
+does. The range read takes a --window second slice from the middle
+of the generated polls.
+
+    python benchmarks/bench_history_store.py [--events 2000] [--polls 200] [--window 60]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+LIVE_RATIO = 0.3
+GOAL_RATIO = 0.01
+POLL_SECONDS = 15
+
+
+def make_day(count):
+    return [core.Event(str(100000 + i), "Soccer", f"League {i % 40}", f"Home {i}", f"Away {i}", 0, 0,
+                       "Live" if i < count * LIVE_RATIO else "Scheduled", "1'" if i < count * LIVE_RATIO else "",
+                       "18:00:00", "2026-01-01") for i in range(count)]
+
+
+def next_poll(events, poll, rng):
+    changed = []
+    for event in events:
+        if event.status_text != "Live":
+            continue
+        home = event.home_score + (rng.random() < GOAL_RATIO)
+        away = event.away_score + (rng.random() < GOAL_RATIO)
+        changed.append(core.Event(event.event_id, event.sport, event.league, event.home, event.away, home, away,
+                                  event.status_text, f"{poll % 90 + 1}'", event.time, event.date))
+    by_id = {event.event_id: event for event in changed}
+    return [by_id.get(event.event_id, event) for event in events], changed
+
+
+def db_size(path):
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--window", type=float, default=60)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    polls = [(make_day(args.events), None)]
+    for poll in range(1, args.polls):
+        polls.append(next_poll(polls[-1][0], poll, rng))
+    start_ts = 1767261600.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "snapshots.db")
+        db = core.DatabaseManager(path)
+        conn = db.connections.connection()
+        conn.execute("CREATE TABLE snapshots (ts INTEGER, data TEXT)")
+        started = time.perf_counter()
+        for poll, (events, _) in enumerate(polls):
+            with conn:
+                conn.execute("INSERT INTO snapshots VALUES (?, ?)",
+                             (poll, json.dumps({"events": events}, default=core.encode_snapshot_item)))
+        snapshot_time = time.perf_counter() - started
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        snapshot_size = db_size(path)
+        db.close()
+
+        path = os.path.join(tmp, "history.db")
+        db = core.DatabaseManager(path)
+        history = core.HistoryStore(db)
+        rows = 0
+        started = time.perf_counter()
+        for poll, (events, changed) in enumerate(polls):
+            rows += history.record(events if changed is None else changed, start_ts + poll * POLL_SECONDS)
+        history_time = time.perf_counter() - started
+        db.connections.connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        history_size = db_size(path)
+
+        live_ids = [event.event_id for event in polls[0][0] if event.status_text == "Live"]
+        timings = []
+        for event_id in rng.sample(live_ids, min(100, len(live_ids))):
+            started = time.perf_counter()
+            history.timeline(event_id, start_ts + args.polls * POLL_SECONDS / 2)
+            timings.append((time.perf_counter() - started) * 1000)
+        window_start = start_ts + max(args.polls * POLL_SECONDS - args.window, 0) / 2
+        started = time.perf_counter()
+        window = sum(1 for _ in history.changes(window_start, window_start + args.window))
+        window_ms = (time.perf_counter() - started) * 1000
+        db.close()
+
+    print(f"{'':>10} {'rows':>9} {'rows/s':>10} {'MB on disk':>11}")
+    print(f"{'snapshots':>10} {len(polls):>9} {len(polls) / snapshot_time:>10.0f} {snapshot_size / 2 ** 20:>11.2f}")
+    print(f"{'history':>10} {rows:>9} {rows / history_time:>10.0f} {history_size / 2 ** 20:>11.2f}")
+    print(f"event timeline read: {statistics.median(timings):.2f} ms median, "
+          f"{args.window:g} s window: {window} changes in {window_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Repaint cost of ModernButton/GlassEffect and icon lookups.
+
+Renders each widget repeatedly into an offscreen image, alternating the
+hover state the way mouse movement does, and compares against the
+previous paintEvent that rebuilt its gradient and colours every time.
+Icon lookups compare loading a star PNG from disk with the in-memory
+IconRegistry.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_paint_cache.py [--frames 2000] [--dpr 2]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor, QIcon, QImage, QLinearGradient, QPainter
+from PyQt6.QtWidgets import QApplication
+
+import live_sports_hub as hub
+
+
+class LegacyButton(hub.ModernButton):
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self.rect().adjusted(1, 1, -1, -1)
+        if self.underMouse():
+            color1, color2, text_color = QColor("#1080EF"), QColor("#0066CC"), QColor("white")
+        else:
+            color1, color2, text_color = QColor("#0078D4"), QColor("#106EBE"), QColor("white")
+        gradient = QLinearGradient(0, 0, 0, rect.height())
+        gradient.setColorAt(0, color1)
+        gradient.setColorAt(1, color2)
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(rect, 12, 12)
+        painter.setPen(text_color)
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
+
+
+class LegacyGlass(hub.GlassEffect):
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QColor(255, 255, 255, int(255 * self.opacity)))
+        painter.setPen(QColor(255, 255, 255, 80))
+        painter.drawRoundedRect(self.rect(), 20, 20)
+
+
+def render_cost(widget, frames, dpr, hover=False):
+    image = QImage(round(widget.width() * dpr), round(widget.height() * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    start = time.perf_counter()
+    for i in range(frames):
+        if hover:
+            widget.setAttribute(Qt.WidgetAttribute.WA_UnderMouse, i % 2 == 0)
+        widget.render(image)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--dpr", type=float, default=2.0)
+    args = parser.parse_args()
+    # Widgets cache at their own DPR, so the screen has to match the target image
+    os.environ["QT_SCALE_FACTOR"] = str(args.dpr)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'':>14} {'before (us)':>12} {'after (us)':>12}")
+    for name, legacy, current, size, hover in (
+            ("button hover", LegacyButton("Refresh Now"), hub.ModernButton("Refresh Now"), (180, 44), True),
+            ("glass panel", LegacyGlass(opacity=0.1), hub.GlassEffect(opacity=0.1), (1400, 100), False)):
+        for widget in (legacy, current):
+            widget.resize(*size)
+        before = render_cost(legacy, args.frames, args.dpr, hover)
+        after = render_cost(current, args.frames, args.dpr, hover)
+        print(f"{name:>14} {before:>12.1f} {after:>12.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "star.png")
+        hub.create_placeholder_pixmap(32, QColor("#FFD700"), "star").save(path)
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            QIcon(path).pixmap(20, 20)
+        before = (time.perf_counter() - start) / args.frames * 1e6
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            hub.icon_registry.pixmap("star", 20, args.dpr)
+        after = (time.perf_counter() - start) / args.frames * 1e6
+    print(f"{'star icon':>14} {before:>12.1f} {after:>12.1f}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Cache read/write throughput of DatabaseManager.
+
+"before" replays the previous per-call sqlite3.connect implementation,
+"pooled" uses the per-thread WAL connection with the in-memory tier
+disabled and "two-tier" is the default DatabaseManager with the LRU in
+front of SQLite. The payload is a 100-event snapshot, the same shape
+APIWorker caches every poll.
+
+    python benchmarks/bench_sqlite_cache.py [--ops 2000] [--synchronous NORMAL]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+
+class LegacyCache:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, data TEXT, timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+
+    def set_cache(self, key, data):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO cache (key, data) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET data = excluded.data, timestamp = CURRENT_TIMESTAMP
+            """, (key, json.dumps(data)))
+
+    def get_cache(self, key, max_age=60):
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT data, timestamp FROM cache WHERE key = ?", (key,)).fetchone()
+            if row:
+                data, timestamp = row
+                if (datetime.now() - datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")).seconds < max_age:
+                    return json.loads(data)
+        return None
+
+
+def make_payload(count=100):
+    return {"events": [{
+        "idEvent": str(i),
+        "strEvent": f"Home {i} vs Away {i}",
+        "strLeague": f"League {i % 10}",
+        "strSport": "Soccer",
+        "strHomeTeam": f"Home {i}",
+        "strAwayTeam": f"Away {i}",
+        "intHomeScore": str(i % 4),
+        "intAwayScore": str(i % 3),
+        "strStatus": "Live",
+        "strProgress": "45'"
+    } for i in range(count)], "timestamp": datetime.now().isoformat()}
+
+
+def throughput(fn, ops):
+    start = time.perf_counter()
+    for _ in range(ops):
+        fn()
+    return ops / (time.perf_counter() - start)
+
+
+def run(cache, payload, ops):
+    cache.set_cache("events_Soccer_all", payload)
+    writes = throughput(lambda: cache.set_cache("events_Soccer_all", payload), ops)
+    # max_age is generous so the legacy local/UTC timestamp comparison still counts as a hit
+    reads = throughput(lambda: cache.get_cache("events_Soccer_all", max_age=86400), ops)
+    return writes, reads
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--synchronous", default=core.DB_SYNCHRONOUS, choices=core.SYNCHRONOUS_LEVELS)
+    args = parser.parse_args()
+    payload = make_payload()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = run(LegacyCache(os.path.join(tmp, "legacy.db")), payload, args.ops)
+        db = core.DatabaseManager(os.path.join(tmp, "pooled.db"), synchronous=args.synchronous, cache_entries=0)
+        pooled = run(db, payload, args.ops)
+        db.close()
+        db = core.DatabaseManager(os.path.join(tmp, "two_tier.db"), synchronous=args.synchronous)
+        two_tier = run(db, payload, args.ops)
+        stats = db.cache_stats()
+        db.close()
+
+    print(f"{'':>9} {'writes/s':>10} {'reads/s':>12}")
+    for name, (writes, reads) in (("before", before), ("pooled", pooled), ("two-tier", two_tier)):
+        print(f"{name:>9} {writes:>10.0f} {reads:>12.0f}")
+    print(f"warm lookup: {1e9 / two_tier[1]:.0f} ns, stats: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Cold-start cost of the GUI: module import time and time to first row.
+
+Import time is the cumulative figure for live_sports_hub reported by
+`python -X importtime`. Time to first paint / first row is measured in a
+fresh interpreter that goes through the real entry path against a
+database holding today's cached snapshot, as on a second launch. Times
+are taken from a shared monotonic clock, starting just before the child
+process is spawned, so interpreter start-up is included.
+
+Medians are compared against startup_budget.json; --check exits
+non-zero when any budget is exceeded.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py [--runs 5] [--events 300] [--check]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+TIMEOUT = 60
+
+
+def seed_cache(db_path, count):
+    import sports_core as core
+
+    events = [core.Event.from_api({
+        "idEvent": str(100000 + i),
+        "strSport": "Soccer",
+        "strLeague": f"League {i % 20}",
+        "strHomeTeam": f"Home {i}",
+        "strAwayTeam": f"Away {i}",
+        "intHomeScore": str(i % 4),
+        "intAwayScore": str(i % 3),
+        "strStatus": "Live" if i % 3 else "FT",
+        "strProgress": "45'",
+        "strTime": "18:00:00"
+    }) for i in range(count)]
+    db = core.DatabaseManager(db_path)
+    db.set_cache(core.FeedState("Soccer").cache_key(), {"events": events, "timestamp": "2026-01-01T00:00:00"},
+                 core.encode_snapshot_item)
+    db.close()
+
+
+def child(db_path, start):
+    def elapsed():
+        return (time.monotonic() - start) * 1000
+
+    import live_sports_hub as hub
+    marks = {"import_done_ms": elapsed()}
+
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+
+    # Same entry path as __main__, pointed at the seeded database
+    hub.app_db_path = lambda: db_path
+    app = hub.create_application([sys.argv[0]])
+    window = hub.LiveSportsApp()
+    marks["window_built_ms"] = elapsed()
+
+    def finish():
+        print(json.dumps(marks), flush=True)
+        window.close()
+        app.quit()
+
+    class PaintProbe(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                if "first_paint_ms" not in marks:
+                    marks["first_paint_ms"] = elapsed()
+                if "first_row_ms" not in marks and obj is window.table.viewport() and window.events_model.rowCount():
+                    marks["first_row_ms"] = elapsed()
+                    QTimer.singleShot(0, finish)
+            return False
+
+    probe = PaintProbe()
+    window.installEventFilter(probe)
+    window.table.viewport().installEventFilter(probe)
+    window.show()
+    QTimer.singleShot(TIMEOUT * 1000, finish)
+    app.exec()
+
+
+def import_time(env):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import live_sports_hub"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, timeout=TIMEOUT, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                rows.append((int(self_us), int(cumulative_us), name.strip()))
+    total = next(cumulative for _, cumulative, name in rows if name == "live_sports_hub")
+    return total / 1000, sorted(rows, reverse=True)[:8]
+
+
+def first_row(env, db_path, workdir):
+    start = time.monotonic()
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", db_path, repr(start)],
+                            cwd=workdir, env=env, capture_output=True, text=True, timeout=TIMEOUT * 2)
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        raise RuntimeError(f"startup probe failed:\n{result.stderr}")
+    return json.loads(lines[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--budget", default=BUDGET_PATH)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--child", nargs=2, metavar=("DB", "START"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], float(args.child[1]))
+        return 0
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "sports_hub.db")
+        seed_cache(db_path, args.events)
+        imports, runs = [], []
+        for _ in range(args.runs):
+            total, heaviest = import_time(env)
+            imports.append(total)
+            runs.append(first_row(env, db_path, tmp))
+
+    results = {"import_ms": statistics.median(imports)}
+    for key in ("window_built_ms", "first_paint_ms", "first_row_ms"):
+        results[key] = statistics.median(run[key] for run in runs if key in run)
+
+    print("heaviest imports (self / cumulative ms):")
+    for self_us, cumulative_us, name in heaviest:
+        print(f"  {self_us / 1000:>7.1f} {cumulative_us / 1000:>8.1f}  {name}")
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+    over = []
+    print(f"{'':>16} {'median':>8} {'budget':>8}")
+    for key, value in results.items():
+        limit = budget.get(key)
+        flag = "" if limit is None or value <= limit else "  OVER"
+        if flag:
+            over.append(key)
+        print(f"{key:>16} {value:>8.1f} {'-' if limit is None else limit:>8}{flag}")
+    return 1 if args.check and over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Peak memory and time to first rows when ingesting a large day payload.
+
+"buffered" is the previous path: join the whole body, json.loads it and
+convert every event. "streaming" feeds the same body through
+iter_json_array in STREAM_CHUNK_BYTES chunks and converts events in
+STREAM_BATCH_EVENTS batches, as FeedPoller does for a cold feed. Peak
+memory is traced with tracemalloc and excludes the raw chunks, which
+both paths receive from the socket.
+
+    python benchmarks/bench_stream_ingest.py [--events 1000 5000 20000]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+
+def make_body(count):
+    return json.dumps({"events": [{
+        "idEvent": str(100000 + i),
+        "strEvent": f"Home {i} vs Away {i}",
+        "strLeague": f"League {i % 40}",
+        "strSport": "Soccer",
+        "strHomeTeam": f"Home {i}",
+        "strAwayTeam": f"Away {i}",
+        "intHomeScore": str(i % 4),
+        "intAwayScore": str(i % 3),
+        "strStatus": "Live" if i % 3 else "FT",
+        "strProgress": "45'",
+        "dateEvent": "2026-01-01",
+        "strTime": "18:00:00",
+        "strVenue": f"Stadium {i % 200}",
+        "strDescriptionEN": "Matchday fixture " * 8
+    } for i in range(count)]}).encode()
+
+
+def buffered(chunks):
+    start = time.perf_counter()
+    data = json.loads(b"".join(chunks))
+    events = [core.Event.from_api(event) for event in data.get("events") or []]
+    first = time.perf_counter() - start
+    return events, first
+
+
+def streaming(chunks):
+    start = time.perf_counter()
+    first = None
+    events, batch = [], []
+    for item in core.iter_json_array(chunks):
+        batch.append(item)
+        if len(batch) == core.STREAM_BATCH_EVENTS:
+            events.extend(core.Event.from_api(event) for event in batch)
+            batch = []
+            if first is None:
+                first = time.perf_counter() - start
+    events.extend(core.Event.from_api(event) for event in batch)
+    return events, first if first is not None else time.perf_counter() - start
+
+
+def measure(ingest, chunks):
+    tracemalloc.start()
+    start = time.perf_counter()
+    events, first = ingest(chunks)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return len(events), first * 1000, total * 1000, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    print(f"{'events':>7} {'body MB':>8} {'':>10} {'first rows ms':>14} {'total ms':>9} {'peak MB':>8}")
+    for count in args.events:
+        body = make_body(count)
+        chunks = [body[i:i + core.STREAM_CHUNK_BYTES] for i in range(0, len(body), core.STREAM_CHUNK_BYTES)]
+        for name, ingest in (("buffered", buffered), ("streaming", streaming)):
+            parsed, first, total, peak = measure(ingest, chunks)
+            assert parsed == count
+            print(f"{count:>7} {len(body) / 2 ** 20:>8.1f} {name:>10} {first:>14.1f} {total:>9.1f} {peak:>8.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Per-poll GUI-thread cost of refreshing the events table.
+
+Compares the previous full QTableWidget rebuild with the path a poll
+takes now at 100, 1,000 and 10,000 events, with 5% of the events
+changing score between polls. A changeset goes through
+EventTableModel.apply_delta, the EventFilterProxyModel in front of it
+and a synchronous repaint of the visible rows by EventItemDelegate.
+"filtered" also has a search active and favorites sorted first, so the
+proxy re-filters and re-sorts every changed row. Changesets are built
+by the worker, so diffing stays outside the timing. The legacy rebuild
+takes minutes per poll at 10,000 rows, so it is skipped above
+--legacy-max events.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_table_update.py
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtWidgets import QApplication, QPushButton, QTableView, QTableWidget, QTableWidgetItem
+
+import live_sports_hub as hub
+import sports_core as core
+
+SIZES = (100, 1000, 10000)
+POLLS = 5
+CHANGE_RATIO = 0.05
+
+
+def make_events(count):
+    return [{
+        "idEvent": str(100000 + i),
+        "strEvent": f"Home {i} vs Away {i}",
+        "strLeague": f"League {i % 40}",
+        "strSport": "Soccer",
+        "strHomeTeam": f"Home {i}",
+        "strAwayTeam": f"Away {i}",
+        "intHomeScore": "0",
+        "intAwayScore": "0",
+        "strStatus": "Live" if i % 3 else "FT",
+        "strProgress": "45'",
+        "strTime": "18:00"
+    } for i in range(count)]
+
+
+def next_poll(events, rng):
+    events = [dict(event) for event in events]
+    for event in rng.sample(events, max(1, int(len(events) * CHANGE_RATIO))):
+        event["intHomeScore"] = str(int(event["intHomeScore"]) + 1)
+    return events
+
+
+def legacy_rebuild(table, events, favorites):
+    # Mirrors the QTableWidget rebuild that update_table used to do per poll
+    table.setRowCount(0)
+    for event in events:
+        row = table.rowCount()
+        table.insertRow(row)
+        for col, key in ((0, "strLeague"), (1, "strHomeTeam"), (3, "strAwayTeam"), (4, "strStatus"), (5, "strProgress")):
+            item = QTableWidgetItem(event.get(key, ""))
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            table.setItem(row, col, item)
+        score_item = QTableWidgetItem(f"{event['intHomeScore']} - {event['intAwayScore']}")
+        score_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        if event["strStatus"] == "Live":
+            score_item.setForeground(QColor("#FF6B6B"))
+        table.setItem(row, 2, score_item)
+        fav_btn = QPushButton()
+        fav_btn.setIcon(QIcon("icons/star_filled.png" if event["idEvent"] in favorites else "icons/star.png"))
+        fav_btn.setStyleSheet("border: none; padding: 4px;")
+        table.setCellWidget(row, 6, fav_btn)
+        table.setItem(row, 7, QTableWidgetItem(time.strftime("%H:%M:%S")))
+
+
+def measure(app, apply, polls, view):
+    timings = []
+    for poll in polls:
+        start = time.perf_counter()
+        apply(poll)
+        app.processEvents()
+        view.viewport().repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def delta_path(app, records, search=None):
+    # Wired like LiveSportsApp: model -> filter proxy -> view painted by EventItemDelegate
+    favorites = {event.event_id for event in records[0][::7]}
+    model = hub.EventTableModel(favorites)
+    proxy = hub.EventFilterProxyModel()
+    proxy.setSourceModel(model)
+    view = QTableView()
+    view.setModel(proxy)
+    view.setItemDelegate(hub.EventItemDelegate(view))
+    view.resize(1200, 800)
+    view.show()
+
+    engine = core.EventDeltaEngine()
+    deltas = [engine.diff(events) for events in records]
+    model.apply_snapshot(deltas[0]["added"])
+    if search is not None:
+        proxy.set_favorites_first(True)
+        proxy.set_matches(model.search_index.search(search, hub.translator.tables.search_status))
+    app.processEvents()
+
+    def apply(delta):
+        model.apply_delta(delta)
+        if proxy.matches is not None:
+            # refresh_view re-runs the search so changed rows are matched against it
+            proxy.set_matches(model.search_index.search(search, hub.translator.tables.search_status))
+
+    elapsed = measure(app, apply, deltas[1:], view)
+    view.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--legacy-max", type=int, default=1000)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(42)
+    print(f"{'events':>8} {'legacy rebuild (ms)':>20} {'delta (ms)':>11} {'filtered (ms)':>14} {'speedup':>8}")
+    for size in SIZES:
+        snapshots = [make_events(size)]
+        for _ in range(POLLS):
+            snapshots.append(next_poll(snapshots[-1], rng))
+
+        legacy = None
+        if size <= args.legacy_max:
+            widget = QTableWidget()
+            widget.setColumnCount(len(hub.HEADER_KEYS))
+            widget.resize(1200, 800)
+            widget.show()
+            legacy_rebuild(widget, snapshots[0], set())
+            legacy = measure(app, lambda events: legacy_rebuild(widget, events, set()), snapshots[1:], widget)
+            widget.close()
+
+        # Records are built by the worker, so conversion stays outside the GUI-thread timing
+        records = [[core.Event.from_api(event) for event in events] for events in snapshots]
+        delta = delta_path(app, records)
+        filtered = delta_path(app, records, search="League 1")
+
+        if legacy is None:
+            print(f"{size:>8} {'-':>20} {delta:>11.2f} {filtered:>14.2f} {'-':>8}", flush=True)
+        else:
+            print(f"{size:>8} {legacy:>20.2f} {delta:>11.2f} {filtered:>14.2f} {legacy / delta:>7.1f}x", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Local stand-in for TheSportsDB's eventsday.php with latency and fault injection.
+
+Serves a generated day per sport (SyntheticDay), moving to a new data
+version every --tick seconds, or a recording made with --record,
+released at its recorded offsets. Point the app or the CLI at it with
+SPORTS_HUB_API_URL:
+
+    python benchmarks/fake_sportsdb.py --port 8765 --latency lognormal:120:0.6 --error-rate 0.1
+    SPORTS_HUB_API_URL=http://127.0.0.1:8765/api/v1/json/3 python live_sports_hub.py
+
+Latency specs are in milliseconds: const:MS, uniform:LO:HI, exp:MEAN and
+lognormal:MEDIAN:SIGMA. --storm PERIOD:LENGTH fails every request for
+LENGTH seconds out of every PERIOD. Failed 429/503 responses carry
+Retry-After when --retry-after is set, and --truncate-rate cuts bodies
+short of their Content-Length. Every 200 response carries X-Data-Version
+and X-Data-Produced (epoch seconds); GET /stats returns request counts.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+def latency_sampler(spec, rng):
+    # Returns a function giving one delay in seconds per call
+    kind, *params = spec.split(":")
+    params = [float(param) for param in params]
+    if kind == "const":
+        return lambda: params[0] / 1000
+    if kind == "uniform":
+        return lambda: rng.uniform(params[0], params[1]) / 1000
+    if kind == "exp":
+        return lambda: rng.expovariate(1 / params[0]) / 1000 if params[0] > 0 else 0.0
+    if kind == "lognormal":
+        return lambda: rng.lognormvariate(math.log(params[0]), params[1]) / 1000
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+class FaultProfile:
+    def __init__(self, latency="const:0", error_rate=0.0, error_codes=(500, 502, 503, 504), retry_after=None,
+                 truncate_rate=0.0, storm=None, storm_code=429, seed=None):
+        self.rng = random.Random(seed)
+        self.latency = latency_sampler(latency, self.rng)
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.retry_after = retry_after
+        self.truncate_rate = truncate_rate
+        self.storm = storm
+        self.storm_code = storm_code
+
+    def in_storm(self, elapsed):
+        if not self.storm:
+            return False
+        period, length = self.storm
+        return elapsed % period < length
+
+    def failure(self, elapsed):
+        if self.in_storm(elapsed):
+            return self.storm_code
+        if self.rng.random() < self.error_rate:
+            return self.rng.choice(self.error_codes)
+        return None
+
+
+class GeneratedDays:
+    # One SyntheticDay per sport, advanced a minute per tick
+    def __init__(self, events=200, leagues=10, seed=0, tick=10.0):
+        self.events = events
+        self.leagues = leagues
+        self.seed = seed
+        self.tick = tick
+        self.days = {}
+
+    def version(self, sport, league, elapsed):
+        return int(elapsed // self.tick)
+
+    def produced_at(self, sport, league, version):
+        return version * self.tick
+
+    def payload(self, sport, league, version):
+        entry = self.days.get(sport)
+        if entry is None:
+            entry = self.days[sport] = [core.SyntheticDay(self.events, self.leagues, sports=[sport], seed=self.seed), 0]
+        day, at = entry
+        if version > at:
+            day.advance(version - at)
+            entry[1] = version
+        events = day.payload()["events"]
+        if league:
+            events = [event for event in events if event["strLeague"] == league]
+        return {"events": events or None}
+
+
+class RecordedDays:
+    # Snapshots from a recording, released at their recorded offsets
+    def __init__(self, path):
+        self.feeds = {}
+        for offset, data in core.read_recording(path):
+            self.feeds.setdefault((data.get("sport"), data.get("league")), []).append(
+                (offset, core.export_snapshot(data)["events"]))
+
+    def version(self, sport, league, elapsed):
+        frames = self.feeds.get((sport, league), [])
+        return sum(1 for offset, _ in frames if offset <= elapsed) - 1
+
+    def produced_at(self, sport, league, version):
+        frames = self.feeds.get((sport, league), [])
+        return frames[version][0] if 0 <= version < len(frames) else 0.0
+
+    def payload(self, sport, league, version):
+        frames = self.feeds.get((sport, league), [])
+        return {"events": frames[version][1] if 0 <= version < len(frames) else None}
+
+
+class FakeSportsDB(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, source, profile):
+        super().__init__(address, Handler)
+        self.source = source
+        self.profile = profile
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self.bodies = {}
+
+    @property
+    def base_url(self):
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/api/v1/json/3"
+
+    def body(self, sport, league, version):
+        key = (sport, league, version)
+        with self.lock:
+            body = self.bodies.get(key)
+            if body is None:
+                body = json.dumps(self.source.payload(sport, league, version)).encode()
+                # Only the current version of each feed is ever asked for again
+                self.bodies = {k: v for k, v in self.bodies.items() if k[:2] != key[:2]}
+                self.bodies[key] = body
+        return body
+
+    def count(self, outcome):
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def snapshot_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, payload, headers=()):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        if url.path == "/stats":
+            self.send_json(200, server.snapshot_stats())
+            return
+        if not url.path.endswith("/eventsday.php"):
+            self.send_json(404, {"error": "not found"})
+            return
+
+        query = parse_qs(url.query)
+        sport = query.get("s", ["Soccer"])[0]
+        league = query.get("l", [None])[0]
+        elapsed = time.time() - server.started
+        time.sleep(max(server.profile.latency(), 0))
+
+        server.count("requests")
+        status = server.profile.failure(elapsed)
+        if status:
+            server.count(str(status))
+            headers = []
+            if server.profile.retry_after is not None and status in RETRY_AFTER_STATUSES:
+                headers.append(("Retry-After", str(server.profile.retry_after)))
+            self.send_json(status, {"error": "injected"}, headers)
+            return
+
+        version = server.source.version(sport, league, elapsed)
+        body = server.body(sport, league, version)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Data-Version", str(version))
+        self.send_header("X-Data-Produced", f"{server.started + server.source.produced_at(sport, league, version):.3f}")
+        self.end_headers()
+        if server.profile.rng.random() < server.profile.truncate_rate:
+            server.count("truncated")
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        server.count("200")
+        self.wfile.write(body)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Local TheSportsDB stand-in with fault injection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recording", help="serve a recording made with --record instead of generated days")
+    parser.add_argument("--events", type=int, default=200, help="generated events per sport")
+    parser.add_argument("--leagues", type=int, default=10, help="generated leagues per sport")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick", type=float, default=10.0, help="seconds between generated data versions")
+    parser.add_argument("--latency", default="const:0", help="const:MS, uniform:LO:HI, exp:MEAN or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-codes", default="500,502,503,504")
+    parser.add_argument("--retry-after", type=int, help="Retry-After seconds sent with 429/503")
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--storm", help="PERIOD:LENGTH seconds of every-request failures")
+    parser.add_argument("--storm-code", type=int, default=429)
+    return parser
+
+
+def profile_from_args(args):
+    return FaultProfile(args.latency, args.error_rate, [int(code) for code in args.error_codes.split(",") if code],
+                        args.retry_after, args.truncate_rate,
+                        tuple(float(part) for part in args.storm.split(":")) if args.storm else None,
+                        args.storm_code, args.seed)
+
+
+def main():
+    args = build_parser().parse_args()
+    if args.recording:
+        source = RecordedDays(args.recording)
+    else:
+        source = GeneratedDays(args.events, args.leagues, args.seed, args.tick)
+    server = FakeSportsDB((args.host, args.port), source, profile_from_args(args))
+    print(f"Serving {server.base_url}/eventsday.php", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.snapshot_stats()))
+
+
+if __name__ == "__main__":
+    main()
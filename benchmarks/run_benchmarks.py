@@ -0,0 +1,149 @@
+"""Core benchmark suite with machine-readable results.
+
+Every case runs against a seeded SyntheticDay at each --sizes event count:
+
+    enrich_events    API dicts -> Event records (FeedPoller.enrich_events)
+    cache_set        DatabaseManager.set_cache of a snapshot
+    cache_get        get_cache from SQLite with the in-memory tier disabled
+    json_roundtrip   json.dumps with encode_snapshot_item, then decode_snapshot
+    search           SearchIndex build plus three queries (skipped without PyQt6)
+    snapshot_diff    EventDeltaEngine.diff after the day advances one minute
+
+Results go to stdout (or --output) as JSON; the table goes to stderr.
+--compare exits non-zero when any case's median is more than --tolerance
+(and more than NOISE_MS) slower than in a previous results file.
+
+    python benchmarks/run_benchmarks.py [--sizes 100 1000 10000 100000] [--rounds 5] [--output results.json]
+    python benchmarks/run_benchmarks.py --compare baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+try:
+    from live_sports_hub import SearchIndex
+except ImportError:
+    SearchIndex = None
+
+SEED = 20
+LEAGUES = 40
+QUERIES = ("united", "league 3", "live")
+# Slowdowns smaller than this are timer noise at the 10^2 sizes
+NOISE_MS = 0.5
+
+
+def measure(fn, setup, rounds):
+    timings = []
+    for _ in range(rounds):
+        args = setup()
+        start = time.perf_counter()
+        fn(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(timings), 3), "min_ms": round(min(timings), 3), "rounds": rounds}
+
+
+def search(events):
+    index = SearchIndex()
+    for event in events:
+        index.add(event)
+    for query in QUERIES:
+        index.search(query)
+
+
+def json_roundtrip(data):
+    core.decode_snapshot(json.loads(json.dumps(data, default=core.encode_snapshot_item)))
+
+
+def diff(engine, events):
+    engine.diff(events)
+
+
+def cases(size, tmp):
+    day = core.SyntheticDay(size, LEAGUES, seed=SEED)
+    payload = day.payload()["events"]
+    snapshot = day.snapshot()
+    day.advance(1)
+    next_minute = day.snapshot()["events"]
+    poller = core.FeedPoller(feeds=[])
+    db = core.DatabaseManager(os.path.join(tmp, f"bench_{size}.db"), cache_entries=0)
+    db.set_cache("bench", snapshot, core.encode_snapshot_item)
+
+    def diff_setup():
+        engine = core.EventDeltaEngine()
+        engine.diff(snapshot["events"])
+        return engine, next_minute
+
+    yield "enrich_events", poller.enrich_events, lambda: (payload,)
+    yield "cache_set", lambda data: db.set_cache("bench", data, core.encode_snapshot_item), lambda: (snapshot,)
+    yield "cache_get", lambda: db.get_cache("bench", max_age=float("inf"), decoder=core.decode_snapshot), tuple
+    yield "json_roundtrip", json_roundtrip, lambda: (snapshot,)
+    if SearchIndex is not None:
+        yield "search", search, lambda: (snapshot["events"],)
+    yield "snapshot_diff", diff, diff_setup
+    db.close()
+
+
+def compare(results, path, tolerance):
+    with open(path) as f:
+        baseline = {(row["case"], row["events"]): row["median_ms"] for row in json.load(f)["results"]}
+    regressions = []
+    for row in results:
+        before = baseline.get((row["case"], row["events"]))
+        if before and row["median_ms"] > before * (1 + tolerance) and row["median_ms"] - before > NOISE_MS:
+            regressions.append(f"{row['case']} @ {row['events']}: {before:.2f} -> {row['median_ms']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", help="write results JSON here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON from a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'case':>15} {'events':>7} {'median ms':>10} {'min ms':>9}", file=sys.stderr)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            for name, fn, setup in cases(size, tmp):
+                row = dict(case=name, events=size, **measure(fn, setup, args.rounds))
+                results.append(row)
+                print(f"{name:>15} {size:>7} {row['median_ms']:>10.2f} {row['min_ms']:>9.2f}", file=sys.stderr, flush=True)
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "leagues": LEAGUES,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
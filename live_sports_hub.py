@@ -1,46 +1,45 @@
 import sys
-import json
-import threading
+
+if __name__ == "__main__" and sys.argv[1:2]:
+    # Headless subcommands run from the core without importing Qt at all
+    import sports_core
+    if sys.argv[1] in sports_core.COMMANDS:
+        sys.exit(sports_core.main(sys.argv[1:]))
+
+import gc
 import time
+import sqlite3
+import threading
+import unicodedata
+from collections import namedtuple, deque
 from datetime import datetime
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
-    QLabel, QComboBox, QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QFrame, QGridLayout, QScrollArea, QSpacerItem,
-    QSizePolicy, QProgressBar, QGroupBox, QRadioButton, QButtonGroup,
-    QCheckBox, QStackedLayout, QFormLayout, QLineEdit, QSpinBox,
-    QTabWidget, QTextEdit, QSplitter, QMenuBar, QStatusBar,
-    QDialog, QInputDialog, QMessageBox, QFileDialog, QProgressDialog,
-    QSystemTrayIcon, QStyle
+    QLabel, QComboBox, QPushButton, QTableView, QAbstractItemView,
+    QHeaderView, QFrame, QGridLayout, QCheckBox, QStackedLayout, QLineEdit,
+    QMessageBox, QFileDialog, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QDockWidget,
+    QPlainTextEdit, QDialog, QDialogButtonBox, QDateTimeEdit, QFormLayout
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QThread, pyqtSignal, QTranslator, QLocale, QLibraryInfo,
-    QPropertyAnimation, QEasingCurve, QRect, QUrl, QEvent, QObject,
-    QMimeData, QDateTime, QTimeZone, QParallelAnimationGroup, QSettings,
-    QStandardPaths, QPointF
+    Qt, QTimer, QThread, pyqtSignal, QRect, QEvent, QStandardPaths, QPoint, QPointF, QSize,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QDateTime
 )
 from PyQt6.QtGui import (
-    QFont, QPixmap, QIcon, QPalette, QColor, QLinearGradient,
-    QBrush, QPainter, QFontDatabase, QEnterEvent, QMouseEvent,
-    QClipboard, QShortcut, QDesktopServices, QValidator,
+    QFont, QPixmap, QIcon, QIconEngine, QPixmapCache, QPalette, QColor, QLinearGradient,
+    QBrush, QPainter, QFontMetrics, QFontDatabase,
     QAction, QKeySequence  # QAction و QKeySequence در QtGui هستند
 )
-from PyQt6.QtMultimedia import QSoundEffect
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import os
 import logging
-import hashlib
-import sqlite3
-import uuid
-import webbrowser
 import platform
-import subprocess
-import shutil
-import zipfile
-import tempfile
+from sports_core import (
+    SPORT_MAPPING, EventStatus, decode_snapshot, tag_snapshot, DatabaseManager,
+    FavoritesStore, FAVORITES_FLUSH_MS, HistoryStore, format_interval, FeedState, FeedPoller,
+    SnapshotRecorder, ReplaySource, latency_summary, metrics, add_metrics_arguments, start_metrics_exporter,
+    ExportCancelled, EXPORT_EVENT_FIELDS, EXPORT_HISTORY_FIELDS, snapshot_export, history_export, write_export,
+    read_import, FeedSubscriber, FanoutServer, parse_address
+)
 
 # ====================== Global App Instance (Fixed QPixmap Error) ======================
 app = None
@@ -55,7 +54,7 @@ def create_placeholder_pixmap(size=64, color=QColor("#0078D4"), shape="circle"):
         painter.setBrush(color)
         painter.setPen(QColor("white"))
         painter.drawEllipse(4, 4, size-8, size-8)
-    elif shape == "star":
+    elif shape.startswith("star"):
         painter.setBrush(color if "filled" in shape else Qt.GlobalColor.transparent)
         painter.setPen(color)
         points = [
@@ -72,38 +71,66 @@ def create_placeholder_pixmap(size=64, color=QColor("#0078D4"), shape="circle"):
     painter.end()
     return pixmap
 
-def ensure_icons():
-    icons_dir = "icons"
-    os.makedirs(icons_dir, exist_ok=True)
-    
-    icons = {
-        "app_icon.png": (64, "#0078D4", "circle"),
-        "soccer_ball.png": (64, "#FFFFFF", "circle"),
-        "star.png": (32, "#FFD700", "star"),
-        "star_filled.png": (32, "#FFD700", "star_filled"),
-        "down_arrow.png": (24, "#0078D4", "arrow"),
-        "filter.png": (24, "#0078D4", "arrow"),
-        "refresh.png": (24, "#0078D4", "arrow"),
-        "settings.png": (24, "#0078D4", "circle"),
-        "notification.png": (24, "#FF6B6B", "circle")
-    }
-    
-    for name, (size, color_str, shape) in icons.items():
-        path = os.path.join(icons_dir, name)
-        if not os.path.exists(path):
-            color = QColor(color_str)
-            pixmap = create_placeholder_pixmap(size, color, shape)
-            pixmap.save(path)
+ICON_SPECS = {
+    "app_icon": ("#0078D4", "circle"),
+    "soccer_ball": ("#FFFFFF", "circle"),
+    "star": ("#FFD700", "star"),
+    "star_filled": ("#FFD700", "star_filled"),
+    "down_arrow": ("#0078D4", "arrow"),
+    "filter": ("#0078D4", "arrow"),
+    "refresh": ("#0078D4", "arrow"),
+    "settings": ("#0078D4", "circle"),
+    "notification": ("#FF6B6B", "circle")
+}
+
+class IconRegistry:
+    def __init__(self):
+        self.pixmaps = {}
+        self.icons = {}
+
+    def pixmap(self, name, size, dpr=1.0):
+        # Rendered once per logical size and device pixel ratio, then shared by every caller
+        key = (name, size, dpr)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            color, shape = ICON_SPECS[name]
+            pixmap = create_placeholder_pixmap(round(size * dpr), QColor(color), shape)
+            pixmap.setDevicePixelRatio(dpr)
+            self.pixmaps[key] = pixmap
+        return pixmap
+
+    def icon(self, name):
+        icon = self.icons.get(name)
+        if icon is None:
+            icon = self.icons[name] = QIcon(RegistryIconEngine(self, name))
+        return icon
+
+class RegistryIconEngine(QIconEngine):
+    def __init__(self, registry, name):
+        super().__init__()
+        self.registry = registry
+        self.name = name
+
+    def pixmap(self, size, mode, state):
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        return self.registry.pixmap(self.name, max(size.width(), size.height()), scale)
+
+    def paint(self, painter, rect, mode, state):
+        pixmap = self.registry.pixmap(self.name, max(rect.width(), rect.height()), painter.device().devicePixelRatioF())
+        painter.drawPixmap(rect, pixmap)
+
+    def clone(self):
+        return RegistryIconEngine(self.registry, self.name)
+
+icon_registry = IconRegistry()
 
 # ====================== Configuration & Constants ======================
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-API_BASE_URL = "https://www.thesportsdb.com/api/v1/json/3"
-UPDATE_INTERVAL = 5000
 ANIMATION_DURATION = 300
-MAX_RETRIES = 5
-CACHE_DURATION = 60
 
 LANGUAGES = {
     "en": {"name": "English", "flag": "us", "direction": Qt.LayoutDirection.LeftToRight},
@@ -112,694 +139,837 @@ LANGUAGES = {
     "ru": {"name": "Русский", "flag": "ru", "direction": Qt.LayoutDirection.LeftToRight}
 }
 
-SPORT_MAPPING = {
-    "football": {"api": "Soccer", "icon": "soccer_ball.png"},
-    "basketball": {"api": "Basketball", "icon": "basketball"},
-    "tennis": {"api": "Tennis", "icon": "tennis"},
-    "volleyball": {"api": "Volleyball", "icon": "volleyball"},
-    "handball": {"api": "Handball", "icon": "handball"}
-}
+def app_db_path():
+    try:
+        config_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        os.makedirs(config_dir, exist_ok=True)
+        return os.path.join(config_dir, "sports_hub.db")
+    except:
+        return "sports_hub.db"
 
 # ====================== Translation System ======================
+def pack_en():
+    return {
+        "app_name": "Live Sports Hub",
+        "title": "Live Sports Scores",
+        "subtitle": "Real-time updates from around the world",
+        "select_sport": "Select Sport",
+        "select_league": "Select League",
+        "refresh": "Refresh Now",
+        "auto_update": "Auto Update (5s)",
+        "favorites_first": "Favorites First",
+        "language": "Language",
+        "theme": "Theme",
+        "light": "Light",
+        "dark": "Dark",
+        "system": "System",
+        "red": "Red Alert",
+        "blue": "Ocean Blue",
+        "loading": "Loading live scores...",
+        "no_data": "No live matches available at the moment.",
+        "vs": "vs",
+        "live": "LIVE",
+        "ft": "FULL TIME",
+        "ht": "HALF TIME",
+        "postponed": "POSTPONED",
+        "cancelled": "CANCELLED",
+        "football": "Football",
+        "basketball": "Basketball",
+        "tennis": "Tennis",
+        "volleyball": "Volleyball",
+        "handball": "Handball",
+        "status": "Status",
+        "home": "Home",
+        "away": "Away",
+        "score": "Score",
+        "time": "Time",
+        "league": "League",
+        "update_time": "Updated",
+        "poll_interval": "Refresh every {interval}",
+        "error_api": "API Error: Unable to fetch data.",
+        "network_error": "Network Error. Retrying...",
+        "settings": "Settings",
+        "about": "About",
+        "exit": "Exit",
+        "version": "Version",
+        "developer": "Developed by",
+        "source": "Source Code",
+        "website": "Website",
+        "donate": "Support Project",
+        "search": "Search matches...",
+        "filter": "Filter",
+        "all_leagues": "All Leagues",
+        "favorite": "Add to Favorites",
+        "unfavorite": "Remove from Favorites",
+        "notification": "Enable Notifications",
+        "sound": "Play Sound on Goal",
+        "fullscreen": "Toggle Fullscreen",
+        "minimize": "Minimize to Tray",
+        "statistics": "Statistics",
+        "goals": "Goals",
+        "yellow_cards": "Yellow Cards",
+        "red_cards": "Red Cards",
+        "corners": "Corners",
+        "possession": "Possession",
+        "shots": "Shots",
+        "shots_on_target": "On Target",
+        "fouls": "Fouls",
+        "offside": "Offside",
+        "saves": "Saves",
+        "team_form": "Form",
+        "last_matches": "Last 5 Matches",
+        "win": "W",
+        "draw": "D",
+        "loss": "L",
+        "points": "Pts",
+        "position": "Pos",
+        "played": "P",
+        "goal_difference": "GD",
+        "export": "Export Data",
+        "import": "Import Data",
+        "export_history": "Export History",
+        "export_progress": "Exporting: {progress}%",
+        "export_done": "Exported {rows} rows",
+        "export_failed": "Export failed",
+        "history_from": "From",
+        "history_to": "To",
+        "import_progress": "Importing: {count} events",
+        "import_done": "Imported {count} events",
+        "import_failed": "Import failed",
+        "backup": "Create Backup",
+        "restore": "Restore Backup",
+        "clear_cache": "Clear Cache",
+        "debug_mode": "Debug Mode",
+        "api_key": "API Key",
+        "save": "Save",
+        "cancel": "Cancel",
+        "close": "Close",
+        "yes": "Yes",
+        "no": "No",
+        "ok": "OK",
+        "apply": "Apply",
+        "reset": "Reset",
+        "default": "Default",
+        "advanced": "Advanced",
+        "proxy": "Proxy Settings",
+        "timeout": "Timeout (s)",
+        "retries": "Retries",
+        "user_agent": "User Agent",
+        "headers": "Custom Headers",
+        "logs": "View Logs",
+        "update_available": "Update Available!",
+        "download": "Download",
+        "later": "Later",
+        "install": "Install Now",
+        "changelog": "View Changelog",
+        "checking_updates": "Checking for updates...",
+        "up_to_date": "You are using the latest version.",
+        "error_update": "Failed to check for updates.",
+        "new_version": "New version {version} is available!",
+        "current_version": "Current: {current}",
+        "latest_version": "Latest: {latest}",
+        "release_date": "Released: {date}",
+        "size": "Size: {size}",
+        "download_progress": "Downloading: {progress}%",
+        "installing": "Installing update...",
+        "restart_required": "Restart required to apply update.",
+        "restart": "Restart Now"
+    }
+
+def pack_fa():
+    return {
+        "app_name": "مرکز نتایج زنده ورزشی",
+        "title": "نتایج زنده ورزشی",
+        "subtitle": "به‌روزرسانی لحظه‌ای از سراسر جهان",
+        "select_sport": "انتخاب ورزش",
+        "select_league": "انتخاب لیگ",
+        "refresh": "به‌روزرسانی فوری",
+        "auto_update": "به‌روزرسانی خودکار (۵ث)",
+        "favorites_first": "اول علاقه‌مندی‌ها",
+        "language": "زبان",
+        "theme": "تم",
+        "light": "روشن",
+        "dark": "تیره",
+        "system": "سیستم",
+        "red": "هشدار قرمز",
+        "blue": "آبی اقیانوسی",
+        "loading": "در حال بارگذاری نتایج زنده...",
+        "no_data": "در حال حاضر هیچ مسابقه زنده‌ای وجود ندارد.",
+        "vs": "در مقابل",
+        "live": "زنده",
+        "ft": "پایان بازی",
+        "ht": "نیمه اول",
+        "postponed": "تعویق افتاده",
+        "cancelled": "لغو شده",
+        "football": "فوتبال",
+        "basketball": "بسکتبال",
+        "tennis": "تنیس",
+        "volleyball": "والیبال",
+        "handball": "هندبال",
+        "status": "وضعیت",
+        "home": "میزبان",
+        "away": "میهمان",
+        "score": "امتیاز",
+        "time": "زمان",
+        "league": "لیگ",
+        "update_time": "به‌روزرسانی",
+        "poll_interval": "به‌روزرسانی هر {interval}",
+        "error_api": "خطای API: دریافت اطلاعات ممکن نیست.",
+        "network_error": "خطای شبکه. در حال تلاش مجدد...",
+        "settings": "تنظیمات",
+        "about": "درباره",
+        "exit": "خروج",
+        "version": "نسخه",
+        "developer": "توسعه‌دهنده",
+        "source": "کد منبع",
+        "website": "وب‌سایت",
+        "donate": "حمایت از پروژه",
+        "search": "جستجوی مسابقات...",
+        "filter": "فیلتر",
+        "all_leagues": "همه لیگ‌ها",
+        "favorite": "اضافه به علاقه‌مندی‌ها",
+        "unfavorite": "حذف از علاقه‌مندی‌ها",
+        "notification": "فعال‌سازی اعلان‌ها",
+        "sound": "صدا هنگام گل",
+        "fullscreen": "تمام‌صفحه",
+        "minimize": "کوچک کردن به سینی",
+        "statistics": "آمار",
+        "goals": "گل‌ها",
+        "yellow_cards": "کارت زرد",
+        "red_cards": "کارت قرمز",
+        "corners": "کرنر",
+        "possession": "مالکیت توپ",
+        "shots": "شوت",
+        "shots_on_target": "شوت در چارچوب",
+        "fouls": "خطا",
+        "offside": "آفساید",
+        "saves": "دفاع",
+        "team_form": "فرم",
+        "last_matches": "۵ بازی آخر",
+        "win": "ب",
+        "draw": "م",
+        "loss": "ش",
+        "points": "ا",
+        "position": "رتبه",
+        "played": "بازی",
+        "goal_difference": "تفاضل",
+        "export": "خروجی داده",
+        "import": "ورودی داده",
+        "export_history": "خروجی تاریخچه",
+        "export_progress": "در حال خروجی: {progress}%",
+        "export_done": "{rows} ردیف خروجی گرفته شد",
+        "export_failed": "خروجی ناموفق بود",
+        "history_from": "از",
+        "history_to": "تا",
+        "import_progress": "در حال ورود: {count} رویداد",
+        "import_done": "{count} رویداد وارد شد",
+        "import_failed": "ورود ناموفق بود",
+        "backup": "تهیه پشتیبان",
+        "restore": "بازیابی پشتیبان",
+        "clear_cache": "پاک کردن حافظه موقت",
+        "debug_mode": "حالت دیباگ",
+        "api_key": "کلید API",
+        "save": "ذخیره",
+        "cancel": "انصراف",
+        "close": "بستن",
+        "yes": "بله",
+        "no": "خیر",
+        "ok": "تایید",
+        "apply": "اعمال",
+        "reset": "بازنشانی",
+        "default": "پیش‌فرض",
+        "advanced": "پیشرفته",
+        "proxy": "تنظیمات پراکسی",
+        "timeout": "تایم‌اوت (ثانیه)",
+        "retries": "تلاش مجدد",
+        "user_agent": "عامل کاربری",
+        "headers": "هدرهای سفارشی",
+        "logs": "مشاهده لاگ‌ها",
+        "update_available": "به‌روزرسانی موجود است!",
+        "download": "دانلود",
+        "later": "بعداً",
+        "install": "نصب اکنون",
+        "changelog": "تغییرات",
+        "checking_updates": "در حال بررسی به‌روزرسانی...",
+        "up_to_date": "شما از آخرین نسخه استفاده می‌کنید.",
+        "error_update": "خطا در بررسی به‌روزرسانی.",
+        "new_version": "نسخه جدید {version} موجود است!",
+        "current_version": "نسخه فعلی: {current}",
+        "latest_version": "آخرین نسخه: {latest}",
+        "release_date": "انتشار: {date}",
+        "size": "حجم: {size}",
+        "download_progress": "در حال دانلود: {progress}%",
+        "installing": "در حال نصب به‌روزرسانی...",
+        "restart_required": "برای اعمال به‌روزرسانی نیاز به ری‌استارت است.",
+        "restart": "ری‌استارت اکنون"
+    }
+
+def pack_zh():
+    return {
+        "app_name": "实时体育中心",
+        "title": "实时体育比分",
+        "subtitle": "全球实时更新",
+        "select_sport": "选择运动",
+        "select_league": "选择联赛",
+        "refresh": "立即刷新",
+        "auto_update": "自动更新 (5秒)",
+        "favorites_first": "收藏优先",
+        "language": "语言",
+        "theme": "主题",
+        "light": "明亮",
+        "dark": "暗黑",
+        "system": "系统",
+        "red": "红色警报",
+        "blue": "海洋蓝",
+        "loading": "正在加载实时比分...",
+        "no_data": "当前无进行中的比赛。",
+        "vs": "对",
+        "live": "直播",
+        "ft": "完场",
+        "ht": "中场",
+        "postponed": "延期",
+        "cancelled": "取消",
+        "football": "足球",
+        "basketball": "篮球",
+        "tennis": "网球",
+        "volleyball": "排球",
+        "handball": "手球",
+        "status": "状态",
+        "home": "主队",
+        "away": "客队",
+        "score": "比分",
+        "time": "时间",
+        "league": "联赛",
+        "update_time": "更新于",
+        "poll_interval": "每 {interval} 刷新",
+        "error_api": "API 错误：无法获取数据。",
+        "network_error": "网络错误。正在重试...",
+        "settings": "设置",
+        "about": "关于",
+        "exit": "退出",
+        "version": "版本",
+        "developer": "开发者",
+        "source": "源代码",
+        "website": "官方网站",
+        "donate": "支持项目",
+        "search": "搜索比赛...",
+        "filter": "筛选",
+        "all_leagues": "所有联赛",
+        "favorite": "加入收藏",
+        "unfavorite": "移除收藏",
+        "notification": "启用通知",
+        "sound": "进球声音",
+        "fullscreen": "全屏模式",
+        "minimize": "最小化到托盘",
+        "statistics": "统计",
+        "goals": "进球",
+        "yellow_cards": "黄牌",
+        "red_cards": "红牌",
+        "corners": "角球",
+        "possession": "控球率",
+        "shots": "射门",
+        "shots_on_target": "射正",
+        "fouls": "犯规",
+        "offside": "越位",
+        "saves": "扑救",
+        "team_form": "状态",
+        "last_matches": "近5场",
+        "win": "胜",
+        "draw": "平",
+        "loss": "负",
+        "points": "积分",
+        "position": "排名",
+        "played": "场",
+        "goal_difference": "净胜",
+        "export": "导出数据",
+        "import": "导入数据",
+        "export_history": "导出历史",
+        "export_progress": "导出中: {progress}%",
+        "export_done": "已导出 {rows} 行",
+        "export_failed": "导出失败",
+        "history_from": "从",
+        "history_to": "到",
+        "import_progress": "导入中: {count} 场比赛",
+        "import_done": "已导入 {count} 场比赛",
+        "import_failed": "导入失败",
+        "backup": "创建备份",
+        "restore": "恢复备份",
+        "clear_cache": "清除缓存",
+        "debug_mode": "调试模式",
+        "api_key": "API 密钥",
+        "save": "保存",
+        "cancel": "取消",
+        "close": "关闭",
+        "yes": "是",
+        "no": "否",
+        "ok": "确定",
+        "apply": "应用",
+        "reset": "重置",
+        "default": "默认",
+        "advanced": "高级",
+        "proxy": "代理设置",
+        "timeout": "超时(秒)",
+        "retries": "重试次数",
+        "user_agent": "用户代理",
+        "headers": "自定义请求头",
+        "logs": "查看日志",
+        "update_available": "有可用更新！",
+        "download": "下载",
+        "later": "稍后",
+        "install": "立即安装",
+        "changelog": "更新日志",
+        "checking_updates": "正在检查更新...",
+        "up_to_date": "您使用的是最新版本。",
+        "error_update": "检查更新失败。",
+        "new_version": "新版本 {version} 已发布！",
+        "current_version": "当前版本: {current}",
+        "latest_version": "最新版本: {latest}",
+        "release_date": "发布日期: {date}",
+        "size": "大小: {size}",
+        "download_progress": "下载中: {progress}%",
+        "installing": "正在安装更新...",
+        "restart_required": "需要重启以应用更新。",
+        "restart": "立即重启"
+    }
+
+def pack_ru():
+    return {
+        "app_name": "Центр живых спортивных результатов",
+        "title": "Живые спортивные результаты",
+        "subtitle": "Мгновенные обновления со всего мира",
+        "select_sport": "Выбрать вид спорта",
+        "select_league": "Выбрать лигу",
+        "refresh": "Обновить сейчас",
+        "auto_update": "Автообновление (5с)",
+        "favorites_first": "Сначала избранное",
+        "language": "Язык",
+        "theme": "Тема",
+        "light": "Светлая",
+        "dark": "Тёмная",
+        "system": "Системная",
+        "red": "Красная тревога",
+        "blue": "Океанский синий",
+        "loading": "Загрузка живых результатов...",
+        "no_data": "В данный момент нет живых матчей.",
+        "vs": "против",
+        "live": "Прямая",
+        "ft": "Финал",
+        "ht": "Перерыв",
+        "postponed": "Отложено",
+        "cancelled": "Отменено",
+        "football": "Футбол",
+        "basketball": "Баскетбол",
+        "tennis": "Теннис",
+        "volleyball": "Волейбол",
+        "handball": "Гандбол",
+        "status": "Статус",
+        "home": "Дом",
+        "away": "Гости",
+        "score": "Счёт",
+        "time": "Время",
+        "league": "Лига",
+        "update_time": "Обновлено",
+        "poll_interval": "Обновление каждые {interval}",
+        "error_api": "Ошибка API: не удалось получить данные.",
+        "network_error": "Ошибка сети. Повторная попытка...",
+        "settings": "Настройки",
+        "about": "О программе",
+        "exit": "Выход",
+        "version": "Версия",
+        "developer": "Разработчик",
+        "source": "Исходный код",
+        "website": "Веб-сайт",
+        "donate": "Поддержать проект",
+        "search": "Поиск матчей...",
+        "filter": "Фильтр",
+        "all_leagues": "Все лиги",
+        "favorite": "Добавить в избранное",
+        "unfavorite": "Убрать из избранного",
+        "notification": "Включить уведомления",
+        "sound": "Звук при голе",
+        "fullscreen": "Полный экран",
+        "minimize": "Свернуть в трей",
+        "statistics": "Статистика",
+        "goals": "Голы",
+        "yellow_cards": "Жёлтые карточки",
+        "red_cards": "Красные карточки",
+        "corners": "Угловые",
+        "possession": "Владение мячом",
+        "shots": "Удары",
+        "shots_on_target": "Удары в створ",
+        "fouls": "Фолы",
+        "offside": "Офсайд",
+        "saves": "Сейвы",
+        "team_form": "Форма",
+        "last_matches": "Последние 5 матчей",
+        "win": "П",
+        "draw": "Н",
+        "loss": "Пор",
+        "points": "Очки",
+        "position": "Поз",
+        "played": "И",
+        "goal_difference": "Разн",
+        "export": "Экспорт данных",
+        "import": "Импорт данных",
+        "export_history": "Экспорт истории",
+        "export_progress": "Экспорт: {progress}%",
+        "export_done": "Экспортировано строк: {rows}",
+        "export_failed": "Ошибка экспорта",
+        "history_from": "С",
+        "history_to": "По",
+        "import_progress": "Импорт: {count} событий",
+        "import_done": "Импортировано событий: {count}",
+        "import_failed": "Ошибка импорта",
+        "backup": "Создать резервную копию",
+        "restore": "Восстановить из копии",
+        "clear_cache": "Очистить кэш",
+        "debug_mode": "Режим отладки",
+        "api_key": "Ключ API",
+        "save": "Сохранить",
+        "cancel": "Отмена",
+        "close": "Закрыть",
+        "yes": "Да",
+        "no": "Нет",
+        "ok": "ОК",
+        "apply": "Применить",
+        "reset": "Сбросить",
+        "default": "По умолчанию",
+        "advanced": "Дополнительно",
+        "proxy": "Настройки прокси",
+        "timeout": "Таймаут (сек)",
+        "retries": "Попытки",
+        "user_agent": "User Agent",
+        "headers": "Пользовательские заголовки",
+        "logs": "Просмотр логов",
+        "update_available": "Доступно обновление!",
+        "download": "Скачать",
+        "later": "Позже",
+        "install": "Установить сейчас",
+        "changelog": "Список изменений",
+        "checking_updates": "Проверка обновлений...",
+        "up_to_date": "У вас последняя версия.",
+        "error_update": "Ошибка проверки обновлений.",
+        "new_version": "Доступна новая версия {version}!",
+        "current_version": "Текущая: {current}",
+        "latest_version": "Последняя: {latest}",
+        "release_date": "Дата: {date}",
+        "size": "Размер: {size}",
+        "download_progress": "Загрузка: {progress}%",
+        "installing": "Установка обновления...",
+        "restart_required": "Требуется перезапуск.",
+        "restart": "Перезапустить сейчас"
+    }
+
+LANGUAGE_PACKS = {"en": pack_en, "fa": pack_fa, "zh": pack_zh, "ru": pack_ru}
+DisplayTables = namedtuple("DisplayTables", ("status", "search_status", "headers", "sports"))
+FORMAT_CACHE_SIZE = 256
+
+def build_display_tables(tr):
+    # Everything the table and combos look up per row or per poll, resolved once per language
+    status = MappingProxyType({status: tr(key) for status, key in STATUS_KEYS.items()})
+    return DisplayTables(
+        status=status,
+        search_status=MappingProxyType({status: normalize_search_text(label) for status, label in status.items()}),
+        headers=tuple(tr(key) for key in HEADER_KEYS),
+        sports=MappingProxyType({info["api"]: tr(sport) for sport, info in SPORT_MAPPING.items()})
+    )
+
 class Translator:
     def __init__(self):
-        self.translations = self.load_translations()
         self.current_lang = "en"
+        self.strings = None
+        self.display_tables = None
+        self.formatted = {}
 
-    def load_translations(self):
-        return {
-            "en": {
-                "app_name": "Live Sports Hub",
-                "title": "Live Sports Scores",
-                "subtitle": "Real-time updates from around the world",
-                "select_sport": "Select Sport",
-                "select_league": "Select League",
-                "refresh": "Refresh Now",
-                "auto_update": "Auto Update (5s)",
-                "language": "Language",
-                "theme": "Theme",
-                "light": "Light",
-                "dark": "Dark",
-                "system": "System",
-                "red": "Red Alert",
-                "blue": "Ocean Blue",
-                "loading": "Loading live scores...",
-                "no_data": "No live matches available at the moment.",
-                "vs": "vs",
-                "live": "LIVE",
-                "ft": "FULL TIME",
-                "ht": "HALF TIME",
-                "postponed": "POSTPONED",
-                "cancelled": "CANCELLED",
-                "football": "Football",
-                "basketball": "Basketball",
-                "tennis": "Tennis",
-                "volleyball": "Volleyball",
-                "handball": "Handball",
-                "status": "Status",
-                "home": "Home",
-                "away": "Away",
-                "score": "Score",
-                "time": "Time",
-                "league": "League",
-                "update_time": "Updated",
-                "error_api": "API Error: Unable to fetch data.",
-                "network_error": "Network Error. Retrying...",
-                "settings": "Settings",
-                "about": "About",
-                "exit": "Exit",
-                "version": "Version",
-                "developer": "Developed by",
-                "source": "Source Code",
-                "website": "Website",
-                "donate": "Support Project",
-                "search": "Search matches...",
-                "filter": "Filter",
-                "all_leagues": "All Leagues",
-                "favorite": "Add to Favorites",
-                "unfavorite": "Remove from Favorites",
-                "notification": "Enable Notifications",
-                "sound": "Play Sound on Goal",
-                "fullscreen": "Toggle Fullscreen",
-                "minimize": "Minimize to Tray",
-                "statistics": "Statistics",
-                "goals": "Goals",
-                "yellow_cards": "Yellow Cards",
-                "red_cards": "Red Cards",
-                "corners": "Corners",
-                "possession": "Possession",
-                "shots": "Shots",
-                "shots_on_target": "On Target",
-                "fouls": "Fouls",
-                "offside": "Offside",
-                "saves": "Saves",
-                "team_form": "Form",
-                "last_matches": "Last 5 Matches",
-                "win": "W",
-                "draw": "D",
-                "loss": "L",
-                "points": "Pts",
-                "position": "Pos",
-                "played": "P",
-                "goal_difference": "GD",
-                "export": "Export Data",
-                "import": "Import Data",
-                "backup": "Create Backup",
-                "restore": "Restore Backup",
-                "clear_cache": "Clear Cache",
-                "debug_mode": "Debug Mode",
-                "api_key": "API Key",
-                "save": "Save",
-                "cancel": "Cancel",
-                "close": "Close",
-                "yes": "Yes",
-                "no": "No",
-                "ok": "OK",
-                "apply": "Apply",
-                "reset": "Reset",
-                "default": "Default",
-                "advanced": "Advanced",
-                "proxy": "Proxy Settings",
-                "timeout": "Timeout (s)",
-                "retries": "Retries",
-                "user_agent": "User Agent",
-                "headers": "Custom Headers",
-                "logs": "View Logs",
-                "update_available": "Update Available!",
-                "download": "Download",
-                "later": "Later",
-                "install": "Install Now",
-                "changelog": "View Changelog",
-                "checking_updates": "Checking for updates...",
-                "up_to_date": "You are using the latest version.",
-                "error_update": "Failed to check for updates.",
-                "new_version": "New version {version} is available!",
-                "current_version": "Current: {current}",
-                "latest_version": "Latest: {latest}",
-                "release_date": "Released: {date}",
-                "size": "Size: {size}",
-                "download_progress": "Downloading: {progress}%",
-                "installing": "Installing update...",
-                "restart_required": "Restart required to apply update.",
-                "restart": "Restart Now"
-            },
-            "fa": {
-                "app_name": "مرکز نتایج زنده ورزشی",
-                "title": "نتایج زنده ورزشی",
-                "subtitle": "به‌روزرسانی لحظه‌ای از سراسر جهان",
-                "select_sport": "انتخاب ورزش",
-                "select_league": "انتخاب لیگ",
-                "refresh": "به‌روزرسانی فوری",
-                "auto_update": "به‌روزرسانی خودکار (۵ث)",
-                "language": "زبان",
-                "theme": "تم",
-                "light": "روشن",
-                "dark": "تیره",
-                "system": "سیستم",
-                "red": "هشدار قرمز",
-                "blue": "آبی اقیانوسی",
-                "loading": "در حال بارگذاری نتایج زنده...",
-                "no_data": "در حال حاضر هیچ مسابقه زنده‌ای وجود ندارد.",
-                "vs": "در مقابل",
-                "live": "زنده",
-                "ft": "پایان بازی",
-                "ht": "نیمه اول",
-                "postponed": "تعویق افتاده",
-                "cancelled": "لغو شده",
-                "football": "فوتبال",
-                "basketball": "بسکتبال",
-                "tennis": "تنیس",
-                "volleyball": "والیبال",
-                "handball": "هندبال",
-                "status": "وضعیت",
-                "home": "میزبان",
-                "away": "میهمان",
-                "score": "امتیاز",
-                "time": "زمان",
-                "league": "لیگ",
-                "update_time": "به‌روزرسانی",
-                "error_api": "خطای API: دریافت اطلاعات ممکن نیست.",
-                "network_error": "خطای شبکه. در حال تلاش مجدد...",
-                "settings": "تنظیمات",
-                "about": "درباره",
-                "exit": "خروج",
-                "version": "نسخه",
-                "developer": "توسعه‌دهنده",
-                "source": "کد منبع",
-                "website": "وب‌سایت",
-                "donate": "حمایت از پروژه",
-                "search": "جستجوی مسابقات...",
-                "filter": "فیلتر",
-                "all_leagues": "همه لیگ‌ها",
-                "favorite": "اضافه به علاقه‌مندی‌ها",
-                "unfavorite": "حذف از علاقه‌مندی‌ها",
-                "notification": "فعال‌سازی اعلان‌ها",
-                "sound": "صدا هنگام گل",
-                "fullscreen": "تمام‌صفحه",
-                "minimize": "کوچک کردن به سینی",
-                "statistics": "آمار",
-                "goals": "گل‌ها",
-                "yellow_cards": "کارت زرد",
-                "red_cards": "کارت قرمز",
-                "corners": "کرنر",
-                "possession": "مالکیت توپ",
-                "shots": "شوت",
-                "shots_on_target": "شوت در چارچوب",
-                "fouls": "خطا",
-                "offside": "آفساید",
-                "saves": "دفاع",
-                "team_form": "فرم",
-                "last_matches": "۵ بازی آخر",
-                "win": "ب",
-                "draw": "م",
-                "loss": "ش",
-                "points": "ا",
-                "position": "رتبه",
-                "played": "بازی",
-                "goal_difference": "تفاضل",
-                "export": "خروجی داده",
-                "import": "ورودی داده",
-                "backup": "تهیه پشتیبان",
-                "restore": "بازیابی پشتیبان",
-                "clear_cache": "پاک کردن حافظه موقت",
-                "debug_mode": "حالت دیباگ",
-                "api_key": "کلید API",
-                "save": "ذخیره",
-                "cancel": "انصراف",
-                "close": "بستن",
-                "yes": "بله",
-                "no": "خیر",
-                "ok": "تایید",
-                "apply": "اعمال",
-                "reset": "بازنشانی",
-                "default": "پیش‌فرض",
-                "advanced": "پیشرفته",
-                "proxy": "تنظیمات پراکسی",
-                "timeout": "تایم‌اوت (ثانیه)",
-                "retries": "تلاش مجدد",
-                "user_agent": "عامل کاربری",
-                "headers": "هدرهای سفارشی",
-                "logs": "مشاهده لاگ‌ها",
-                "update_available": "به‌روزرسانی موجود است!",
-                "download": "دانلود",
-                "later": "بعداً",
-                "install": "نصب اکنون",
-                "changelog": "تغییرات",
-                "checking_updates": "در حال بررسی به‌روزرسانی...",
-                "up_to_date": "شما از آخرین نسخه استفاده می‌کنید.",
-                "error_update": "خطا در بررسی به‌روزرسانی.",
-                "new_version": "نسخه جدید {version} موجود است!",
-                "current_version": "نسخه فعلی: {current}",
-                "latest_version": "آخرین نسخه: {latest}",
-                "release_date": "انتشار: {date}",
-                "size": "حجم: {size}",
-                "download_progress": "در حال دانلود: {progress}%",
-                "installing": "در حال نصب به‌روزرسانی...",
-                "restart_required": "برای اعمال به‌روزرسانی نیاز به ری‌استارت است.",
-                "restart": "ری‌استارت اکنون"
-            },
-            "zh": {
-                "app_name": "实时体育中心",
-                "title": "实时体育比分",
-                "subtitle": "全球实时更新",
-                "select_sport": "选择运动",
-                "select_league": "选择联赛",
-                "refresh": "立即刷新",
-                "auto_update": "自动更新 (5秒)",
-                "language": "语言",
-                "theme": "主题",
-                "light": "明亮",
-                "dark": "暗黑",
-                "system": "系统",
-                "red": "红色警报",
-                "blue": "海洋蓝",
-                "loading": "正在加载实时比分...",
-                "no_data": "当前无进行中的比赛。",
-                "vs": "对",
-                "live": "直播",
-                "ft": "完场",
-                "ht": "中场",
-                "postponed": "延期",
-                "cancelled": "取消",
-                "football": "足球",
-                "basketball": "篮球",
-                "tennis": "网球",
-                "volleyball": "排球",
-                "handball": "手球",
-                "status": "状态",
-                "home": "主队",
-                "away": "客队",
-                "score": "比分",
-                "time": "时间",
-                "league": "联赛",
-                "update_time": "更新于",
-                "error_api": "API 错误：无法获取数据。",
-                "network_error": "网络错误。正在重试...",
-                "settings": "设置",
-                "about": "关于",
-                "exit": "退出",
-                "version": "版本",
-                "developer": "开发者",
-                "source": "源代码",
-                "website": "官方网站",
-                "donate": "支持项目",
-                "search": "搜索比赛...",
-                "filter": "筛选",
-                "all_leagues": "所有联赛",
-                "favorite": "加入收藏",
-                "unfavorite": "移除收藏",
-                "notification": "启用通知",
-                "sound": "进球声音",
-                "fullscreen": "全屏模式",
-                "minimize": "最小化到托盘",
-                "statistics": "统计",
-                "goals": "进球",
-                "yellow_cards": "黄牌",
-                "red_cards": "红牌",
-                "corners": "角球",
-                "possession": "控球率",
-                "shots": "射门",
-                "shots_on_target": "射正",
-                "fouls": "犯规",
-                "offside": "越位",
-                "saves": "扑救",
-                "team_form": "状态",
-                "last_matches": "近5场",
-                "win": "胜",
-                "draw": "平",
-                "loss": "负",
-                "points": "积分",
-                "position": "排名",
-                "played": "场",
-                "goal_difference": "净胜",
-                "export": "导出数据",
-                "import": "导入数据",
-                "backup": "创建备份",
-                "restore": "恢复备份",
-                "clear_cache": "清除缓存",
-                "debug_mode": "调试模式",
-                "api_key": "API 密钥",
-                "save": "保存",
-                "cancel": "取消",
-                "close": "关闭",
-                "yes": "是",
-                "no": "否",
-                "ok": "确定",
-                "apply": "应用",
-                "reset": "重置",
-                "default": "默认",
-                "advanced": "高级",
-                "proxy": "代理设置",
-                "timeout": "超时(秒)",
-                "retries": "重试次数",
-                "user_agent": "用户代理",
-                "headers": "自定义请求头",
-                "logs": "查看日志",
-                "update_available": "有可用更新！",
-                "download": "下载",
-                "later": "稍后",
-                "install": "立即安装",
-                "changelog": "更新日志",
-                "checking_updates": "正在检查更新...",
-                "up_to_date": "您使用的是最新版本。",
-                "error_update": "检查更新失败。",
-                "new_version": "新版本 {version} 已发布！",
-                "current_version": "当前版本: {current}",
-                "latest_version": "最新版本: {latest}",
-                "release_date": "发布日期: {date}",
-                "size": "大小: {size}",
-                "download_progress": "下载中: {progress}%",
-                "installing": "正在安装更新...",
-                "restart_required": "需要重启以应用更新。",
-                "restart": "立即重启"
-            },
-            "ru": {
-                "app_name": "Центр живых спортивных результатов",
-                "title": "Живые спортивные результаты",
-                "subtitle": "Мгновенные обновления со всего мира",
-                "select_sport": "Выбрать вид спорта",
-                "select_league": "Выбрать лигу",
-                "refresh": "Обновить сейчас",
-                "auto_update": "Автообновление (5с)",
-                "language": "Язык",
-                "theme": "Тема",
-                "light": "Светлая",
-                "dark": "Тёмная",
-                "system": "Системная",
-                "red": "Красная тревога",
-                "blue": "Океанский синий",
-                "loading": "Загрузка живых результатов...",
-                "no_data": "В данный момент нет живых матчей.",
-                "vs": "против",
-                "live": "Прямая",
-                "ft": "Финал",
-                "ht": "Перерыв",
-                "postponed": "Отложено",
-                "cancelled": "Отменено",
-                "football": "Футбол",
-                "basketball": "Баскетбол",
-                "tennis": "Теннис",
-                "volleyball": "Волейбол",
-                "handball": "Гандбол",
-                "status": "Статус",
-                "home": "Дом",
-                "away": "Гости",
-                "score": "Счёт",
-                "time": "Время",
-                "league": "Лига",
-                "update_time": "Обновлено",
-                "error_api": "Ошибка API: не удалось получить данные.",
-                "network_error": "Ошибка сети. Повторная попытка...",
-                "settings": "Настройки",
-                "about": "О программе",
-                "exit": "Выход",
-                "version": "Версия",
-                "developer": "Разработчик",
-                "source": "Исходный код",
-                "website": "Веб-сайт",
-                "donate": "Поддержать проект",
-                "search": "Поиск матчей...",
-                "filter": "Фильтр",
-                "all_leagues": "Все лиги",
-                "favorite": "Добавить в избранное",
-                "unfavorite": "Убрать из избранного",
-                "notification": "Включить уведомления",
-                "sound": "Звук при голе",
-                "fullscreen": "Полный экран",
-                "minimize": "Свернуть в трей",
-                "statistics": "Статистика",
-                "goals": "Голы",
-                "yellow_cards": "Жёлтые карточки",
-                "red_cards": "Красные карточки",
-                "corners": "Угловые",
-                "possession": "Владение мячом",
-                "shots": "Удары",
-                "shots_on_target": "Удары в створ",
-                "fouls": "Фолы",
-                "offside": "Офсайд",
-                "saves": "Сейвы",
-                "team_form": "Форма",
-                "last_matches": "Последние 5 матчей",
-                "win": "П",
-                "draw": "Н",
-                "loss": "Пор",
-                "points": "Очки",
-                "position": "Поз",
-                "played": "И",
-                "goal_difference": "Разн",
-                "export": "Экспорт данных",
-                "import": "Импорт данных",
-                "backup": "Создать резервную копию",
-                "restore": "Восстановить из копии",
-                "clear_cache": "Очистить кэш",
-                "debug_mode": "Режим отладки",
-                "api_key": "Ключ API",
-                "save": "Сохранить",
-                "cancel": "Отмена",
-                "close": "Закрыть",
-                "yes": "Да",
-                "no": "Нет",
-                "ok": "ОК",
-                "apply": "Применить",
-                "reset": "Сбросить",
-                "default": "По умолчанию",
-                "advanced": "Дополнительно",
-                "proxy": "Настройки прокси",
-                "timeout": "Таймаут (сек)",
-                "retries": "Попытки",
-                "user_agent": "User Agent",
-                "headers": "Пользовательские заголовки",
-                "logs": "Просмотр логов",
-                "update_available": "Доступно обновление!",
-                "download": "Скачать",
-                "later": "Позже",
-                "install": "Установить сейчас",
-                "changelog": "Список изменений",
-                "checking_updates": "Проверка обновлений...",
-                "up_to_date": "У вас последняя версия.",
-                "error_update": "Ошибка проверки обновлений.",
-                "new_version": "Доступна новая версия {version}!",
-                "current_version": "Текущая: {current}",
-                "latest_version": "Последняя: {latest}",
-                "release_date": "Дата: {date}",
-                "size": "Размер: {size}",
-                "download_progress": "Загрузка: {progress}%",
-                "installing": "Установка обновления...",
-                "restart_required": "Требуется перезапуск.",
-                "restart": "Перезапустить сейчас"
-            }
-        }
+    def pack(self):
+        # Only the active language is resident; a switch drops the previous pack and its tables
+        if self.strings is None:
+            self.strings = LANGUAGE_PACKS[self.current_lang]()
+        return self.strings
 
     def tr(self, key):
-        return self.translations.get(self.current_lang, self.translations["en"]).get(key, key)
+        return self.pack().get(key, key)
+
+    def format(self, key, **values):
+        cache_key = (key, *sorted(values.items()))
+        text = self.formatted.get(cache_key)
+        if text is None:
+            if len(self.formatted) >= FORMAT_CACHE_SIZE:
+                self.formatted.clear()
+            text = self.formatted[cache_key] = self.tr(key).format(**values)
+        return text
+
+    @property
+    def tables(self):
+        if self.display_tables is None:
+            self.display_tables = build_display_tables(self.tr)
+        return self.display_tables
 
     def set_language(self, lang):
-        if lang in self.translations:
+        if lang not in LANGUAGE_PACKS:
+            return False
+        if lang != self.current_lang:
             self.current_lang = lang
-            return True
-        return False
+            self.strings = None
+            self.display_tables = None
+            self.formatted = {}
+        return True
 
     def get_direction(self):
         return LANGUAGES.get(self.current_lang, LANGUAGES["en"])["direction"]
 
 translator = Translator()
 
-# ====================== Database Manager ======================
-class DatabaseManager:
-    def __init__(self, db_path=None):
-        if db_path is None:
-            try:
-                config_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
-                os.makedirs(config_dir, exist_ok=True)
-                db_path = os.path.join(config_dir, "sports_hub.db")
-            except:
-                db_path = "sports_hub.db"
-        self.db_path = db_path
-        self.init_db()
-
-    def init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS favorites (
-                    event_id TEXT PRIMARY KEY,
-                    sport TEXT,
-                    home TEXT,
-                    away TEXT,
-                    league TEXT,
-                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    data TEXT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-    def get_setting(self, key, default=None):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT value FROM settings WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            return row[0] if row else default
-
-    def set_setting(self, key, value):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO settings (key, value) VALUES (?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
-            """, (key, value))
-
-    def add_favorite(self, event):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR IGNORE INTO favorites (event_id, sport, home, away, league)
-                VALUES (?, ?, ?, ?, ?)
-            """, (event["idEvent"], event["strSport"], 
-                  event.get("strHomeTeam", ""), event.get("strAwayTeam", ""), event["strLeague"]))
-
-    def remove_favorite(self, event_id):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM favorites WHERE event_id = ?", (event_id,))
-
-    def get_favorites(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT * FROM favorites ORDER BY added_at DESC")
-            return cursor.fetchall()
-
-    def set_cache(self, key, data):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO cache (key, data) VALUES (?, ?)
-                ON CONFLICT(key) DO UPDATE SET data = excluded.data, timestamp = CURRENT_TIMESTAMP
-            """, (key, json.dumps(data)))
-
-    def get_cache(self, key, max_age=60):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT data, timestamp FROM cache WHERE key = ?
-            """, (key,))
-            row = cursor.fetchone()
-            if row:
-                data, timestamp = row
-                if (datetime.now() - datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")).seconds < max_age:
-                    return json.loads(data)
-        return None
-
 # ====================== API Worker Thread ======================
+STOP_TIMEOUT_MS = 1000
+
 class APIWorker(QThread):
     data_ready = pyqtSignal(dict)
+    delta_ready = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     progress = pyqtSignal(int)
+    stats_ready = pyqtSignal(dict)
+    schedule_ready = pyqtSignal(dict)
 
-    def __init__(self, sport="Soccer", league=None, use_cache=True):
+    def __init__(self, feeds=None, use_cache=True, db=None, history=None, recorder=None, server=None):
         super().__init__()
-        self.sport = sport
-        self.league = league
-        self.use_cache = use_cache
-        self.running = True
-        self.db = DatabaseManager()
-        self.session = requests.Session()
-        retry = Retry(total=MAX_RETRIES, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("https://", adapter)
-        self.session.headers.update({
-            "User-Agent": "LiveSportsHub/2.0 (+https://github.com/yourname/livesportshub)"
-        })
+        self.recorder = recorder
+        self.server = server
+        # The thread only hosts the headless poller; its callbacks are re-emitted as queued signals
+        self.poller = FeedPoller(feeds, use_cache, db, history=history,
+                                 on_data=self.emit_data,
+                                 on_delta=self.emit_delta,
+                                 on_progress=self.progress.emit,
+                                 on_stats=self.stats_ready.emit,
+                                 on_schedule=self.schedule_ready.emit)
+
+    def watch_feed(self, sport, league=None):
+        self.poller.watch_feed(sport, league)
+
+    def unwatch_feed(self, sport, league=None):
+        self.poller.unwatch_feed(sport, league)
+
+    def refresh(self, sport=None, league=None):
+        self.poller.refresh(sport, league)
+
+    def pause(self):
+        self.poller.pause()
+
+    def resume(self):
+        self.poller.resume()
+
+    def emit_data(self, data):
+        if self.recorder:
+            self.recorder.write(data)
+        if self.server:
+            self.server.publish(data)
+        self.data_ready.emit(data)
+
+    def emit_delta(self, delta):
+        if self.server:
+            self.server.publish_delta(delta)
+        self.delta_ready.emit(delta)
 
     def run(self):
-        cache_key = f"events_{self.sport}_{self.league or 'all'}_{datetime.now().strftime('%Y-%m-%d')}"
-        if self.use_cache:
-            cached = self.db.get_cache(cache_key)
-            if cached:
-                self.data_ready.emit(cached)
-                self.progress.emit(100)
-
-        while self.running:
-            try:
-                self.fetch_live_events()
-            except Exception as e:
-                mock_data = self.generate_mock_data()
-                self.data_ready.emit(mock_data)
-            time.sleep(UPDATE_INTERVAL / 1000)
-
-    def fetch_live_events(self):
-        today = datetime.now().strftime("%Y-%m-%d")
-        url = f"{API_BASE_URL}/eventsday.php"
-        params = {"d": today, "s": self.sport}
-        if self.league:
-            params["l"] = self.league
-
-        self.progress.emit(30)
-        response = self.session.get(url, params=params, timeout=15)
-        self.progress.emit(70)
-
-        if response.status_code == 200:
-            data = response.json()
-            events = data.get("events", [])
-            enriched_events = self.enrich_events(events)
-            result = {"events": enriched_events, "timestamp": datetime.now().isoformat()}
-            self.db.set_cache(f"events_{self.sport}_{self.league or 'all'}_{today}", result)
-            self.data_ready.emit(result)
-            self.progress.emit(100)
-        else:
-            raise Exception(f"HTTP {response.status_code}")
+        self.poller.run()
 
-    def enrich_events(self, events):
-        enriched = []
-        for event in events:
-            event.setdefault("strHomeTeam", event["strEvent"].split(" vs ")[0] if " vs " in event["strEvent"] else "Team A")
-            event.setdefault("strAwayTeam", event["strEvent"].split(" vs ")[-1] if " vs " in event["strEvent"] else "Team B")
-            event.setdefault("intHomeScore", "0")
-            event.setdefault("intAwayScore", "0")
-            event.setdefault("strStatus", "Scheduled")
-            event.setdefault("strProgress", event.get("strTime", "00:00"))
-            enriched.append(event)
-        return enriched
-
-    def generate_mock_data(self):
-        teams = [
-            ("Real Madrid", "Barcelona"), ("Manchester United", "Liverpool"),
-            ("Bayern Munich", "Dortmund"), ("Juventus", "Inter Milan"),
-            ("PSG", "Marseille"), ("Chelsea", "Arsenal")
-        ]
-        import random
-        events = []
-        for i in range(6):
-            home, away = random.choice(teams)
-            score_home = random.randint(0, 4)
-            score_away = random.randint(0, 4)
-            status = random.choice(["Live", "HT", "FT", "Scheduled"])
-            minute = random.randint(1, 90) if status == "Live" else 45 if status == "HT" else 90
-            events.append({
-                "idEvent": str(1000 + i),
-                "strEvent": f"{home} vs {away}",
-                "strLeague": random.choice(["La Liga", "Premier League", "Bundesliga", "Serie A"]),
-                "strSport": self.sport,
-                "strStatus": status,
-                "intHomeScore": str(score_home),
-                "intAwayScore": str(score_away),
-                "strProgress": f"{minute}'" if status == "Live" else status,
-                "strHomeTeam": home,
-                "strAwayTeam": away,
-                "dateEvent": datetime.now().strftime("%Y-%m-%d"),
-                "strTime": f"{random.randint(12, 23):02d}:00"
-            })
-        return {"events": events, "timestamp": datetime.now().isoformat()}
+    def stop(self):
+        self.poller.stop()
+        self.wait(STOP_TIMEOUT_MS)
+
+class ReplayWorker(QThread):
+    data_ready = pyqtSignal(dict)
+    delta_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    progress = pyqtSignal(int)
+    stats_ready = pyqtSignal(dict)
+    schedule_ready = pyqtSignal(dict)
+    replay_finished = pyqtSignal(int)
+
+    def __init__(self, path, speed=1.0):
+        super().__init__()
+        # Stands in for APIWorker: a recording re-driven through the same signals, no network involved
+        self.source = ReplaySource(path, speed,
+                                   on_data=self.data_ready.emit,
+                                   on_delta=self.delta_ready.emit,
+                                   on_finished=self.replay_finished.emit)
+
+    def watch_feed(self, sport, league=None):
+        # A recording already holds every feed that was watched while it was made
+        pass
+
+    def unwatch_feed(self, sport, league=None):
+        pass
+
+    def refresh(self, sport=None, league=None):
+        pass
+
+    def pause(self):
+        self.source.pause()
+
+    def resume(self):
+        self.source.resume()
+
+    def run(self):
+        self.source.run()
+
+    def stop(self):
+        self.source.stop()
+        self.wait(STOP_TIMEOUT_MS)
+
+class SubscriberWorker(QThread):
+    data_ready = pyqtSignal(dict)
+    delta_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    progress = pyqtSignal(int)
+    stats_ready = pyqtSignal(dict)
+    schedule_ready = pyqtSignal(dict)
+
+    def __init__(self, url):
+        super().__init__()
+        # Stands in for APIWorker on screens that follow another instance started with --serve
+        self.source = FeedSubscriber(url,
+                                     on_data=self.data_ready.emit,
+                                     on_delta=self.delta_ready.emit,
+                                     on_error=self.error_occurred.emit)
+
+    def watch_feed(self, sport, league=None):
+        # The serving instance decides which feeds are polled; leagues it does not poll are cut from its sport feeds
+        if league:
+            self.source.watch_league(sport, league)
+
+    def unwatch_feed(self, sport, league=None):
+        if league:
+            self.source.unwatch_league(sport, league)
+
+    def refresh(self, sport=None, league=None):
+        pass
+
+    def pause(self):
+        self.source.pause()
+
+    def resume(self):
+        self.source.resume()
+
+    def run(self):
+        self.source.run()
+
+    def stop(self):
+        self.source.stop()
+        self.wait(STOP_TIMEOUT_MS)
+
+# ====================== Export & Import Workers ======================
+# Filter -> suffix appended when the chosen name has no format suffix of its own
+EXPORT_FILTERS = {
+    "JSON (*.json)": ".json",
+    "NDJSON (*.ndjson)": ".ndjson",
+    "CSV (*.csv)": ".csv",
+    "NDJSON, gzip (*.ndjson.gz)": ".ndjson.gz",
+    "CSV, gzip (*.csv.gz)": ".csv.gz"
+}
+EXPORT_SUFFIXES = (".json", ".ndjson", ".jsonl", ".csv", ".gz")
+IMPORT_FILTER = "Exports (*.json *.ndjson *.jsonl *.csv *.gz)"
+# GUI-thread budget per event-loop turn for appending imported rows, leaving the rest of a 60 fps frame
+IMPORT_SLICE_MS = 8
+# Rows per model append; small enough that one append never overruns the slice
+IMPORT_APPEND_ROWS = 50
+IMPORT_QUEUE_BATCHES = 4
+
+class ExportWorker(QThread):
+    progress = pyqtSignal(int, int)
+    export_done = pyqtSignal(str, int)
+    export_failed = pyqtSignal(str)
+
+    def __init__(self, path, source, fields, db=None):
+        super().__init__()
+        self.path = path
+        # Called on the worker thread, so history counts and queries stay off the GUI thread too
+        self.source = source
+        self.fields = fields
+        self.db = db
+        self.cancelled = threading.Event()
+
+    def run(self):
+        try:
+            rows, total, header = self.source()
+            count = write_export(self.path, rows, self.fields, total, header, self.progress.emit, self.cancelled)
+            self.export_done.emit(self.path, count)
+        except ExportCancelled:
+            pass
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.warning("Export to %s failed: %s", self.path, e)
+            self.export_failed.emit(str(e))
+        finally:
+            if self.db is not None:
+                self.db.connections.release()
 
     def stop(self):
-        self.running = False
-        self.quit()
-        self.wait()
+        self.cancelled.set()
+        self.wait(STOP_TIMEOUT_MS)
+
+class ImportWorker(QThread):
+    batch_ready = pyqtSignal(list)
+    import_done = pyqtSignal(int, int)
+    import_failed = pyqtSignal(str)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.cancelled = threading.Event()
+        # Parsing stays a few batches ahead of the table: memory is bounded and the parser, blocked
+        # here rather than holding the GIL, never makes the GUI thread's paint calls wait on it
+        self.slots = threading.Semaphore(IMPORT_QUEUE_BATCHES)
+
+    def emit_batch(self, events):
+        while not self.slots.acquire(timeout=0.1):
+            if self.cancelled.is_set():
+                return
+        self.batch_ready.emit(events)
+
+    def batch_applied(self):
+        self.slots.release()
+
+    def run(self):
+        try:
+            imported, skipped = read_import(self.path, self.emit_batch, self.cancelled)
+        except Exception as e:
+            logger.warning("Import from %s failed: %s", self.path, e)
+            self.import_failed.emit(str(e))
+            return
+        if not self.cancelled.is_set():
+            self.import_done.emit(imported, skipped)
+
+    def stop(self):
+        self.cancelled.set()
+        self.wait(STOP_TIMEOUT_MS)
+
+class HistoryRangeDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(translator.tr("export_history"))
+        now = QDateTime.currentDateTime()
+        self.start_edit = QDateTimeEdit(now.addDays(-1))
+        self.start_edit.setCalendarPopup(True)
+        self.end_edit = QDateTimeEdit(now)
+        self.end_edit.setCalendarPopup(True)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout = QFormLayout(self)
+        layout.addRow(translator.tr("history_from"), self.start_edit)
+        layout.addRow(translator.tr("history_to"), self.end_edit)
+        layout.addRow(buttons)
+
+    def time_range(self):
+        return self.start_edit.dateTime().toSecsSinceEpoch(), self.end_edit.dateTime().toSecsSinceEpoch()
 
 # ====================== Modern UI Components ======================
+def cache_surface(size, dpr):
+    pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    return pixmap
+
 class GlassEffect(QWidget):
     def __init__(self, opacity=0.15, blur_radius=20, parent=None):
         super().__init__(parent)
@@ -808,60 +978,79 @@ class GlassEffect(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor(255, 255, 255, int(255 * self.opacity)))
-        painter.setPen(QColor(255, 255, 255, 80))
-        painter.drawRoundedRect(self.rect(), 20, 20)
+        dpr = self.devicePixelRatioF()
+        key = f"GlassEffect:{self.opacity}:{self.width()}x{self.height()}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = cache_surface(self.size(), dpr)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(QColor(255, 255, 255, int(255 * self.opacity)))
+            painter.setPen(QColor(255, 255, 255, 80))
+            painter.drawRoundedRect(QRect(QPoint(0, 0), self.size()), 20, 20)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        QPainter(self).drawPixmap(0, 0, pixmap)
 
 class ModernButton(QPushButton):
+    STATE_COLORS = {
+        "disabled": (QColor("#CCCCCC"), QColor("#AAAAAA"), QColor("#666666")),
+        "pressed": (QColor("#005A9E"), QColor("#004478"), QColor("white")),
+        "hover": (QColor("#1080EF"), QColor("#0066CC"), QColor("white")),
+        "normal": (QColor("#0078D4"), QColor("#106EBE"), QColor("white"))
+    }
+
     def __init__(self, text="", icon=None, parent=None):
         super().__init__(text, parent)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMinimumHeight(44)
         self.setIconSize(QSize(20, 20))
         if icon:
-            self.setIcon(QIcon(icon))
+            self.setIcon(icon_registry.icon(icon))
         font = QFont("Segoe UI", 10, QFont.Weight.Medium)
         self.setFont(font)
 
+    def paint_state(self):
+        if not self.isEnabled():
+            return "disabled"
+        if self.isDown():
+            return "pressed"
+        if self.underMouse():
+            return "hover"
+        return "normal"
+
+    def background(self, state, dpr):
+        # Gradient fills are shared by every button of the same state and size
+        key = f"ModernButton:{state}:{self.width()}x{self.height()}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            top, bottom, _ = self.STATE_COLORS[state]
+            pixmap = cache_surface(self.size(), dpr)
+            rect = QRect(QPoint(0, 0), self.size()).adjusted(1, 1, -1, -1)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            gradient = QLinearGradient(0, 0, 0, rect.height())
+            gradient.setColorAt(0, top)
+            gradient.setColorAt(1, bottom)
+            painter.setBrush(QBrush(gradient))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(rect, 12, 12)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def paintEvent(self, event):
+        state = self.paint_state()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        rect = self.rect().adjusted(1, 1, -1, -1)
-
-        if not self.isEnabled():
-            color1 = QColor("#CCCCCC")
-            color2 = QColor("#AAAAAA")
-            text_color = QColor("#666666")
-        elif self.isDown():
-            color1 = QColor("#005A9E")
-            color2 = QColor("#004478")
-            text_color = QColor("white")
-        elif self.underMouse():
-            color1 = QColor("#1080EF")
-            color2 = QColor("#0066CC")
-            text_color = QColor("white")
-        else:
-            color1 = QColor("#0078D4")
-            color2 = QColor("#106EBE")
-            text_color = QColor("white")
-
-        gradient = QLinearGradient(0, 0, 0, rect.height())
-        gradient.setColorAt(0, color1)
-        gradient.setColorAt(1, color2)
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(rect, 12, 12)
-
-        painter.setPen(text_color)
+        painter.drawPixmap(0, 0, self.background(state, self.devicePixelRatioF()))
+        painter.setPen(self.STATE_COLORS[state][2])
         painter.setFont(self.font())
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
+        painter.drawText(self.rect().adjusted(1, 1, -1, -1), Qt.AlignmentFlag.AlignCenter, self.text())
 
 class IconButton(QPushButton):
-    def __init__(self, icon_path, size=24, parent=None):
+    def __init__(self, icon, size=24, parent=None):
         super().__init__(parent)
-        self.setIcon(QIcon(icon_path))
+        self.setIcon(icon_registry.icon(icon))
         self.setIconSize(QSize(size, size))
         self.setFixedSize(size + 16, size + 16)
         self.setStyleSheet("""
@@ -879,26 +1068,444 @@ class IconButton(QPushButton):
             }
         """)
 
+# ====================== Search Index ======================
+SEARCH_DEBOUNCE_MS = 150
+# Arabic-script variants typed on Persian keyboards, plus ZWNJ which users rarely type when searching
+SEARCH_TRANSLATION = str.maketrans({"\u064a": "\u06cc", "\u0643": "\u06a9", "\u200c": ""})
+
+def normalize_search_text(text):
+    if text.isascii():
+        # Nothing to decompose or strip; most team and league names take this path
+        return text.casefold()
+    text = unicodedata.normalize("NFKD", text.translate(SEARCH_TRANSLATION))
+    return "".join(ch for ch in text if unicodedata.category(ch) != "Mn").casefold()
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class SearchIndex:
+    def __init__(self):
+        self.texts = {}
+        self.statuses = {}
+        self.by_status = {}
+        self.postings = {}
+
+    def add(self, event):
+        event_id = event.event_id
+        old_status = self.statuses.get(event_id)
+        if old_status is not event.status:
+            if old_status is not None:
+                self.by_status[old_status].discard(event_id)
+            self.statuses[event_id] = event.status
+            self.by_status.setdefault(event.status, set()).add(event_id)
+
+        text = normalize_search_text("\n".join((event.league, event.home, event.away, event.status_text)))
+        old_text = self.texts.get(event_id)
+        if old_text == text:
+            return
+        if old_text is not None:
+            self.unindex(event_id, old_text)
+        self.texts[event_id] = text
+        for gram in trigrams(text):
+            self.postings.setdefault(gram, set()).add(event_id)
+
+    def remove(self, event_id):
+        text = self.texts.pop(event_id, None)
+        if text is not None:
+            self.unindex(event_id, text)
+        status = self.statuses.pop(event_id, None)
+        if status is not None:
+            self.by_status[status].discard(event_id)
+
+    def unindex(self, event_id, text):
+        for gram in trigrams(text):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(event_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def search(self, query, status_labels=None):
+        # Returns the matching event ids, or None when the query is empty
+        query = normalize_search_text(query.strip())
+        if not query:
+            return None
+        if len(query) >= 3:
+            postings = sorted((self.postings.get(gram, ()) for gram in trigrams(query)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = self.texts.keys()
+        matches = {event_id for event_id in candidates if query in self.texts[event_id]}
+        for status, label in (status_labels or {}).items():
+            if query in label:
+                matches |= self.by_status.get(status, set())
+        return matches
+
+# ====================== Events Table Model ======================
+STATUS_KEYS = {
+    EventStatus.LIVE: "live",
+    EventStatus.FT: "ft",
+    EventStatus.HT: "ht",
+    EventStatus.POSTPONED: "postponed",
+    EventStatus.CANCELLED: "cancelled"
+}
+
+HEADER_KEYS = ["league", "home", "score", "away", "status", "time", "favorite", "update_time"]
+COL_LEAGUE, COL_HOME, COL_SCORE, COL_AWAY, COL_STATUS, COL_TIME, COL_FAVORITE, COL_UPDATED = range(len(HEADER_KEYS))
+EVENT_ROLE = Qt.ItemDataRole.UserRole
+FAVORITE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class EventRow:
+    __slots__ = ("event_id", "values", "event", "updated")
+
+    def __init__(self, event, values, updated):
+        self.event_id = event.event_id
+        self.values = values
+        self.event = event
+        self.updated = updated
+
+class EventTableModel(QAbstractTableModel):
+    def __init__(self, favorites, parent=None):
+        super().__init__(parent)
+        self.favorites = favorites
+        self.rows = []
+        self.row_index = {}
+        self.search_index = SearchIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADER_KEYS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return translator.tables.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == COL_STATUS:
+                return translator.tables.status.get(row.event.status, row.values[COL_STATUS])
+            if col == COL_FAVORITE:
+                return None
+            if col == COL_UPDATED:
+                return row.updated
+            return row.values[col]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == EVENT_ROLE:
+            return row.event
+        if role == FAVORITE_ROLE:
+            return row.event_id in self.favorites
+        return None
+
+    def row_values(self, event):
+        # Raw per-column values used both for display and for change detection
+        return (
+            event.league,
+            event.home,
+            event.score_text(),
+            event.away,
+            event.status_text,
+            event.progress or "N/A"
+        )
+
+    def apply_snapshot(self, events):
+        stamp = datetime.now().strftime("%H:%M:%S")
+        incoming = {event.event_id: event for event in events}
+        self.remove_rows([row for row, entry in enumerate(self.rows) if entry.event_id not in incoming])
+        for row, entry in enumerate(self.rows):
+            self.update_row(row, incoming.pop(entry.event_id), stamp)
+        self.append_events(incoming.values(), stamp)
+
+    def apply_delta(self, delta):
+        stamp = datetime.now().strftime("%H:%M:%S")
+        self.remove_rows(sorted(self.row_index[event_id] for event_id in delta["removed"] if event_id in self.row_index))
+        fresh = []
+        for event in delta["added"] + delta["changed"]:
+            row = self.row_index.get(event.event_id)
+            if row is None:
+                fresh.append(event)
+            else:
+                self.update_row(row, event, stamp)
+        self.append_events(fresh, stamp)
+
+    def remove_rows(self, rows):
+        if not rows:
+            return
+        for first, last in reversed(self.contiguous_ranges(rows)):
+            for entry in self.rows[first:last + 1]:
+                self.search_index.remove(entry.event_id)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.rows[first:last + 1]
+            self.endRemoveRows()
+        self.row_index = {entry.event_id: row for row, entry in enumerate(self.rows)}
+
+    def update_row(self, row, event, stamp):
+        entry = self.rows[row]
+        entry.event = event
+        values = self.row_values(event)
+        if values == entry.values:
+            return
+        self.search_index.add(event)
+        first_col = next(col for col, (old, new) in enumerate(zip(entry.values, values)) if old != new)
+        entry.values = values
+        entry.updated = stamp
+        self.dataChanged.emit(self.index(row, first_col), self.index(row, COL_UPDATED))
+
+    def append_events(self, events, stamp):
+        events = list(events)
+        if not events:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(events) - 1)
+        for event in events:
+            self.row_index[event.event_id] = len(self.rows)
+            self.rows.append(EventRow(event, self.row_values(event), stamp))
+            self.search_index.add(event)
+        self.endInsertRows()
+
+    @staticmethod
+    def contiguous_ranges(rows):
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        return ranges
+
+    def events(self):
+        return [entry.event for entry in self.rows]
+
+    def event_id_at(self, row):
+        return self.rows[row].event_id
+
+    def event_for(self, event_id):
+        row = self.row_index.get(event_id)
+        return None if row is None else self.rows[row].event
+
+    def refresh_event(self, event_id):
+        row = self.row_index.get(event_id)
+        if row is not None:
+            index = self.index(row, COL_FAVORITE)
+            self.dataChanged.emit(index, index)
+
+    def retranslate(self):
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(HEADER_KEYS) - 1)
+        if self.rows:
+            self.dataChanged.emit(self.index(0, COL_STATUS), self.index(len(self.rows) - 1, COL_STATUS))
+
+class EventFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = None
+        self.favorites_first = False
+
+    def set_matches(self, matches):
+        if matches == self.matches:
+            return
+        self.matches = matches
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.matches is None or self.sourceModel().rows[source_row].event_id in self.matches
+
+    def set_favorites_first(self, enabled):
+        self.favorites_first = enabled
+        # Keyed on the favourite column so the dynamic sort only repositions rows whose star or data changed
+        self.sort(COL_FAVORITE if enabled else -1)
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        left_favorite = model.rows[left.row()].event_id in model.favorites
+        right_favorite = model.rows[right.row()].event_id in model.favorites
+        if left_favorite != right_favorite:
+            return left_favorite
+        return left.row() < right.row()
+
+STATUS_BADGE_COLORS = {
+    EventStatus.SCHEDULED: "#0078D4",
+    EventStatus.LIVE: "#FF6B6B",
+    EventStatus.HT: "#FFA000",
+    EventStatus.FT: "#2E7D32",
+    EventStatus.POSTPONED: "#9E9E9E",
+    EventStatus.CANCELLED: "#616161",
+    EventStatus.OTHER: "#607D8B"
+}
+STAR_SIZE = 20
+
+class EventItemDelegate(QStyledItemDelegate):
+    favorite_toggled = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Shared by every row; nothing is allocated per cell at paint time
+        self.score_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        self.badge_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self.badge_metrics = QFontMetrics(self.badge_font)
+        self.live_color = QColor("#FF6B6B")
+        self.badge_text_color = QColor("white")
+        self.badge_colors = {status: QColor(color) for status, color in STATUS_BADGE_COLORS.items()}
+
+    def paint(self, painter, option, index):
+        col = index.column()
+        if col not in (COL_SCORE, COL_STATUS, COL_FAVORITE):
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        opt.state &= ~QStyle.StateFlag.State_HasFocus
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        rect = option.rect
+        event = index.data(EVENT_ROLE)
+        painter.save()
+        if col == COL_FAVORITE:
+            pixmap = icon_registry.pixmap("star_filled" if index.data(FAVORITE_ROLE) else "star", STAR_SIZE,
+                                          painter.device().devicePixelRatioF())
+            painter.drawPixmap(rect.x() + (rect.width() - STAR_SIZE) // 2,
+                               rect.y() + (rect.height() - STAR_SIZE) // 2, pixmap)
+        elif col == COL_SCORE:
+            if event.status is EventStatus.LIVE:
+                painter.setPen(self.live_color)
+            else:
+                selected = opt.state & QStyle.StateFlag.State_Selected
+                painter.setPen(opt.palette.color(QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text))
+            painter.setFont(self.score_font)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data())
+        else:
+            text = index.data()
+            width = min(self.badge_metrics.horizontalAdvance(text) + 16, rect.width() - 4)
+            height = self.badge_metrics.height() + 6
+            badge = QRect(rect.x() + (rect.width() - width) // 2, rect.y() + (rect.height() - height) // 2, width, height)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.badge_colors[event.status])
+            painter.drawRoundedRect(badge, height / 2, height / 2)
+            painter.setPen(self.badge_text_color)
+            painter.setFont(self.badge_font)
+            painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (index.column() == COL_FAVORITE and event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            self.favorite_toggled.emit(index.data(EVENT_ROLE).event_id)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+class EventTableView(QTableView):
+    def paintEvent(self, event):
+        # The viewport repaint is the render stage: delegate painting of every visible cell
+        with metrics.timer("stage_seconds", stage="render"):
+            super().paintEvent(event)
+
+# ====================== Debug Panel ======================
+DEBUG_REFRESH_MS = 1000
+
+class DebugPanel(QDockWidget):
+    # Live view of the registry the Prometheus export reads; only refreshes while shown
+    def __init__(self, parent=None):
+        super().__init__(translator.tr("debug_mode"), parent)
+        self.setObjectName("debug_panel")
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.setWidget(self.text)
+        self.timer = QTimer(self)
+        self.timer.setInterval(DEBUG_REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        summary = metrics.summary()
+        lines = [f"{'histogram':<36} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'total s':>8}"]
+        for name, histogram in summary["histograms"].items():
+            lines.append(f"{name:<36} {histogram['count']:>6} {histogram['p50'] * 1000:>8.1f} "
+                         f"{histogram['p95'] * 1000:>8.1f} {histogram['sum']:>8.2f}")
+        lines.append("")
+        lines.extend(f"{name:<52} {value:>6}" for name, value in summary["counters"].items())
+        self.text.setPlainText("\n".join(lines))
+
 # ====================== Main Application Window ======================
 class LiveSportsApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, replay=None, replay_speed=1.0, recorder=None, subscribe=None, server=None):
         super().__init__()
-        self.db = DatabaseManager()
+        self.db = DatabaseManager(app_db_path())
+        self.history = None
         self.worker = None
+        self.export_worker = None
+        self.import_worker = None
+        self.import_pending = deque()
+        self.import_offset = 0
+        self.import_result = None
+        self.importing = False
+        # Set once imported rows are on the table; the next live poll of the view replaces them
+        self.imported = False
+        self.replay = replay
+        self.replay_speed = replay_speed
+        self.replay_latencies = []
+        self.recorder = recorder
+        self.subscribe = subscribe
+        self.server = server
         self.current_sport = "Soccer"
         self.current_league = None
         self.auto_update = True
-        self.favorites = set()
-        self.sound_effect = QSoundEffect()
+        self.favorites = FavoritesStore(self.db)
+        self.favorites_timer = QTimer(self)
+        self.favorites_timer.setSingleShot(True)
+        self.favorites_timer.setInterval(FAVORITES_FLUSH_MS)
+        self.favorites_timer.timeout.connect(self.favorites.flush)
+        self.import_timer = QTimer(self)
+        self.import_timer.setInterval(0)
+        self.import_timer.timeout.connect(self.drain_import)
         self.last_data = {}
+        self.snapshots = {}
+        self.schedules = {}
+        self.started = False
         self.init_ui()
         self.load_settings()
         self.apply_theme()
-        self.start_worker()
+        if self.replay:
+            self.show_feed()
+        else:
+            self.show_cached_snapshot()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.started:
+            self.started = True
+            # The worker, its HTTP stack and pool threads only come up once the first frame is queued
+            QTimer.singleShot(0, self.start_worker)
+
+    def show_cached_snapshot(self):
+        # Today's last snapshot is shown as-is, however old, until the worker's first poll replaces it
+        cached = self.db.get_cache(FeedState(self.current_sport).cache_key(), max_age=float("inf"),
+                                   decoder=decode_snapshot)
+        if cached:
+            self.store_snapshot(tag_snapshot(cached, self.current_sport, None))
+        self.show_feed()
 
     def init_ui(self):
         self.setWindowTitle(translator.tr("app_name"))
-        self.setWindowIcon(QIcon("icons/app_icon.png"))
+        self.setWindowIcon(icon_registry.icon("app_icon"))
         self.resize(1400, 900)
         self.setMinimumSize(1000, 600)
 
@@ -932,6 +1539,8 @@ class LiveSportsApp(QMainWindow):
         self.status_bar = self.statusBar()
         self.status_label = QLabel()
         self.update_status(translator.tr("loading"))
+        self.interval_label = QLabel()
+        self.status_bar.addPermanentWidget(self.interval_label)
         self.status_bar.addPermanentWidget(self.status_label)
 
         self.apply_language_direction()
@@ -953,6 +1562,7 @@ class LiveSportsApp(QMainWindow):
 
         file_menu = menubar.addMenu(translator.tr("settings"))
         file_menu.addAction(translator.tr("export"), self.export_data)
+        file_menu.addAction(translator.tr("export_history"), self.export_history)
         file_menu.addAction(translator.tr("import"), self.import_data)
         file_menu.addSeparator()
         file_menu.addAction(translator.tr("exit"), self.close)
@@ -964,6 +1574,14 @@ class LiveSportsApp(QMainWindow):
         fullscreen_action.triggered.connect(self.toggle_fullscreen)
         view_menu.addAction(fullscreen_action)
 
+        self.debug_panel = DebugPanel(self)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.debug_panel)
+        self.debug_panel.hide()
+        # Checked state follows the dock, including when it is closed from its title bar
+        debug_action = self.debug_panel.toggleViewAction()
+        debug_action.setShortcut(QKeySequence("F12"))
+        view_menu.addAction(debug_action)
+
         help_menu = menubar.addMenu(translator.tr("about"))
         help_menu.addAction(translator.tr("about"), self.show_about)
 
@@ -986,7 +1604,7 @@ class LiveSportsApp(QMainWindow):
         logo_layout.setSpacing(15)
 
         logo = QLabel()
-        logo_pixmap = QPixmap("icons/app_icon.png").scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        logo_pixmap = icon_registry.pixmap("app_icon", 60, self.devicePixelRatioF())
         logo.setPixmap(logo_pixmap)
         logo_layout.addWidget(logo)
 
@@ -1028,8 +1646,8 @@ class LiveSportsApp(QMainWindow):
 
         layout.addWidget(QLabel(translator.tr("select_sport") + ":"), 0, 0)
         self.sport_combo = QComboBox()
-        for sport, info in SPORT_MAPPING.items():
-            self.sport_combo.addItem(translator.tr(sport), info["api"])
+        for sport, label in translator.tables.sports.items():
+            self.sport_combo.addItem(label, sport)
         self.sport_combo.currentIndexChanged.connect(self.on_sport_changed)
         self.sport_combo.setStyleSheet(self.get_combobox_style())
         layout.addWidget(self.sport_combo, 0, 1)
@@ -1037,10 +1655,11 @@ class LiveSportsApp(QMainWindow):
         layout.addWidget(QLabel(translator.tr("select_league") + ":"), 0, 2)
         self.league_combo = QComboBox()
         self.league_combo.addItem(translator.tr("all_leagues"), "")
+        self.league_combo.currentIndexChanged.connect(self.on_league_changed)
         self.league_combo.setStyleSheet(self.get_combobox_style())
         layout.addWidget(self.league_combo, 0, 3)
 
-        self.refresh_btn = ModernButton(translator.tr("refresh"), "icons/refresh.png")
+        self.refresh_btn = ModernButton(translator.tr("refresh"), "refresh")
         self.refresh_btn.clicked.connect(self.manual_refresh)
         layout.addWidget(self.refresh_btn, 0, 4)
 
@@ -1050,6 +1669,11 @@ class LiveSportsApp(QMainWindow):
         self.auto_update_cb.setStyleSheet("color: white; font-weight: bold;")
         layout.addWidget(self.auto_update_cb, 0, 5, Qt.AlignmentFlag.AlignRight)
 
+        self.favorites_first_cb = QCheckBox(translator.tr("favorites_first"))
+        self.favorites_first_cb.stateChanged.connect(self.toggle_favorites_first)
+        self.favorites_first_cb.setStyleSheet("color: white; font-weight: bold;")
+        layout.addWidget(self.favorites_first_cb, 0, 6)
+
         return panel
 
     def create_main_content(self):
@@ -1063,32 +1687,44 @@ class LiveSportsApp(QMainWindow):
         search_layout = QHBoxLayout()
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText(translator.tr("search"))
-        self.search_edit.textChanged.connect(self.filter_table)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_edit.textChanged.connect(self.search_timer.start)
         self.search_edit.setStyleSheet(self.get_lineedit_style())
         search_layout.addWidget(self.search_edit)
 
-        self.filter_btn = IconButton("icons/filter.png", 20)
+        self.filter_btn = IconButton("filter", 20)
         search_layout.addWidget(self.filter_btn)
 
         layout.addLayout(search_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            translator.tr("league"), translator.tr("home"), translator.tr("score"),
-            translator.tr("away"), translator.tr("status"), translator.tr("time"),
-            translator.tr("favorite"), translator.tr("update_time")
-        ])
+        self.events_model = EventTableModel(self.favorites, self)
+        self.filter_model = EventFilterProxyModel(self)
+        self.filter_model.setSourceModel(self.events_model)
+        self.table = EventTableView()
+        self.table.setModel(self.filter_model)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setShowGrid(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setStyleSheet(self.get_table_style())
-        self.table.itemClicked.connect(self.on_table_item_clicked)
-
-        layout.addWidget(self.table, 1)
+        self.table_delegate = EventItemDelegate(self.table)
+        self.table_delegate.favorite_toggled.connect(self.toggle_favorite)
+        self.table.setItemDelegate(self.table_delegate)
+
+        self.empty_label = QLabel(translator.tr("no_data"))
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Medium))
+        self.empty_label.setStyleSheet("color: #666666;")
+
+        self.table_stack = QStackedLayout()
+        self.table_stack.addWidget(self.table)
+        self.table_stack.addWidget(self.empty_label)
+        layout.addLayout(self.table_stack, 1)
         return content
 
     def get_combobox_style(self):
@@ -1133,7 +1769,7 @@ class LiveSportsApp(QMainWindow):
 
     def get_table_style(self):
         return """
-            QTableWidget {
+            QTableView {
                 background: rgba(255, 255, 255, 0.95);
                 gridline-color: rgba(0, 0, 0, 0.1);
                 font-size: 14px;
@@ -1141,11 +1777,11 @@ class LiveSportsApp(QMainWindow):
                 border-radius: 16px;
                 border: 1px solid rgba(0, 0, 0, 0.1);
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px 8px;
                 border-bottom: 1px solid rgba(0, 0, 0, 0.05);
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
                     stop:0 #0078D4, stop:1 #00C6FF);
                 color: white;
@@ -1165,91 +1801,95 @@ class LiveSportsApp(QMainWindow):
         if self.worker:
             self.worker.stop()
 
-        api_sport = self.sport_combo.currentData()
-        self.worker = APIWorker(sport=api_sport, league=self.current_league)
-        self.worker.data_ready.connect(self.update_table)
+        feeds = [(info["api"], None) for info in SPORT_MAPPING.values()]
+        if self.current_league:
+            feeds.append((self.current_sport, self.current_league))
+        if self.replay:
+            self.worker = ReplayWorker(self.replay, self.replay_speed)
+            self.worker.replay_finished.connect(self.report_replay)
+        elif self.subscribe:
+            self.worker = SubscriberWorker(self.subscribe)
+        else:
+            if self.history is None:
+                self.history = HistoryStore(self.db)
+            self.worker = APIWorker(feeds=feeds, db=self.db, history=self.history, recorder=self.recorder,
+                                    server=self.server)
+        self.worker.data_ready.connect(self.store_snapshot)
+        self.worker.delta_ready.connect(self.apply_delta)
         self.worker.error_occurred.connect(self.show_error)
         self.worker.progress.connect(self.update_progress)
+        self.worker.stats_ready.connect(self.update_poll_stats)
+        self.worker.schedule_ready.connect(self.update_schedule)
+        if not self.auto_update:
+            self.worker.pause()
         self.worker.start()
 
+    def view_key(self):
+        return (self.current_sport, self.current_league)
+
+    def store_snapshot(self, data):
+        key = (data["sport"], data["league"])
+        self.snapshots[key] = data
+        if key == self.view_key():
+            self.last_data = data
+            if self.imported and not self.importing:
+                # Deltas are against the live feed, not the imported rows: the first poll after an import replaces them
+                self.show_feed()
+        if key == (self.current_sport, None):
+            self.update_league_choices(data["leagues"])
+
+    def show_feed(self):
+        # Switching sport or league is an in-memory view change; the worker keeps every feed fresh
+        self.imported = False
+        data = self.snapshots.get(self.view_key())
+        if data is None and self.current_league:
+            sport_data = self.snapshots.get((self.current_sport, None), {})
+            events = [event for event in sport_data.get("events", []) if event.league == self.current_league]
+            data = dict(sport_data, events=events)
+        self.update_table(data or {"events": []})
+        self.show_schedule()
+
     def update_table(self, data):
         self.last_data = data
-        self.table.setRowCount(0)
-        events = data.get("events", [])
-        
-        if not events:
+        self.events_model.apply_snapshot(data.get("events", []))
+        self.refresh_view()
+
+    def apply_delta(self, delta):
+        if "published_at" in delta:
+            # Worker emit to this slot running: the queued-connection hop and any backlog ahead of it
+            metrics.observe("stage_seconds", time.perf_counter() - delta["published_at"], stage="signal")
+        if (delta["sport"], delta["league"]) == self.view_key() and not self.importing:
+            with metrics.timer("stage_seconds", stage="apply"):
+                if delta["reset"]:
+                    self.events_model.apply_snapshot(delta["added"])
+                else:
+                    self.events_model.apply_delta(delta)
+                self.refresh_view()
+            if "replayed_at" in delta:
+                # Emit-to-applied time on the GUI thread, including any wait in the event queue.
+                # Deltas for feeds not on the table are never applied and are left out.
+                self.replay_latencies.append((time.perf_counter() - delta["replayed_at"]) * 1000)
+
+    def report_replay(self, count):
+        summary = latency_summary(self.replay_latencies)
+        logger.info("Replayed %d snapshots, %d changesets applied to the table: p50 %.1f ms, p95 %.1f ms, max %.1f ms",
+                    count, len(self.replay_latencies), summary["p50_ms"], summary["p95_ms"], summary["max_ms"])
+        self.update_status(f"Replay: {count} snapshots, p95 {summary['p95_ms']:.1f} ms")
+
+    def refresh_view(self):
+        count = self.events_model.rowCount()
+        if not count:
             self.show_empty_state()
             return
 
-        for event in events:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            league_item = QTableWidgetItem(event.get("strLeague", "N/A"))
-            league_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, league_item)
-
-            home = event.get("strHomeTeam", "Team A")
-            home_item = QTableWidgetItem(home)
-            home_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 1, home_item)
-
-            score = f"{event.get('intHomeScore', '0')} - {event.get('intAwayScore', '0')}"
-            status = event.get("strStatus", "")
-            if status == "Live":
-                score = f"{score}"
-            score_item = QTableWidgetItem(score)
-            score_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            score_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-            if status == "Live":
-                score_item.setForeground(QColor("#FF6B6B"))
-            self.table.setItem(row, 2, score_item)
-
-            away = event.get("strAwayTeam", "Team B")
-            away_item = QTableWidgetItem(away)
-            away_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, away_item)
-
-            status_map = {
-                "Live": translator.tr("live"),
-                "FT": translator.tr("ft"),
-                "HT": translator.tr("ht"),
-                "Postponed": translator.tr("postponed"),
-                "Cancelled": translator.tr("cancelled")
-            }
-            status_text = status_map.get(status, status)
-            status_item = QTableWidgetItem(status_text)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, status_item)
-
-            time_str = event.get("strProgress", event.get("strTime", "N/A"))
-            time_item = QTableWidgetItem(time_str)
-            time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 5, time_item)
-
-            fav_btn = QPushButton()
-            event_id = event["idEvent"]
-            is_fav = event_id in self.favorites
-            fav_btn.setIcon(QIcon("icons/star_filled.png" if is_fav else "icons/star.png"))
-            fav_btn.setStyleSheet("border: none; padding: 4px;")
-            fav_btn.clicked.connect(lambda checked, eid=event_id: self.toggle_favorite(eid))
-            self.table.setCellWidget(row, 6, fav_btn)
-
-            update_item = QTableWidgetItem(datetime.now().strftime("%H:%M:%S"))
-            update_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 7, update_item)
-
-        self.update_status(f"{len(events)} {translator.tr('update_time').lower()}")
+        self.table_stack.setCurrentWidget(self.table)
+        if self.filter_model.matches is not None:
+            self.apply_search()
+        self.update_status(f"{count} {translator.tr('update_time').lower()}")
 
     def show_empty_state(self):
-        self.table.setRowCount(1)
-        item = QTableWidgetItem(translator.tr("no_data"))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        item.setForeground(QColor("#666666"))
-        font = QFont("Segoe UI", 16, QFont.Weight.Medium)
-        item.setFont(font)
-        self.table.setItem(0, 0, item)
-        self.table.setSpan(0, 0, 1, 8)
+        self.empty_label.setText(translator.tr("no_data"))
+        self.table_stack.setCurrentWidget(self.empty_label)
 
     def show_error(self, msg):
         self.update_status(translator.tr("network_error"))
@@ -1257,27 +1897,42 @@ class LiveSportsApp(QMainWindow):
     def update_progress(self, value):
         pass
 
+    def update_schedule(self, schedule):
+        self.schedules[(schedule["sport"], schedule["league"])] = schedule
+        self.show_schedule()
+
+    def show_schedule(self):
+        schedule = self.schedules.get(self.view_key()) or self.schedules.get((self.current_sport, None))
+        if schedule:
+            self.interval_label.setText(translator.format("poll_interval", interval=format_interval(schedule["interval"])))
+            self.interval_label.setToolTip(schedule["reason"])
+
+    def update_poll_stats(self, stats):
+        self.status_label.setToolTip(" | ".join(f"{name}: {count}" for name, count in stats.items()))
+
     def change_language(self, index):
         lang_code = self.lang_combo.currentData()
         if translator.set_language(lang_code):
             self.retranslate_ui()
             self.apply_language_direction()
+            if self.filter_model.matches is not None:
+                self.apply_search()
             self.db.set_setting("language", lang_code)
-            self.start_worker()
 
     def retranslate_ui(self):
         self.setWindowTitle(translator.tr("app_name"))
-        self.sport_combo.clear()
-        for sport in SPORT_MAPPING.keys():
-            self.sport_combo.addItem(translator.tr(sport), SPORT_MAPPING[sport]["api"])
-        self.table.setHorizontalHeaderLabels([
-            translator.tr("league"), translator.tr("home"), translator.tr("score"),
-            translator.tr("away"), translator.tr("status"), translator.tr("time"),
-            translator.tr("favorite"), translator.tr("update_time")
-        ])
+        # Relabel in place: rebuilding the combo would reset the selected sport
+        sports = translator.tables.sports
+        for i in range(self.sport_combo.count()):
+            self.sport_combo.setItemText(i, sports[self.sport_combo.itemData(i)])
+        self.league_combo.setItemText(0, translator.tr("all_leagues"))
+        self.events_model.retranslate()
+        self.show_schedule()
         self.refresh_btn.setText(translator.tr("refresh"))
         self.auto_update_cb.setText(translator.tr("auto_update"))
+        self.favorites_first_cb.setText(translator.tr("favorites_first"))
         self.search_edit.setPlaceholderText(translator.tr("search"))
+        self.debug_panel.setWindowTitle(translator.tr("debug_mode"))
 
     def apply_language_direction(self):
         direction = translator.get_direction()
@@ -1314,63 +1969,207 @@ class LiveSportsApp(QMainWindow):
         return """
             QWidget { background: #1E1E1E; color: #FFFFFF; }
             QMainWindow { background: #2D2D2D; }
-            QTableWidget { background: #2D2D2D; color: #FFFFFF; }
+            QTableView { background: #2D2D2D; color: #FFFFFF; }
             QLineEdit { background: #3D3D3D; color: #FFFFFF; border: 1px solid #555555; }
         """
 
     def get_red_theme(self):
         return """
             QWidget { background: #2B0000; color: #FFD1D1; }
-            QTableWidget { background: #3F0000; color: #FFFFFF; }
+            QTableView { background: #3F0000; color: #FFFFFF; }
             QHeaderView::section { background: #D40000; }
         """
 
     def get_blue_theme(self):
         return """
             QWidget { background: #001F3F; color: #A0D8FF; }
-            QTableWidget { background: #003366; color: #FFFFFF; }
+            QTableView { background: #003366; color: #FFFFFF; }
             QHeaderView::section { background: #0078D4; }
         """
 
     def on_sport_changed(self):
-        self.start_worker()
+        sport = self.sport_combo.currentData()
+        if sport is None or sport == self.current_sport:
+            return
+        self.set_league(None)
+        self.current_sport = sport
+        data = self.snapshots.get((sport, None))
+        self.update_league_choices(data["leagues"] if data else [])
+        self.show_feed()
+
+    def on_league_changed(self):
+        self.set_league(self.league_combo.currentData() or None)
+        self.show_feed()
+
+    def set_league(self, league):
+        if league == self.current_league:
+            return
+        if self.current_league:
+            self.snapshots.pop(self.view_key(), None)
+        if self.worker:
+            if self.current_league:
+                self.worker.unwatch_feed(self.current_sport, self.current_league)
+            if league:
+                self.worker.watch_feed(self.current_sport, league)
+        self.current_league = league
+
+    def update_league_choices(self, leagues):
+        if self.current_league and self.current_league not in leagues:
+            leagues = sorted(leagues + [self.current_league])
+        current = [self.league_combo.itemData(i) for i in range(1, self.league_combo.count())]
+        if current == leagues:
+            return
+        self.league_combo.blockSignals(True)
+        self.league_combo.clear()
+        self.league_combo.addItem(translator.tr("all_leagues"), "")
+        for league in leagues:
+            self.league_combo.addItem(league, league)
+        index = self.league_combo.findData(self.current_league or "")
+        self.league_combo.setCurrentIndex(max(index, 0))
+        self.league_combo.blockSignals(False)
 
     def manual_refresh(self):
-        self.start_worker()
+        if self.worker:
+            self.worker.refresh(self.current_sport, self.current_league)
 
     def toggle_auto_update(self, state):
         self.auto_update = state == Qt.CheckState.Checked.value
+        if not self.worker:
+            return
+        if self.auto_update:
+            self.worker.resume()
+        else:
+            self.worker.pause()
 
     def toggle_favorite(self, event_id):
-        if event_id in self.favorites:
-            self.favorites.remove(event_id)
-            self.db.remove_favorite(event_id)
-        else:
-            self.favorites.add(event_id)
-        self.update_table(self.last_data)
-
-    def filter_table(self, text):
-        for row in range(self.table.rowCount()):
-            show = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    show = True
-                    break
-            self.table.setRowHidden(row, not show)
+        event = self.events_model.event_for(event_id)
+        if event is None:
+            return
+        self.favorites.toggle(event)
+        self.favorites_timer.start()
+        self.events_model.refresh_event(event_id)
+
+    def toggle_favorites_first(self, state):
+        enabled = state == Qt.CheckState.Checked.value
+        self.filter_model.set_favorites_first(enabled)
+        self.db.set_setting("favorites_first", "1" if enabled else "0")
+
+    def apply_search(self):
+        self.filter_model.set_matches(self.events_model.search_index.search(self.search_edit.text(),
+                                                                            translator.tables.search_status))
 
     def export_data(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Export Data", "", "JSON Files (*.json)")
-        if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.last_data, f, ensure_ascii=False, indent=2)
+        data = self.last_data
+        self.start_export(translator.tr("export"), lambda: snapshot_export(data), EXPORT_EVENT_FIELDS)
+
+    def export_history(self):
+        dialog = HistoryRangeDialog(self)
+        if not dialog.exec():
+            return
+        start, end = dialog.time_range()
+        if self.history is None:
+            self.history = HistoryStore(self.db)
+        history = self.history
+        self.start_export(translator.tr("export_history"), lambda: history_export(history, start, end),
+                          EXPORT_HISTORY_FIELDS)
+
+    def start_export(self, title, source, fields):
+        if self.export_worker is not None and self.export_worker.isRunning():
+            return
+        path, selected = QFileDialog.getSaveFileName(self, title, "", ";;".join(EXPORT_FILTERS))
+        if not path:
+            return
+        if not path.endswith(EXPORT_SUFFIXES):
+            path += EXPORT_FILTERS.get(selected, ".json")
+        self.export_worker = ExportWorker(path, source, fields, self.db)
+        self.export_worker.progress.connect(self.update_export_progress)
+        self.export_worker.export_done.connect(self.finish_export)
+        self.export_worker.export_failed.connect(lambda error: self.update_status(translator.tr("export_failed")))
+        self.export_worker.start()
+
+    def update_export_progress(self, done, total):
+        if total:
+            self.update_status(translator.format("export_progress", progress=min(done * 100 // total, 100)))
+
+    def finish_export(self, path, count):
+        logger.info("Exported %d rows to %s", count, path)
+        self.update_status(translator.format("export_done", rows=count))
 
     def import_data(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Import Data", "", "JSON Files (*.json)")
-        if path:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.update_table(data)
+        if self.import_worker is not None and self.import_worker.isRunning():
+            return
+        path, _ = QFileDialog.getOpenFileName(self, translator.tr("import"), "", IMPORT_FILTER)
+        if not path:
+            return
+        self.import_pending.clear()
+        self.import_offset = 0
+        self.import_result = None
+        self.update_table({"events": []})
+        # Live deltas for the view would otherwise reset the table under the rows being imported
+        self.importing = True
+        # Full collections would rescan the growing table after every slice; the rows hold no cycles
+        gc.disable()
+        self.import_worker = ImportWorker(path)
+        self.import_worker.batch_ready.connect(self.queue_import_batch)
+        self.import_worker.import_done.connect(self.finish_import)
+        self.import_worker.import_failed.connect(self.fail_import)
+        self.import_worker.start()
+
+    def queue_import_batch(self, events):
+        self.import_pending.append(events)
+        if not self.import_timer.isActive():
+            self.import_timer.start()
+
+    def fail_import(self, error):
+        self.import_pending.clear()
+        self.import_timer.stop()
+        self.end_import()
+        self.update_status(translator.tr("import_failed"))
+
+    def finish_import(self, imported, skipped):
+        logger.info("Imported %d events from %s, %d skipped", imported, self.import_worker.path, skipped)
+        self.import_result = imported
+        # Completes once the batches still queued have been drained
+        self.import_timer.start()
+
+    def drain_import(self):
+        # Batches go through the same row-diffing path as live deltas, a few per event-loop turn
+        deadline = time.perf_counter() + IMPORT_SLICE_MS / 1000
+        while self.import_pending and time.perf_counter() < deadline:
+            batch = self.import_pending[0]
+            chunk = batch[self.import_offset:self.import_offset + IMPORT_APPEND_ROWS]
+            self.import_offset += IMPORT_APPEND_ROWS
+            if self.import_offset >= len(batch):
+                self.import_pending.popleft()
+                self.import_offset = 0
+                self.import_worker.batch_applied()
+            self.events_model.apply_delta({"added": chunk, "changed": [], "removed": []})
+        if self.events_model.rowCount():
+            self.table_stack.setCurrentWidget(self.table)
+        if self.import_pending:
+            self.update_status(translator.format("import_progress", count=self.events_model.rowCount()))
+            return
+        self.import_timer.stop()
+        if self.import_result is not None:
+            self.end_import()
+            self.last_data = {"events": self.events_model.events(), "timestamp": datetime.now().isoformat()}
+            self.refresh_view()
+            self.update_status(translator.format("import_done", count=self.import_result))
+            self.import_result = None
+
+    def end_import(self):
+        self.importing = False
+        self.imported = True
+        gc.enable()
+
+    def cancel_import(self):
+        # A cancelled worker emits neither done nor failed, so the collector is turned back on here
+        if self.import_worker:
+            self.import_worker.stop()
+        self.import_timer.stop()
+        if self.importing:
+            self.import_pending.clear()
+            self.end_import()
 
     def toggle_fullscreen(self):
         if self.isFullScreen():
@@ -1384,9 +2183,6 @@ class LiveSportsApp(QMainWindow):
                          f"{translator.tr('developer')}: Your Name\n"
                          "© 2025 All rights reserved.")
 
-    def on_table_item_clicked(self, item):
-        pass
-
     def update_status(self, text):
         current_time = datetime.now().strftime("%H:%M:%S")
         self.status_label.setText(f"{text} | {current_time}")
@@ -1395,25 +2191,62 @@ class LiveSportsApp(QMainWindow):
         lang = self.db.get_setting("language", "en")
         translator.set_language(lang)
         self.lang_combo.setCurrentIndex(list(LANGUAGES.keys()).index(lang))
+        self.favorites_first_cb.setChecked(self.db.get_setting("favorites_first", "0") == "1")
+        self.debug_panel.setVisible(self.db.get_setting("debug_mode", "0") == "1")
 
     def closeEvent(self, event):
         if self.worker:
             self.worker.stop()
+        if self.export_worker:
+            self.export_worker.stop()
+        self.cancel_import()
+        if self.recorder:
+            self.recorder.close()
         self.db.set_setting("geometry", self.saveGeometry().toHex().data().decode())
+        self.db.set_setting("debug_mode", "1" if self.debug_panel.isVisible() else "0")
+        self.favorites_timer.stop()
+        self.favorites.flush()
+        self.db.close()
         super().closeEvent(event)
 
 # ====================== Application Entry ======================
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
+def create_application(argv):
+    app = QApplication(argv)
     app.setStyle("Fusion")
     app.setFont(QFont("Segoe UI Variable", 10))
     app.setApplicationName(translator.tr("app_name"))
     app.setApplicationVersion("2.0")
     app.setOrganizationName("YourName")
+    return app
+
+def parse_args(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="live_sports_hub", description="Live sports scores")
+    parser.add_argument("--record", metavar="PATH", help="record every snapshot the worker emits to an NDJSON file")
+    parser.add_argument("--replay", metavar="PATH", help="drive the UI from a recording instead of the network")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier, 0 for as fast as possible")
+    parser.add_argument("--serve", metavar="[HOST:]PORT",
+                        help="republish live snapshots and deltas as Server-Sent Events for other screens")
+    parser.add_argument("--subscribe", metavar="URL",
+                        help="follow another instance's --serve stream (http://HOST:PORT/events) instead of polling")
+    add_metrics_arguments(parser)
+    # Anything left over is handed to Qt (-platform, -style, ...)
+    return parser.parse_known_args(argv)
 
-    ensure_icons()
+if __name__ == "__main__":
+    args, qt_args = parse_args(sys.argv[1:])
+    app = create_application(sys.argv[:1] + qt_args)
 
-    window = LiveSportsApp()
+    server = FanoutServer(*parse_address(args.serve)).start() if args.serve else None
+    window = LiveSportsApp(replay=args.replay, replay_speed=args.speed,
+                           recorder=SnapshotRecorder(args.record) if args.record else None,
+                           subscribe=args.subscribe, server=server)
     window.show()
-    
-    sys.exit(app.exec())
\ No newline at end of file
+    exporter = start_metrics_exporter(args)
+    code = app.exec()
+    if exporter is not None:
+        exporter.stop()
+    if server is not None:
+        server.stop()
+    sys.exit(code)
\ No newline at end of file
@@ -0,0 +1,2170 @@
+import sys
+import os
+import re
+import json
+import codecs
+import math
+import logging
+import hashlib
+import sqlite3
+import threading
+import queue
+import time
+import random
+import tempfile
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from enum import Enum
+
+# ====================== Configuration & Constants ======================
+logger = logging.getLogger(__name__)
+
+# SPORTS_HUB_API_URL points the app at a stand-in such as benchmarks/fake_sportsdb.py
+API_BASE_URL = os.environ.get("SPORTS_HUB_API_URL", "https://www.thesportsdb.com/api/v1/json/3")
+UPDATE_INTERVAL = 5000
+MAX_RETRIES = 5
+CACHE_DURATION = 60
+DEFAULT_DB_PATH = "sports_hub.db"
+
+SPORT_MAPPING = {
+    "football": {"api": "Soccer", "icon": "soccer_ball.png"},
+    "basketball": {"api": "Basketball", "icon": "basketball"},
+    "tennis": {"api": "Tennis", "icon": "tennis"},
+    "volleyball": {"api": "Volleyball", "icon": "volleyball"},
+    "handball": {"api": "Handball", "icon": "handball"}
+}
+
+# ====================== Metrics ======================
+METRICS_PREFIX = "sports_hub_"
+# Seconds; wide enough for both a 1 ms parse and a 30 s retry storm
+METRIC_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+METRICS_WRITE_INTERVAL = 15
+
+def format_labels(labels):
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}" if labels else ""
+
+class Histogram:
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        # Linear interpolation inside the bucket, as Prometheus' histogram_quantile does
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+class MetricsRegistry:
+    # Process-wide counters and histograms keyed by name and labels, rendered in Prometheus text format
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        # Bound methods returning (name, labels, value) counters that are kept elsewhere and read on render
+        self.collectors = []
+
+    def register(self, collector):
+        with self.lock:
+            self.collectors.append(weakref.WeakMethod(collector))
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def collect(self):
+        with self.lock:
+            counters = dict(self.counters)
+            collectors = [ref() for ref in self.collectors]
+            self.collectors = [ref for ref, collector in zip(self.collectors, collectors) if collector is not None]
+        for collector in collectors:
+            if collector is None:
+                continue
+            for name, labels, value in collector():
+                key = (name, tuple(sorted(labels.items())))
+                counters[key] = counters.get(key, 0) + value
+        return counters
+
+    def summary(self):
+        counters = {name + format_labels(labels): value for (name, labels), value in sorted(self.collect().items())}
+        with self.lock:
+            histograms = {name + format_labels(labels): {
+                "count": histogram.count, "sum": histogram.sum,
+                "p50": histogram.quantile(0.5), "p95": histogram.quantile(0.95)
+            } for (name, labels), histogram in sorted(self.histograms.items())}
+        return {"counters": counters, "histograms": histograms}
+
+    def render(self):
+        lines = []
+        counters = self.collect()
+        with self.lock:
+            typed = set()
+            for (name, labels), value in sorted(counters.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {METRICS_PREFIX}{name} counter")
+                lines.append(f"{METRICS_PREFIX}{name}{format_labels(labels)} {value}")
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {METRICS_PREFIX}{name} histogram")
+                cumulative = 0
+                for bound, count in zip(list(histogram.buckets) + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f"{METRICS_PREFIX}{name}_bucket{format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{METRICS_PREFIX}{name}_sum{format_labels(labels)} {histogram.sum:.6f}")
+                lines.append(f"{METRICS_PREFIX}{name}_count{format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Written aside and renamed so a textfile collector never reads half a file
+        temp = f"{path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(temp, path)
+
+metrics = MetricsRegistry()
+
+class MetricsExporter:
+    # Publishes a registry as a Prometheus textfile rewritten every interval and/or on http://127.0.0.1:PORT/metrics
+    def __init__(self, registry=metrics, path=None, port=None, interval=METRICS_WRITE_INTERVAL):
+        self.registry = registry
+        self.path = path
+        self.port = port
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.server = None
+
+    def start(self):
+        if self.path:
+            threading.Thread(target=self.write_loop, name="metrics-file", daemon=True).start()
+        if self.port is not None:
+            from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+            registry = self.registry
+
+            class MetricsHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = registry.render().encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), MetricsHandler)
+            self.server.daemon_threads = True
+            threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        return self
+
+    def write_loop(self):
+        while not self.stopped.wait(self.interval):
+            self.write()
+
+    def write(self):
+        try:
+            self.registry.write(self.path)
+        except OSError as e:
+            logger.warning("Could not write metrics to %s: %s", self.path, e)
+
+    def stop(self):
+        self.stopped.set()
+        if self.path:
+            self.write()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+# ====================== Event Records ======================
+class EventStatus(Enum):
+    SCHEDULED = "Scheduled"
+    LIVE = "Live"
+    HT = "HT"
+    FT = "FT"
+    POSTPONED = "Postponed"
+    CANCELLED = "Cancelled"
+    OTHER = "Other"
+
+STATUS_ALIASES = {
+    "": EventStatus.SCHEDULED, "Scheduled": EventStatus.SCHEDULED, "NS": EventStatus.SCHEDULED,
+    "Not Started": EventStatus.SCHEDULED, "TBD": EventStatus.SCHEDULED,
+    "Live": EventStatus.LIVE, "1H": EventStatus.LIVE, "2H": EventStatus.LIVE, "ET": EventStatus.LIVE,
+    "BT": EventStatus.LIVE, "P": EventStatus.LIVE, "In Progress": EventStatus.LIVE,
+    "HT": EventStatus.HT, "Half Time": EventStatus.HT,
+    "FT": EventStatus.FT, "AET": EventStatus.FT, "PEN": EventStatus.FT, "AOT": EventStatus.FT,
+    "Match Finished": EventStatus.FT,
+    "Postponed": EventStatus.POSTPONED, "PST": EventStatus.POSTPONED, "Match Postponed": EventStatus.POSTPONED,
+    "Cancelled": EventStatus.CANCELLED, "CANC": EventStatus.CANCELLED, "Match Cancelled": EventStatus.CANCELLED,
+    "Abandoned": EventStatus.CANCELLED
+}
+
+def parse_score(value):
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def intern_text(value):
+    return sys.intern(value) if value else ""
+
+class Event:
+    __slots__ = ("event_id", "sport", "league", "home", "away", "home_score", "away_score",
+                 "status", "status_text", "progress", "time", "date")
+
+    def __init__(self, event_id, sport, league, home, away, home_score, away_score,
+                 status_text, progress, time, date):
+        self.event_id = event_id
+        self.sport = intern_text(sport)
+        self.league = intern_text(league)
+        self.home = intern_text(home)
+        self.away = intern_text(away)
+        self.home_score = home_score
+        self.away_score = away_score
+        self.status_text = intern_text(status_text)
+        self.status = STATUS_ALIASES.get(self.status_text, EventStatus.OTHER)
+        self.progress = intern_text(progress)
+        self.time = intern_text(time)
+        self.date = intern_text(date)
+
+    @classmethod
+    def from_api(cls, event):
+        name = event.get("strEvent") or ""
+        teams = name.split(" vs ") if " vs " in name else None
+        return cls(
+            str(event["idEvent"]),
+            event.get("strSport"),
+            event.get("strLeague") or "N/A",
+            event.get("strHomeTeam") or (teams[0] if teams else "Team A"),
+            event.get("strAwayTeam") or (teams[-1] if teams else "Team B"),
+            parse_score(event.get("intHomeScore")),
+            parse_score(event.get("intAwayScore")),
+            event.get("strStatus") or "Scheduled",
+            event.get("strProgress") or event.get("strTime") or "",
+            event.get("strTime"),
+            event.get("dateEvent")
+        )
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+    def to_row(self):
+        return [self.event_id, self.sport, self.league, self.home, self.away, self.home_score,
+                self.away_score, self.status_text, self.progress, self.time, self.date]
+
+    def to_api(self):
+        return {
+            "idEvent": self.event_id,
+            "strEvent": f"{self.home} vs {self.away}",
+            "strSport": self.sport,
+            "strLeague": self.league,
+            "strHomeTeam": self.home,
+            "strAwayTeam": self.away,
+            "intHomeScore": None if self.home_score is None else str(self.home_score),
+            "intAwayScore": None if self.away_score is None else str(self.away_score),
+            "strStatus": self.status_text,
+            "strProgress": self.progress,
+            "strTime": self.time,
+            "dateEvent": self.date
+        }
+
+    def score_text(self):
+        return f"{self.home_score or 0} - {self.away_score or 0}"
+
+    def kickoff(self):
+        # strTime/dateEvent are UTC in TheSportsDB; returns epoch seconds or None
+        if not self.date or not self.time:
+            return None
+        try:
+            return datetime.fromisoformat(f"{self.date}T{self.time[:8]}").replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            return None
+
+    def __eq__(self, other):
+        if not isinstance(other, Event):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in Event.__slots__)
+
+    def __repr__(self):
+        return f"Event({self.event_id}, {self.home} {self.score_text()} {self.away}, {self.status_text})"
+
+def encode_snapshot_item(value):
+    # json.dumps default hook: events are cached as compact positional rows
+    if isinstance(value, Event):
+        return value.to_row()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def decode_snapshot(data):
+    # Older caches hold raw API dicts, newer ones Event.to_row() lists
+    events = [Event.from_api(item) if isinstance(item, dict) else Event.from_row(item)
+              for item in data.get("events") or []]
+    return dict(data, events=events)
+
+def events_from_api(items):
+    # Shared by live polls and imports: a malformed item is dropped instead of failing its whole batch
+    try:
+        return [Event.from_api(item) for item in items]
+    except (KeyError, TypeError, AttributeError):
+        events = []
+        for item in items:
+            try:
+                events.append(Event.from_api(item))
+            except (KeyError, TypeError, AttributeError):
+                logger.debug("Skipping malformed event: %r", item)
+        return events
+
+def export_snapshot(data):
+    return dict(data, events=[event.to_api() for event in data.get("events") or []])
+
+def tag_snapshot(data, sport, league):
+    return dict(data, sport=sport, league=league, leagues=sorted({event.league for event in data.get("events", [])}))
+
+# ====================== In-Memory Cache ======================
+MEMORY_CACHE_ENTRIES = 64
+MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+
+class MemoryCache:
+    def __init__(self, max_entries=MEMORY_CACHE_ENTRIES, max_bytes=MEMORY_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, max_age):
+        # Values are shared with every caller and must be treated as read-only
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if time.time() - entry[2] < max_age:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self.entries[key]
+                self.total_bytes -= entry[1]
+                self.expirations += 1
+            self.misses += 1
+        return None
+
+    def put(self, key, value, size, stored_at=None):
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size, time.time() if stored_at is None else stored_at)
+            self.total_bytes += size
+            while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+                _, (_, evicted_size, _) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+# ====================== Database Manager ======================
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+DB_SYNCHRONOUS = "NORMAL"
+DB_STATEMENT_CACHE = 128
+
+class ConnectionManager:
+    def __init__(self, db_path, synchronous=DB_SYNCHRONOUS, cached_statements=DB_STATEMENT_CACHE):
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown synchronous level: {synchronous}")
+        self.db_path = db_path
+        self.synchronous = synchronous
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+
+    def connection(self):
+        # One long-lived connection per thread; sqlite3 keeps its prepared statements cached by SQL text
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def release(self):
+        # For short-lived threads: closes the calling thread's connection instead of keeping it until close()
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            self.local.conn = None
+            with self.lock:
+                self.connections.remove(conn)
+            conn.close()
+
+    def close(self):
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections.clear()
+        self.local = threading.local()
+
+class DatabaseManager:
+    def __init__(self, db_path=DEFAULT_DB_PATH, synchronous=DB_SYNCHRONOUS,
+                 cache_entries=MEMORY_CACHE_ENTRIES, cache_bytes=MEMORY_CACHE_BYTES):
+        self.db_path = db_path
+        self.connections = ConnectionManager(db_path, synchronous)
+        self.memory_cache = MemoryCache(cache_entries, cache_bytes)
+        self.db_cache_hits = 0
+        self.db_cache_misses = 0
+        # Lookups are counted here and only read by the registry, so a lookup never takes the registry lock
+        metrics.register(self.cache_metrics)
+        self.init_db()
+
+    def init_db(self):
+        with self.connections.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS favorites (
+                    event_id TEXT PRIMARY KEY,
+                    sport TEXT,
+                    home TEXT,
+                    away TEXT,
+                    league TEXT,
+                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    data TEXT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+    def close(self):
+        self.connections.close()
+
+    def get_setting(self, key, default=None):
+        cursor = self.connections.connection().execute("SELECT value FROM settings WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        return row[0] if row else default
+
+    def set_setting(self, key, value):
+        with self.connections.connection() as conn:
+            conn.execute("""
+                INSERT INTO settings (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """, (key, value))
+
+    def add_favorite(self, event):
+        with self.connections.connection() as conn:
+            conn.execute("""
+                INSERT OR IGNORE INTO favorites (event_id, sport, home, away, league)
+                VALUES (?, ?, ?, ?, ?)
+            """, (event.event_id, event.sport, event.home, event.away, event.league))
+
+    def remove_favorite(self, event_id):
+        with self.connections.connection() as conn:
+            conn.execute("DELETE FROM favorites WHERE event_id = ?", (event_id,))
+
+    def get_favorites(self):
+        cursor = self.connections.connection().execute("SELECT * FROM favorites ORDER BY added_at DESC")
+        return cursor.fetchall()
+
+    def get_favorite_ids(self):
+        return [row[0] for row in self.connections.connection().execute("SELECT event_id FROM favorites")]
+
+    def save_favorites(self, added, removed):
+        with self.connections.connection() as conn:
+            conn.executemany("DELETE FROM favorites WHERE event_id = ?", [(event_id,) for event_id in removed])
+            conn.executemany("""
+                INSERT OR IGNORE INTO favorites (event_id, sport, home, away, league)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(event.event_id, event.sport, event.home, event.away, event.league) for event in added])
+
+    def set_cache(self, key, data, encoder=None):
+        text = json.dumps(data, default=encoder)
+        with self.connections.connection() as conn:
+            conn.execute("""
+                INSERT INTO cache (key, data) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET data = excluded.data, timestamp = CURRENT_TIMESTAMP
+            """, (key, text))
+        self.memory_cache.put(key, data, len(text))
+
+    def get_cache(self, key, max_age=CACHE_DURATION, decoder=None):
+        cached = self.memory_cache.get(key, max_age)
+        if cached is not None:
+            return cached
+
+        # CURRENT_TIMESTAMP is UTC, so compare epoch seconds rather than naive local datetimes
+        cursor = self.connections.connection().execute("""
+            SELECT data, CAST(strftime('%s', timestamp) AS INTEGER) FROM cache WHERE key = ?
+        """, (key,))
+        row = cursor.fetchone()
+        if row and time.time() - row[1] < max_age:
+            self.db_cache_hits += 1
+            data = json.loads(row[0])
+            if decoder:
+                data = decoder(data)
+            self.memory_cache.put(key, data, len(row[0]), row[1])
+            return data
+        self.db_cache_misses += 1
+        return None
+
+    def cache_stats(self):
+        stats = self.memory_cache.stats()
+        stats["db_hits"] = self.db_cache_hits
+        stats["db_misses"] = self.db_cache_misses
+        return stats
+
+    def cache_metrics(self):
+        return [("cache_lookups_total", {"tier": "memory"}, self.memory_cache.hits),
+                ("cache_lookups_total", {"tier": "sqlite"}, self.db_cache_hits),
+                ("cache_lookups_total", {"tier": "miss"}, self.db_cache_misses)]
+
+# ====================== Favorites Store ======================
+FAVORITES_FLUSH_MS = 2000
+
+class FavoritesStore:
+    def __init__(self, db):
+        self.db = db
+        self.ids = set(db.get_favorite_ids())
+        self.pending_add = {}
+        self.pending_remove = set()
+
+    def __contains__(self, event_id):
+        return event_id in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def toggle(self, event):
+        event_id = event.event_id
+        if event_id in self.ids:
+            self.ids.discard(event_id)
+            self.pending_add.pop(event_id, None)
+            self.pending_remove.add(event_id)
+            return False
+        self.ids.add(event_id)
+        self.pending_remove.discard(event_id)
+        self.pending_add[event_id] = event
+        return True
+
+    def flush(self):
+        if not self.pending_add and not self.pending_remove:
+            return
+        # Toggles are written behind in one transaction instead of one commit per click
+        self.db.save_favorites(list(self.pending_add.values()), list(self.pending_remove))
+        self.pending_add.clear()
+        self.pending_remove.clear()
+
+# ====================== History Archive ======================
+HISTORY_FIELDS = ("home_score", "away_score", "status_text", "progress")
+HISTORY_ALL_FIELDS = (1 << len(HISTORY_FIELDS)) - 1
+
+class HistoryStore:
+    # Append-only score timeline. Each row holds only the fields that changed since the event's previous
+    # row, flagged in a bitmask; text is interned into history_names and timestamps are epoch milliseconds.
+    def __init__(self, db):
+        self.connections = db.connections
+        self.lock = threading.Lock()
+        self.init_db()
+        self.names = self.load_names()
+        self.event_refs = {}
+        # Last written (ts, values) per event; the first record of an event in a process is a full keyframe
+        self.last = {}
+
+    def init_db(self):
+        with self.connections.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS history_names (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS history_events (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT NOT NULL UNIQUE,
+                    sport INTEGER,
+                    league INTEGER,
+                    home INTEGER,
+                    away INTEGER
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS history (
+                    event INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    fields INTEGER NOT NULL,
+                    home_score INTEGER,
+                    away_score INTEGER,
+                    status INTEGER,
+                    progress INTEGER,
+                    PRIMARY KEY (event, ts)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS history_time ON history (ts)")
+
+    def load_names(self):
+        return dict(self.connections.connection().execute("SELECT name, id FROM history_names"))
+
+    def name_id(self, conn, name):
+        name_id = self.names.get(name)
+        if name_id is None:
+            name_id = conn.execute("""
+                INSERT INTO history_names (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = excluded.name RETURNING id
+            """, (name,)).fetchone()[0]
+            self.names[name] = name_id
+        return name_id
+
+    def event_ref(self, conn, event):
+        ref = self.event_refs.get(event.event_id)
+        if ref is None:
+            names = [self.name_id(conn, value) for value in (event.sport, event.league, event.home, event.away)]
+            ref = conn.execute("""
+                INSERT INTO history_events (key, sport, league, home, away) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET sport = excluded.sport, league = excluded.league,
+                    home = excluded.home, away = excluded.away
+                RETURNING id
+            """, (event.event_id, *names)).fetchone()[0]
+            self.event_refs[event.event_id] = ref
+        return ref
+
+    def record(self, events, timestamp=None):
+        # One transaction per call; returns the number of rows written
+        stamp = int((time.time() if timestamp is None else timestamp) * 1000)
+        with self.lock:
+            conn = self.connections.connection()
+            written = {}
+            rows = []
+            try:
+                with conn:
+                    for event in events:
+                        ref = self.event_ref(conn, event)
+                        values = (event.home_score, event.away_score,
+                                  self.name_id(conn, event.status_text), self.name_id(conn, event.progress))
+                        previous = written.get(ref) or self.last.get(ref)
+                        if previous is None:
+                            ts, mask = stamp, HISTORY_ALL_FIELDS
+                        else:
+                            mask = 0
+                            for bit, (value, old) in enumerate(zip(values, previous[1])):
+                                if value != old:
+                                    mask |= 1 << bit
+                            if not mask:
+                                continue
+                            # Keeps (event, ts) unique when polls land in the same millisecond
+                            ts = max(stamp, previous[0] + 1)
+                        written[ref] = (ts, values)
+                        rows.append((ref, ts, mask, *(value if mask >> bit & 1 else None
+                                                      for bit, value in enumerate(values))))
+                    conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            except sqlite3.Error:
+                # Ids handed out inside the rolled-back transaction no longer exist
+                self.names = self.load_names()
+                self.event_refs.clear()
+                raise
+            self.last.update(written)
+        metrics.inc("history_rows_total", len(rows))
+        return len(rows)
+
+    def timeline(self, event_id, start=None, end=None):
+        # Rows are folded forward from the event's first record so every entry is a full state
+        cursor = self.connections.connection().execute("""
+            SELECT h.ts, h.fields, h.home_score, h.away_score, s.name, p.name
+            FROM history_events e
+            JOIN history h ON h.event = e.id
+            LEFT JOIN history_names s ON s.id = h.status
+            LEFT JOIN history_names p ON p.id = h.progress
+            WHERE e.key = ? AND h.ts <= ?
+            ORDER BY h.ts
+        """, (event_id, (2 ** 63 - 1) if end is None else int(end * 1000)))
+        state = dict.fromkeys(HISTORY_FIELDS)
+        start = None if start is None else int(start * 1000)
+        entries = []
+        for ts, mask, *values in cursor:
+            changed = []
+            for bit, (field, value) in enumerate(zip(HISTORY_FIELDS, values)):
+                if mask >> bit & 1:
+                    state[field] = value
+                    changed.append(field)
+            if start is None or ts >= start:
+                entries.append(dict(state, timestamp=ts / 1000, changed=changed))
+        return entries
+
+    def count_changes(self, start, end=None):
+        return self.connections.connection().execute(
+            "SELECT COUNT(*) FROM history WHERE ts BETWEEN ? AND ?",
+            (int(start * 1000), (2 ** 63 - 1) if end is None else int(end * 1000))).fetchone()[0]
+
+    def changes(self, start, end=None):
+        # Every change in [start, end] in time order, holding only the fields that changed
+        cursor = self.connections.connection().execute("""
+            SELECT e.key, sport.name, league.name, home.name, away.name,
+                   h.ts, h.fields, h.home_score, h.away_score, s.name, p.name
+            FROM history h
+            JOIN history_events e ON e.id = h.event
+            LEFT JOIN history_names sport ON sport.id = e.sport
+            LEFT JOIN history_names league ON league.id = e.league
+            LEFT JOIN history_names home ON home.id = e.home
+            LEFT JOIN history_names away ON away.id = e.away
+            LEFT JOIN history_names s ON s.id = h.status
+            LEFT JOIN history_names p ON p.id = h.progress
+            WHERE h.ts BETWEEN ? AND ?
+            ORDER BY h.ts
+        """, (int(start * 1000), (2 ** 63 - 1) if end is None else int(end * 1000)))
+        for key, sport, league, home, away, ts, mask, *values in cursor:
+            change = {"event_id": key, "sport": sport, "league": league, "home": home, "away": away,
+                      "timestamp": ts / 1000}
+            for bit, (field, value) in enumerate(zip(HISTORY_FIELDS, values)):
+                if mask >> bit & 1:
+                    change[field] = value
+            yield change
+
+# ====================== Event Delta Engine ======================
+class EventDeltaEngine:
+    def __init__(self):
+        self.sequence = 0
+        self.previous = {}
+
+    def diff(self, events, timestamp=None):
+        current = {event.event_id: event for event in events}
+        added, changed, score_changed, status_changed = [], [], [], []
+        for event_id, event in current.items():
+            old = self.previous.get(event_id)
+            if old is None:
+                added.append(event)
+            elif old != event:
+                changed.append(event)
+                if old.home_score != event.home_score or old.away_score != event.away_score:
+                    score_changed.append(event_id)
+                if old.status_text != event.status_text:
+                    status_changed.append(event_id)
+        removed = [event_id for event_id in self.previous if event_id not in current]
+        self.previous = current
+
+        # The first changeset of a feed always goes out so consumers can drop stale rows
+        reset = self.sequence == 0
+        if not (reset or added or removed or changed):
+            return None
+        self.sequence += 1
+        return {
+            "seq": self.sequence,
+            "reset": reset,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+            "score_changed": score_changed,
+            "status_changed": status_changed
+        }
+
+# ====================== Poll Scheduler ======================
+LIVE_POLL_INTERVAL = UPDATE_INTERVAL / 1000
+FINISHED_POLL_INTERVAL = 300
+IDLE_POLL_INTERVAL = 900
+KICKOFF_LEAD = 120
+STALE_KICKOFF = 3 * 3600
+POLL_JITTER = 0.1
+
+class PollScheduler:
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def interval_for(self, events, now=None):
+        now = time.time() if now is None else now
+        upcoming = None
+        for event in events:
+            if event.status is EventStatus.LIVE or event.status is EventStatus.HT:
+                return LIVE_POLL_INTERVAL, "live"
+            if event.status is EventStatus.SCHEDULED:
+                kickoff = event.kickoff()
+                # Matches the API never flipped to live stop counting after a few hours
+                if kickoff is not None and kickoff > now - STALE_KICKOFF and (upcoming is None or kickoff < upcoming):
+                    upcoming = kickoff
+        if upcoming is not None:
+            return min(max(upcoming - KICKOFF_LEAD - now, LIVE_POLL_INTERVAL), IDLE_POLL_INTERVAL), "kickoff"
+        if events:
+            return FINISHED_POLL_INTERVAL, "finished"
+        return IDLE_POLL_INTERVAL, "idle"
+
+    def backoff_for(self, failures):
+        return min(LIVE_POLL_INTERVAL * 2 ** failures, IDLE_POLL_INTERVAL), "retry"
+
+    def jitter(self, interval):
+        return interval * self.random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+def format_interval(seconds):
+    return f"{round(seconds)}s" if seconds < 90 else f"{round(seconds / 60)}m"
+
+# ====================== Streaming JSON ======================
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What may follow a complete value; anything else means it was cut short by the end of a chunk
+JSON_VALUE_END = frozenset(" \t\n\r,:]}")
+
+class JSONStreamReader:
+    # Decodes one JSON value at a time from byte chunks, keeping only the unread tail of the text
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.text = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.done = False
+
+    def fill(self):
+        if self.done:
+            raise ValueError("JSON stream ended unexpectedly")
+        chunk = next(self.chunks, None)
+        self.done = chunk is None
+        self.buffer = self.buffer[self.pos:] + self.text.decode(chunk or b"", final=self.done)
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            self.pos = JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            self.fill()
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.done:
+                    raise
+                self.fill()
+                continue
+            # A number may continue in the next chunk; "1." and "1.5e" decode early as 1 and 1.5, before the "." or "e"
+            if not self.done and (end == len(self.buffer) or self.buffer[end] not in JSON_VALUE_END):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+def iter_json_array(chunks, key="events"):
+    # Yields the items of document[key] as they arrive; a missing key or null yields nothing
+    reader = JSONStreamReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name != key or reader.peek() == "n":
+            reader.value()
+        else:
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(",]") == "]":
+                        break
+        if reader.expect(",}") == "}":
+            return
+
+# ====================== Synthetic Data ======================
+SYNTHETIC_STATUS_MIX = (("Scheduled", 0.45), ("Live", 0.22), ("HT", 0.04), ("FT", 0.25),
+                        ("Postponed", 0.02), ("Cancelled", 0.02))
+# Scoring chances per team per minute, points per score and regulation minutes
+SYNTHETIC_SCORING = {
+    "Soccer": (0.015, 1, 90),
+    "Basketball": (1.1, 2, 48),
+    "Tennis": (0.012, 1, 150),
+    "Volleyball": (0.012, 1, 120),
+    "Handball": (0.45, 1, 60)
+}
+SYNTHETIC_HALF_TIME = 15
+SYNTHETIC_CITIES = ("North", "South", "East", "West", "Port", "Lake", "River", "Mount", "Old", "New",
+                    "Royal", "Union", "Central", "Harbor", "Forest", "Valley")
+SYNTHETIC_CLUBS = ("City", "United", "Rovers", "Athletic", "Wanderers", "Rangers", "Albion", "Sporting",
+                   "Dynamo", "Olympic", "Stars", "Eagles")
+
+class SyntheticDay:
+    # Seeded day of N fixtures across M leagues (at least one per sport); advance() moves every clock forward,
+    # so statuses and scores evolve the way a real day does. The same seed always replays the same day.
+    def __init__(self, events=100, leagues=10, sports=None, seed=0, date="2026-01-01"):
+        self.rng = random.Random(seed)
+        self.date = date
+        sports = list(sports or [info["api"] for info in SPORT_MAPPING.values()])
+        self.leagues = [(sports[i % len(sports)], f"{sports[i % len(sports)]} League {i // len(sports) + 1}")
+                        for i in range(max(leagues, len(sports)))]
+        self.fixtures = [self.fixture(i) for i in range(events)]
+
+    def fixture(self, index):
+        rng = self.rng
+        sport, league = self.leagues[index % len(self.leagues)]
+        rate, points, duration = SYNTHETIC_SCORING.get(sport, SYNTHETIC_SCORING["Soccer"])
+        status = rng.choices([name for name, _ in SYNTHETIC_STATUS_MIX], [weight for _, weight in SYNTHETIC_STATUS_MIX])[0]
+        if status == "Scheduled":
+            minute = -rng.randint(5, 600)
+        elif status == "Live":
+            minute = rng.randint(1, duration - 1)
+        elif status in ("HT", "FT"):
+            minute = duration // 2 if status == "HT" else duration
+        else:
+            minute = 0
+        home, away = rng.sample(SYNTHETIC_CITIES, 2)
+        fixture = {
+            "minute": minute,
+            "break_left": SYNTHETIC_HALF_TIME if status == "HT" else 0,
+            "had_break": status in ("HT", "FT") or status == "Live" and minute > duration // 2,
+            "api": {
+                "idEvent": str(1000000 + index),
+                "strEvent": "",
+                "strSport": sport,
+                "strLeague": league,
+                "strHomeTeam": f"{home} {rng.choice(SYNTHETIC_CLUBS)}",
+                "strAwayTeam": f"{away} {rng.choice(SYNTHETIC_CLUBS)}",
+                "intHomeScore": None,
+                "intAwayScore": None,
+                "strStatus": status,
+                "strProgress": "",
+                "strTime": f"{rng.randint(10, 22):02d}:{rng.choice(('00', '15', '30', '45'))}:00",
+                "dateEvent": self.date
+            }
+        }
+        api = fixture["api"]
+        api["strEvent"] = f"{api['strHomeTeam']} vs {api['strAwayTeam']}"
+        if status in ("Live", "HT", "FT"):
+            api["intHomeScore"] = str(self.scores(rate * max(minute, 0)) * points)
+            api["intAwayScore"] = str(self.scores(rate * max(minute, 0)) * points)
+        self.label(fixture)
+        return fixture
+
+    def scores(self, expected):
+        # Poisson draw: exact (Knuth) for the per-minute rates, normal approximation for whole-game backfills
+        if expected <= 0:
+            return 0
+        if expected > 30:
+            return max(0, round(self.rng.gauss(expected, expected ** 0.5)))
+        limit, count, product = math.exp(-expected), 0, self.rng.random()
+        while product > limit:
+            count += 1
+            product *= self.rng.random()
+        return count
+
+    def label(self, fixture):
+        api = fixture["api"]
+        status = api["strStatus"]
+        api["strProgress"] = f"{fixture['minute']}'" if status == "Live" else "" if status == "Scheduled" else status
+
+    def advance(self, minutes=1):
+        for fixture in self.fixtures:
+            api = fixture["api"]
+            status = api["strStatus"]
+            if status in ("FT", "Postponed", "Cancelled"):
+                continue
+            rate, points, duration = SYNTHETIC_SCORING.get(api["strSport"], SYNTHETIC_SCORING["Soccer"])
+            if status == "Scheduled":
+                fixture["minute"] += minutes
+                if fixture["minute"] < 0:
+                    continue
+                api["strStatus"] = status = "Live"
+                api["intHomeScore"] = api["intAwayScore"] = "0"
+            if status == "HT":
+                fixture["break_left"] -= minutes
+                if fixture["break_left"] > 0:
+                    continue
+                api["strStatus"] = "Live"
+            else:
+                start = fixture["minute"]
+                end = min(start + minutes, duration)
+                if not fixture["had_break"] and end >= duration // 2:
+                    end = duration // 2
+                    fixture["had_break"] = True
+                    fixture["break_left"] = SYNTHETIC_HALF_TIME
+                    api["strStatus"] = "HT"
+                elif end >= duration:
+                    api["strStatus"] = "FT"
+                elapsed = max(end - max(start, 0), 0)
+                api["intHomeScore"] = str(int(api["intHomeScore"] or 0) + self.scores(rate * elapsed) * points)
+                api["intAwayScore"] = str(int(api["intAwayScore"] or 0) + self.scores(rate * elapsed) * points)
+                fixture["minute"] = end
+            self.label(fixture)
+
+    def payload(self):
+        # API-shaped copies, as eventsday.php would return them
+        return {"events": [dict(fixture["api"]) for fixture in self.fixtures]}
+
+    def snapshot(self):
+        return {"events": [Event.from_api(fixture["api"]) for fixture in self.fixtures],
+                "timestamp": datetime.now().isoformat()}
+
+# ====================== Feed Poller ======================
+MAX_PARALLEL_FEEDS = 8
+REQUEST_TIMEOUT = (5, 15)
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_BATCH_EVENTS = 250
+# A warm feed's body is held in memory up to this size while its hash is checked, then on disk
+STREAM_SPOOL_BYTES = 1024 * 1024
+
+class PollCancelled(Exception):
+    pass
+
+_retry_class = None
+
+def cancellable_retry(cancel_event, **kwargs):
+    # urllib3 is imported on first use so headless startup doesn't pay for the HTTP stack
+    global _retry_class
+    if _retry_class is None:
+        from urllib3.util.retry import Retry
+
+        class CancellableRetry(Retry):
+            # Backoff sleeps wait on the poller's stop event instead of time.sleep, so stopping never waits out a retry storm
+            def __init__(self, *args, cancel_event=None, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.cancel_event = cancel_event or threading.Event()
+
+            def new(self, **kw):
+                retry = super().new(**kw)
+                retry.cancel_event = self.cancel_event
+                return retry
+
+            def sleep(self, response=None):
+                delay = self.get_retry_after(response) if self.respect_retry_after_header and response else None
+                if not delay:
+                    delay = self.get_backoff_time()
+                metrics.inc("retries_total", reason=str(response.status) if response else "connection")
+                if delay > 0 and self.cancel_event.wait(delay):
+                    raise PollCancelled()
+
+        _retry_class = CancellableRetry
+    return _retry_class(cancel_event=cancel_event, **kwargs)
+
+def tracked_pool_classes(owner):
+    # Connections register with owner while open, so it can shut down a socket blocked on the server
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def tracked(pool_class):
+        class TrackedConnection(pool_class.ConnectionCls):
+            def connect(self):
+                super().connect()
+                owner.track_connection(self)
+
+            def close(self):
+                owner.untrack_connection(self)
+                super().close()
+
+        return type(pool_class.__name__, (pool_class,), {"ConnectionCls": TrackedConnection})
+
+    return {"http": tracked(HTTPConnectionPool), "https": tracked(HTTPSConnectionPool)}
+
+class FeedState:
+    def __init__(self, sport, league=None):
+        self.sport = sport
+        self.league = league
+        self.delta_engine = EventDeltaEngine()
+        self.etag = None
+        self.last_modified = None
+        self.payload_hash = None
+        self.events = []
+        self.failures = 0
+        self.next_poll = 0.0
+        self.in_flight = None
+        self.refresh_requested = False
+        self.active = True
+
+    @property
+    def key(self):
+        return (self.sport, self.league)
+
+    def cache_key(self, day=None):
+        return f"events_{self.sport}_{self.league or 'all'}_{day or datetime.now().strftime('%Y-%m-%d')}"
+
+    def forget_payload(self):
+        self.etag = self.last_modified = self.payload_hash = None
+
+def generate_mock_data(sport="Soccer"):
+    teams = [
+        ("Real Madrid", "Barcelona"), ("Manchester United", "Liverpool"),
+        ("Bayern Munich", "Dortmund"), ("Juventus", "Inter Milan"),
+        ("PSG", "Marseille"), ("Chelsea", "Arsenal")
+    ]
+    events = []
+    for i in range(6):
+        home, away = random.choice(teams)
+        score_home = random.randint(0, 4)
+        score_away = random.randint(0, 4)
+        status = random.choice(["Live", "HT", "FT", "Scheduled"])
+        minute = random.randint(1, 90) if status == "Live" else 45 if status == "HT" else 90
+        events.append({
+            "idEvent": f"{sport.lower()}-{1000 + i}",
+            "strEvent": f"{home} vs {away}",
+            "strLeague": random.choice(["La Liga", "Premier League", "Bundesliga", "Serie A"]),
+            "strSport": sport,
+            "strStatus": status,
+            "intHomeScore": str(score_home),
+            "intAwayScore": str(score_away),
+            "strProgress": f"{minute}'" if status == "Live" else status,
+            "strHomeTeam": home,
+            "strAwayTeam": away,
+            "dateEvent": datetime.now().strftime("%Y-%m-%d"),
+            "strTime": f"{random.randint(12, 23):02d}:00"
+        })
+    return {"events": [Event.from_api(event) for event in events], "timestamp": datetime.now().isoformat()}
+
+def ignore(*args):
+    pass
+
+class FeedPoller:
+    def __init__(self, feeds=None, use_cache=True, db=None, offline=False, history=None, on_data=ignore,
+                 on_delta=ignore, on_progress=ignore, on_stats=ignore, on_schedule=ignore):
+        # Feeds are owned by the thread running run(); other threads only talk to it through commands
+        self.commands = queue.Queue()
+        self.cancelled = threading.Event()
+        self.scheduler = PollScheduler()
+        self.feeds = {}
+        self.paused = False
+        if feeds is None:
+            feeds = [(info["api"], None) for info in SPORT_MAPPING.values()]
+        for sport, league in feeds:
+            self.watch_feed(sport, league)
+        self.db = db
+        self.use_cache = use_cache and db is not None
+        self.offline = offline
+        self.history = history
+        self.on_data = on_data
+        self.on_delta = on_delta
+        self.on_progress = on_progress
+        self.on_stats = on_stats
+        self.on_schedule = on_schedule
+        self.running = True
+        self.poll_stats = {"processed": 0, "unchanged": 0, "not_modified": 0, "failed": 0}
+        self.stats_lock = threading.Lock()
+        self.session = None
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+
+    def create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        retry = cancellable_retry(self.cancelled, total=MAX_RETRIES, backoff_factor=1,
+                                  status_forcelist=[429, 500, 502, 503, 504])
+        # One pooled session shared by every feed so connections are reused across sports
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_FEEDS, max_retries=retry)
+        adapter.poolmanager.pool_classes_by_scheme = tracked_pool_classes(self)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": "LiveSportsHub/2.0 (+https://github.com/yourname/livesportshub)"
+        })
+        return session
+
+    def watch_feed(self, sport, league=None):
+        self.commands.put(("watch", (sport, league)))
+
+    def unwatch_feed(self, sport, league=None):
+        self.commands.put(("unwatch", (sport, league)))
+
+    def refresh(self, sport=None, league=None):
+        self.commands.put(("refresh", None if sport is None else (sport, league)))
+
+    def pause(self):
+        self.commands.put(("pause", None))
+
+    def resume(self):
+        self.commands.put(("resume", None))
+
+    def track_connection(self, connection):
+        with self.connections_lock:
+            self.connections.add(connection)
+        # A retry can reconnect after stop() has shut the other sockets down
+        if self.cancelled.is_set():
+            raise PollCancelled()
+
+    def untrack_connection(self, connection):
+        with self.connections_lock:
+            self.connections.discard(connection)
+
+    def stop(self):
+        import socket
+
+        self.cancelled.set()
+        self.commands.put(("stop", None))
+        with self.connections_lock:
+            connections = list(self.connections)
+        # Wakes feed threads blocked on a request, which would otherwise hold up interpreter exit until the timeout
+        for connection in connections:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except (AttributeError, OSError):
+                pass
+
+    def run(self):
+        if self.session is None and not self.offline:
+            # Built on the polling thread so a GUI caller never blocks on importing the HTTP stack
+            self.session = self.create_session()
+        pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_FEEDS, thread_name_prefix="feed")
+        try:
+            while self.running:
+                now = time.monotonic()
+                for feed in self.feeds.values():
+                    # A manual refresh goes through even while auto-update is paused
+                    if feed.in_flight is None and (feed.refresh_requested or not self.paused and feed.next_poll <= now):
+                        feed.refresh_requested = False
+                        feed.in_flight = pool.submit(self.poll_feed, feed)
+                        feed.in_flight.add_done_callback(lambda _, feed=feed: self.commands.put(("done", feed)))
+                try:
+                    command = self.commands.get(timeout=self.next_wakeup(now))
+                except queue.Empty:
+                    continue
+                self.handle_command(*command)
+        finally:
+            # Requests still in flight are abandoned: their feeds are inactive and results are dropped
+            for feed in self.feeds.values():
+                feed.active = False
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def next_wakeup(self, now):
+        if self.paused:
+            return None
+        pending = [feed.next_poll for feed in self.feeds.values() if feed.in_flight is None]
+        return max(min(pending) - now, 0) if pending else None
+
+    def handle_command(self, name, arg):
+        if name == "done":
+            feed = arg
+            try:
+                interval, reason = feed.in_flight.result()
+            except PollCancelled:
+                return
+            except Exception:
+                logger.exception("Feed %s poll crashed", feed.key)
+                interval, reason = self.scheduler.backoff_for(feed.failures + 1)
+            feed.in_flight = None
+            if not feed.active:
+                return
+            if feed.refresh_requested:
+                feed.refresh_requested = False
+                feed.next_poll = 0.0
+            else:
+                feed.next_poll = time.monotonic() + self.scheduler.jitter(interval)
+            if not any(other.in_flight for other in self.feeds.values()):
+                self.on_progress(100)
+            self.on_schedule({"sport": feed.sport, "league": feed.league, "interval": interval, "reason": reason})
+        elif name == "watch":
+            if arg not in self.feeds:
+                feed = FeedState(*arg)
+                self.feeds[arg] = feed
+                if self.use_cache:
+                    cached = self.db.get_cache(feed.cache_key(), decoder=decode_snapshot)
+                    if cached:
+                        self.publish(feed, cached)
+        elif name == "unwatch":
+            feed = self.feeds.pop(arg, None)
+            if feed:
+                feed.active = False
+        elif name == "refresh":
+            for key, feed in self.feeds.items():
+                if arg is None or key == arg:
+                    feed.refresh_requested = True
+        elif name == "pause":
+            self.paused = True
+        elif name == "resume":
+            self.paused = False
+        elif name == "stop":
+            self.running = False
+
+    def poll_feed(self, feed):
+        if self.offline:
+            self.publish(feed, generate_mock_data(feed.sport))
+            return self.scheduler.interval_for(feed.events)
+        try:
+            with metrics.timer("poll_seconds", sport=feed.sport):
+                self.fetch_live_events(feed)
+            feed.failures = 0
+            return self.scheduler.interval_for(feed.events)
+        except PollCancelled:
+            # Stopping is not a feed failure: no backoff and no mock data on the way out
+            raise
+        except Exception as e:
+            logger.debug("Feed %s failed: %s", feed.key, e)
+            # Mock data replaces whatever is on screen, so the next real payload must not be skipped
+            feed.forget_payload()
+            feed.failures += 1
+            self.count_poll("failed")
+            metrics.inc("mock_fallbacks_total", sport=feed.sport)
+            self.publish(feed, generate_mock_data(feed.sport))
+            return self.scheduler.backoff_for(feed.failures)
+
+    def count_poll(self, outcome):
+        with self.stats_lock:
+            self.poll_stats[outcome] += 1
+            stats = dict(self.poll_stats)
+        metrics.inc("polls_total", outcome=outcome)
+        self.on_stats(stats)
+
+    def publish(self, feed, result, archive=False):
+        if not feed.active:
+            return
+        result = tag_snapshot(result, feed.sport, feed.league)
+        feed.events = result["events"]
+        self.on_data(result)
+        delta = feed.delta_engine.diff(result["events"], result.get("timestamp"))
+        if delta:
+            delta["sport"] = feed.sport
+            delta["league"] = feed.league
+            # Lets the receiving thread time signal delivery
+            delta["published_at"] = time.perf_counter()
+            # Only live payloads are archived; cached and mock snapshots would rewrite history
+            if archive and self.history is not None:
+                try:
+                    self.history.record(delta["added"] + delta["changed"])
+                except sqlite3.Error as e:
+                    logger.warning("History write for %s failed: %s", feed.key, e)
+            self.on_delta(delta)
+
+    def fetch_live_events(self, feed):
+        today = datetime.now().strftime("%Y-%m-%d")
+        url = f"{API_BASE_URL}/eventsday.php"
+        params = {"d": today, "s": feed.sport}
+        if feed.league:
+            params["l"] = feed.league
+
+        headers = {}
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+
+        # Up to the response headers: DNS, connect, TLS, server time and any retries in between
+        with metrics.timer("stage_seconds", stage="connect"):
+            response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+        with response:
+            if response.status_code == 304:
+                self.count_poll("not_modified")
+            elif response.status_code == 200:
+                feed.etag = response.headers.get("ETag")
+                feed.last_modified = response.headers.get("Last-Modified")
+                digest = hashlib.blake2b(digest_size=16)
+                stages = dict.fromkeys(("download", "parse", "enrich", "publish"), 0.0)
+                body = self.read_body(response, digest, stages)
+                timestamp = datetime.now().isoformat()
+                if feed.events:
+                    # Rows are already on screen: spool the raw body so an unchanged payload is never parsed,
+                    # and past STREAM_SPOOL_BYTES it waits on disk instead of in memory
+                    with tempfile.SpooledTemporaryFile(STREAM_SPOOL_BYTES) as spool:
+                        for chunk in body:
+                            spool.write(chunk)
+                        metrics.observe("stage_seconds", stages["download"], stage="download")
+                        if digest.digest() == feed.payload_hash:
+                            self.count_poll("unchanged")
+                            return
+                        spool.seek(0)
+                        chunks = iter(lambda: spool.read(STREAM_CHUNK_BYTES), b"")
+                        events = self.stream_events(feed, chunks, timestamp, False, stages)
+                else:
+                    events = self.stream_events(feed, body, timestamp, True, stages)
+                    metrics.observe("stage_seconds", stages["download"], stage="download")
+                metrics.observe("stage_seconds", stages["parse"], stage="parse")
+                metrics.observe("stage_seconds", stages["enrich"], stage="enrich")
+                payload_hash = digest.digest()
+                if payload_hash == feed.payload_hash:
+                    self.count_poll("unchanged")
+                    return
+
+                result = {"events": events, "timestamp": timestamp}
+                if self.db is not None:
+                    with metrics.timer("stage_seconds", stage="cache_write"):
+                        self.db.set_cache(feed.cache_key(today), result, encode_snapshot_item)
+                self.publish(feed, result, archive=True)
+                feed.payload_hash = payload_hash
+                self.count_poll("processed")
+            else:
+                raise Exception(f"HTTP {response.status_code}")
+
+    def read_body(self, response, digest, stages):
+        # Time blocked on the socket; parsing runs between chunks and is not counted
+        chunks = response.iter_content(STREAM_CHUNK_BYTES)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            stages["download"] += time.perf_counter() - started
+            if chunk is None:
+                return
+            if self.cancelled.is_set():
+                raise PollCancelled()
+            digest.update(chunk)
+            yield chunk
+
+    def stream_events(self, feed, chunks, timestamp, progressive, stages):
+        # A cold feed publishes every batch so the first rows render before the download completes
+        events, batch = [], []
+        started = time.perf_counter()
+        # Download, enrich and publish interleave with parsing; parse time is what remains of the loop
+        elsewhere = stages["download"] + stages["enrich"] + stages["publish"]
+        for item in iter_json_array(chunks):
+            batch.append(item)
+            if len(batch) == STREAM_BATCH_EVENTS:
+                self.enrich_batch(batch, events, stages)
+                batch = []
+                if progressive:
+                    published = time.perf_counter()
+                    self.publish(feed, {"events": list(events), "timestamp": timestamp}, archive=True)
+                    stages["publish"] += time.perf_counter() - published
+        elsewhere = stages["download"] + stages["enrich"] + stages["publish"] - elsewhere
+        stages["parse"] += time.perf_counter() - started - elsewhere
+        self.enrich_batch(batch, events, stages)
+        return events
+
+    def enrich_batch(self, batch, events, stages):
+        started = time.perf_counter()
+        events.extend(self.enrich_events(batch))
+        stages["enrich"] += time.perf_counter() - started
+
+    def enrich_events(self, events):
+        return events_from_api(events)
+
+# ====================== Recording & Replay ======================
+class SnapshotRecorder:
+    # Writes every published snapshot as one NDJSON line, stamped with its offset from the first
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+        self.lock = threading.Lock()
+        self.started = None
+
+    def write(self, data):
+        now = time.monotonic()
+        with self.lock:
+            if self.file.closed:
+                return
+            if self.started is None:
+                self.started = now
+            record = dict(data, offset=round(now - self.started, 3))
+            self.file.write(json.dumps(record, default=encode_snapshot_item, ensure_ascii=False) + "\n")
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def read_recording(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record.pop("offset", 0), decode_snapshot(record)
+
+def latency_summary(samples):
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    def percentile(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {"count": len(ordered), "p50_ms": percentile(0.5), "p95_ms": percentile(0.95), "max_ms": ordered[-1]}
+
+REPLAY_PAUSE_POLL = 0.1
+
+class ReplaySource:
+    # Feeds a recording back through the same callbacks FeedPoller uses; speed 0 replays as fast as possible
+    def __init__(self, path, speed=1.0, on_data=ignore, on_delta=ignore, on_finished=ignore):
+        self.path = path
+        self.speed = speed
+        self.on_data = on_data
+        self.on_delta = on_delta
+        self.on_finished = on_finished
+        self.cancelled = threading.Event()
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.delta_engines = {}
+
+    def pause(self):
+        self.resumed.clear()
+
+    def resume(self):
+        self.resumed.set()
+
+    def stop(self):
+        self.cancelled.set()
+        self.resumed.set()
+
+    def run(self):
+        count = 0
+        start = time.monotonic()
+        for offset, data in read_recording(self.path):
+            due = offset / self.speed if self.speed > 0 else 0
+            while not self.cancelled.is_set():
+                if not self.resumed.is_set():
+                    # Time spent paused is added to the clock so the recording's spacing is kept
+                    paused = time.monotonic()
+                    self.resumed.wait()
+                    start += time.monotonic() - paused
+                delay = start + due - time.monotonic()
+                if delay <= 0:
+                    break
+                self.cancelled.wait(min(delay, REPLAY_PAUSE_POLL))
+            if self.cancelled.is_set():
+                break
+            self.publish(data)
+            count += 1
+        self.on_finished(count)
+
+    def publish(self, data):
+        key = (data.get("sport"), data.get("league"))
+        self.on_data(data)
+        delta = self.delta_engines.setdefault(key, EventDeltaEngine()).diff(data["events"], data.get("timestamp"))
+        if delta:
+            delta["sport"], delta["league"] = key
+            # Consumers subtract this from their own perf_counter to get per-snapshot latency
+            delta["replayed_at"] = time.perf_counter()
+            self.on_delta(delta)
+
+# ====================== Export ======================
+EXPORT_PROGRESS_ROWS = 1000
+EXPORT_EVENT_FIELDS = ("idEvent", "strEvent", "strSport", "strLeague", "strHomeTeam", "strAwayTeam",
+                       "intHomeScore", "intAwayScore", "strStatus", "strProgress", "strTime", "dateEvent")
+EXPORT_HISTORY_FIELDS = ("timestamp", "event_id", "sport", "league", "home", "away") + HISTORY_FIELDS
+
+class ExportCancelled(Exception):
+    pass
+
+def export_kind(path):
+    # By suffix, ignoring a trailing .gz: "ndjson", "csv" or "json" for anything else
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    if name.endswith(".csv"):
+        return "csv"
+    return "json"
+
+def snapshot_export(data):
+    # (rows, total, header) for one snapshot; the header keeps the document importable
+    events = data.get("events") or []
+    header = {key: value for key, value in data.items() if key != "events"}
+    return (event.to_api() for event in events), len(events), header
+
+def history_export(history, start, end=None):
+    return history.changes(start, end), history.count_changes(start, end), None
+
+def write_export(path, rows, fields, total=None, header=None, on_progress=ignore, cancelled=None):
+    # Streams rows to path one at a time, so memory stays flat however many are written. The file only
+    # appears under its own name once complete; a failed or cancelled export leaves nothing behind.
+    import csv
+    import gzip
+
+    kind = export_kind(path)
+    temp = f"{path}.part"
+    count = 0
+    try:
+        if path.endswith(".gz"):
+            f = gzip.open(temp, "wt", encoding="utf-8", newline="")
+        else:
+            f = open(temp, "w", encoding="utf-8", newline="")
+        with f:
+            if kind == "csv":
+                writer = csv.DictWriter(f, fields, extrasaction="ignore")
+                writer.writeheader()
+            elif kind == "json":
+                f.write(json.dumps(header or {}, ensure_ascii=False)[:-1] + (", " if header else "") + '"events": [')
+            for row in rows:
+                if cancelled is not None and cancelled.is_set():
+                    raise ExportCancelled()
+                if kind == "csv":
+                    writer.writerow(row)
+                elif kind == "ndjson":
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                else:
+                    f.write((",\n" if count else "\n") + json.dumps(row, ensure_ascii=False))
+                count += 1
+                if count % EXPORT_PROGRESS_ROWS == 0:
+                    on_progress(count, total)
+            if kind == "json":
+                f.write("\n]}\n")
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+    on_progress(count, total)
+    return count
+
+# ====================== Import ======================
+def import_items(path):
+    # API-shaped dicts from any file write_export produces (and older indented JSON exports), read as a stream
+    import csv
+    import gzip
+    import io
+
+    kind = export_kind(path)
+    with gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb") as f:
+        if kind == "json":
+            yield from iter_json_array(iter(lambda: f.read(STREAM_CHUNK_BYTES), b""))
+        elif kind == "ndjson":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(io.TextIOWrapper(f, encoding="utf-8", newline=""))
+
+def read_import(path, on_batch, cancelled=None):
+    # Hands Event batches to on_batch as the file is read; returns (imported, skipped)
+    imported = skipped = 0
+    batch = []
+    for item in import_items(path):
+        batch.append(item)
+        if len(batch) == STREAM_BATCH_EVENTS:
+            if cancelled is not None and cancelled.is_set():
+                break
+            events = events_from_api(batch)
+            imported += len(events)
+            skipped += len(batch) - len(events)
+            on_batch(events)
+            batch = []
+    else:
+        events = events_from_api(batch)
+        imported += len(events)
+        skipped += len(batch) - len(events)
+        if events:
+            on_batch(events)
+    return imported, skipped
+
+# ====================== Fan-out Server ======================
+FANOUT_PORT = 8790
+# Frames a subscriber may fall behind by before its queue is dropped and it is resynced from snapshots
+FANOUT_QUEUE_FRAMES = 64
+FANOUT_HEARTBEAT = 15
+FANOUT_WRITE_TIMEOUT = 30
+# Seconds stop() gives subscribers to take their last frames before their handlers are cancelled
+FANOUT_STOP_TIMEOUT = 1
+SUBSCRIBE_RETRY = 5
+
+def sse_frame(kind, payload):
+    return f"event: {kind}\ndata: {json.dumps(payload, default=encode_snapshot_item, ensure_ascii=False)}\n\n".encode()
+
+def parse_address(value, default_host="127.0.0.1"):
+    # "PORT" or "HOST:PORT"
+    host, _, port = value.rpartition(":")
+    return host or default_host, int(port)
+
+class FanoutClient:
+    def __init__(self, peer, queue):
+        self.peer = peer
+        self.queue = queue
+
+class FanoutServer:
+    # Republishes one poller's snapshots and deltas as Server-Sent Events on GET /events. Each frame is
+    # encoded once for every subscriber; a subscriber that falls FANOUT_QUEUE_FRAMES behind is not waited
+    # for but has its backlog dropped and is sent fresh snapshots of every feed instead.
+    def __init__(self, host="127.0.0.1", port=FANOUT_PORT):
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.clients = set()
+        # Feed key -> (snapshot, encoded frame or None until first needed); only touched on the loop thread
+        self.snapshots = {}
+        self.started = threading.Event()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve, name="fanout", daemon=True)
+        self.thread.start()
+        self.started.wait()
+        if self.server is None:
+            raise OSError(f"Could not listen on {self.host}:{self.port}")
+        return self
+
+    def serve(self):
+        # asyncio only loads when serving; most runs never pay for it
+        import asyncio
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, self.host, self.port))
+            self.port = self.server.sockets[0].getsockname()[1]
+        except OSError as e:
+            logger.error("Fan-out server failed to start: %s", e)
+            self.started.set()
+            return
+        self.started.set()
+        logger.info("Serving live feeds on http://%s:%d/events", self.host, self.port)
+        self.loop.run_forever()
+        self.server.close()
+        for client in list(self.clients):
+            client.queue.put_nowait(None)
+        tasks = asyncio.all_tasks(self.loop)
+        if tasks:
+            _, pending = self.loop.run_until_complete(asyncio.wait(tasks, timeout=FANOUT_STOP_TIMEOUT))
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+    def stop(self):
+        if self.loop is not None and self.server is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(FANOUT_STOP_TIMEOUT + 1)
+
+    # on_data / on_delta callbacks, called from poller threads
+    def publish(self, data):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.store_snapshot, data)
+
+    def publish_delta(self, delta):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.broadcast_delta, delta)
+
+    def store_snapshot(self, data):
+        self.snapshots[(data.get("sport"), data.get("league"))] = (data, None)
+
+    def snapshot_frame(self, key):
+        data, frame = self.snapshots[key]
+        if frame is None:
+            frame = sse_frame("snapshot", {"sport": key[0], "league": key[1], "timestamp": data.get("timestamp"),
+                                           "events": data.get("events") or []})
+            self.snapshots[key] = (data, frame)
+        return frame
+
+    def broadcast_delta(self, delta):
+        key = (delta["sport"], delta["league"])
+        if delta["reset"] and key in self.snapshots:
+            frame = self.snapshot_frame(key)
+        else:
+            frame = sse_frame("delta", {"sport": key[0], "league": key[1], "timestamp": delta["timestamp"],
+                                        "added": delta["added"], "changed": delta["changed"],
+                                        "removed": delta["removed"]})
+        metrics.inc("fanout_frames_total")
+        for client in self.clients:
+            if client.queue.qsize() >= FANOUT_QUEUE_FRAMES:
+                self.resync(client)
+            else:
+                client.queue.put_nowait(frame)
+
+    def resync(self, client):
+        while not client.queue.empty():
+            client.queue.get_nowait()
+        for key in self.snapshots:
+            client.queue.put_nowait(self.snapshot_frame(key))
+        metrics.inc("fanout_resyncs_total")
+        logger.debug("Resynced slow subscriber %s", client.peer)
+
+    async def handle(self, reader, writer):
+        import asyncio
+
+        client = None
+        try:
+            request = await asyncio.wait_for(reader.readline(), FANOUT_WRITE_TIMEOUT)
+            while (await asyncio.wait_for(reader.readline(), FANOUT_WRITE_TIMEOUT)).strip():
+                pass
+            parts = request.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET" or parts[1].split("?")[0] != "/events":
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await writer.drain()
+                return
+            # No length and Connection: close, so the body is simply every frame until either side hangs up
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                         b"Connection: close\r\n\r\n")
+            client = FanoutClient(writer.get_extra_info("peername"), asyncio.Queue())
+            self.clients.add(client)
+            metrics.inc("fanout_connections_total")
+            for key in self.snapshots:
+                client.queue.put_nowait(self.snapshot_frame(key))
+            while True:
+                try:
+                    frame = await asyncio.wait_for(client.queue.get(), FANOUT_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    frame = b": ping\n\n"
+                if frame is None:
+                    break
+                writer.write(frame)
+                # A subscriber that stops reading altogether is dropped rather than held open
+                await asyncio.wait_for(writer.drain(), FANOUT_WRITE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+            logger.debug("Subscriber %s dropped: %s", client.peer if client else "?", e)
+        finally:
+            if client is not None:
+                self.clients.discard(client)
+            writer.close()
+
+class FeedSubscriber:
+    # Data source for a screen that follows another instance's FanoutServer instead of polling upstream.
+    # A reader thread only parses frames; like FeedPoller, every feed is rebuilt and diffed on the run()
+    # thread, which takes frames and the caller's commands from one queue, then goes out through the callbacks.
+    def __init__(self, url, on_data=ignore, on_delta=ignore, on_error=ignore):
+        self.url = url
+        self.on_data = on_data
+        self.on_delta = on_delta
+        self.on_error = on_error
+        self.commands = queue.Queue()
+        # Frames parsed but not yet applied; the reader stops reading past this so a slow screen pushes back on
+        # the server, which resyncs it, instead of queueing here without bound
+        self.frame_slots = threading.Semaphore(FANOUT_QUEUE_FRAMES)
+        self.cancelled = threading.Event()
+        self.paused = False
+        self.sock = None
+        self.feeds = {}
+        self.timestamps = {}
+        self.delta_engines = {}
+        # League feeds the server does not poll itself, cut from their sport feed instead
+        self.leagues = set()
+
+    def watch_league(self, sport, league):
+        self.commands.put(("watch", (sport, league)))
+
+    def unwatch_league(self, sport, league):
+        self.commands.put(("unwatch", (sport, league)))
+
+    def pause(self):
+        # Feeds keep tracking the server while paused; resume publishes where they have got to
+        self.commands.put(("pause", None))
+
+    def resume(self):
+        self.commands.put(("resume", None))
+
+    def stop(self):
+        import socket
+
+        self.cancelled.set()
+        self.commands.put(("stop", None))
+        sock = self.sock
+        if sock is not None:
+            # Unblocks the reader; closing alone would wait for the next frame
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def run(self):
+        reader = threading.Thread(target=self.read, name="subscriber-read", daemon=True)
+        reader.start()
+        while True:
+            command, value = self.commands.get()
+            if command == "stop":
+                break
+            self.handle_command(command, value)
+        reader.join(FANOUT_STOP_TIMEOUT)
+
+    def handle_command(self, command, value):
+        if command == "frame":
+            self.frame_slots.release()
+            self.dispatch(*value)
+        elif command == "error":
+            self.on_error(value)
+        elif command == "watch":
+            self.leagues.add(value)
+            if not self.paused and (value[0], None) in self.feeds and value not in self.feeds:
+                self.publish(value)
+        elif command == "unwatch":
+            self.leagues.discard(value)
+            # Watching it again starts over with a reset
+            self.delta_engines.pop(value, None)
+        elif command == "pause":
+            self.paused = True
+        elif command == "resume":
+            self.paused = False
+            for key in list(self.feeds):
+                self.publish(key)
+                self.publish_leagues(key)
+
+    def read(self):
+        import http.client
+
+        while not self.cancelled.is_set():
+            try:
+                self.stream()
+            except (OSError, ValueError, KeyError, TypeError, http.client.HTTPException) as e:
+                if self.cancelled.is_set():
+                    break
+                logger.warning("Subscription to %s lost: %s", self.url, e)
+                self.commands.put(("error", str(e)))
+            self.cancelled.wait(SUBSCRIBE_RETRY)
+
+    def stream(self):
+        import http.client
+        from urllib.parse import urlsplit
+
+        url = urlsplit(self.url)
+        connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=FANOUT_HEARTBEAT * 3)
+        response = None
+        try:
+            connection.request("GET", url.path or "/events", headers={"Accept": "text/event-stream"})
+            # On Connection: close the response takes the socket over from the connection, so keep it for stop()
+            self.sock = connection.sock
+            if self.cancelled.is_set():
+                return
+            response = connection.getresponse()
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            kind, data = None, []
+            while not self.cancelled.is_set():
+                line = response.readline()
+                if not line:
+                    raise ConnectionError("server closed the stream")
+                line = line.rstrip(b"\r\n")
+                if line.startswith(b"event:"):
+                    kind = line[6:].strip().decode()
+                elif line.startswith(b"data:"):
+                    data.append(line[5:].strip())
+                elif not line and data:
+                    payload = json.loads(b"\n".join(data))
+                    while not self.frame_slots.acquire(timeout=FANOUT_STOP_TIMEOUT):
+                        if self.cancelled.is_set():
+                            return
+                    self.commands.put(("frame", (kind, payload)))
+                    kind, data = None, []
+        finally:
+            self.sock = None
+            if response is not None:
+                response.close()
+            connection.close()
+
+    def dispatch(self, kind, payload):
+        key = (payload["sport"], payload["league"])
+        if kind == "snapshot":
+            self.feeds[key] = {event.event_id: event for event in decode_snapshot(payload)["events"]}
+        elif kind == "delta":
+            events = self.feeds.get(key)
+            if events is None:
+                return
+            for event_id in payload["removed"]:
+                events.pop(event_id, None)
+            for row in payload["added"] + payload["changed"]:
+                event = Event.from_row(row)
+                events[event.event_id] = event
+        else:
+            return
+        self.timestamps[key] = payload.get("timestamp")
+        if not self.paused:
+            self.publish(key)
+            self.publish_leagues(key)
+
+    def publish_leagues(self, key):
+        sport, league = key
+        if league is None:
+            for watched in self.leagues:
+                if watched[0] == sport and watched not in self.feeds:
+                    self.publish(watched)
+
+    def publish_events(self, key):
+        if key in self.feeds:
+            return list(self.feeds[key].values()), self.timestamps.get(key)
+        sport_key = (key[0], None)
+        events = [event for event in self.feeds[sport_key].values() if event.league == key[1]]
+        return events, self.timestamps.get(sport_key)
+
+    def publish(self, key):
+        events, timestamp = self.publish_events(key)
+        data = tag_snapshot({"events": events, "timestamp": timestamp}, *key)
+        self.on_data(data)
+        delta = self.delta_engines.setdefault(key, EventDeltaEngine()).diff(data["events"], data["timestamp"])
+        if delta:
+            delta["sport"], delta["league"] = key
+            delta["published_at"] = time.perf_counter()
+            self.on_delta(delta)
+
+# ====================== Command Line ======================
+def delta_record(delta):
+    record = {"type": "delta"}
+    record.update(delta, added=[event.to_api() for event in delta["added"]],
+                  changed=[event.to_api() for event in delta["changed"]])
+    record.pop("published_at", None)
+    return record
+
+def delta_lines(delta):
+    stamp = delta["timestamp"][11:19]
+    for event in delta["added"] + delta["changed"]:
+        progress = f" {event.progress}" if event.progress and event.progress != event.status_text else ""
+        yield (f"{stamp} {event.sport:<10} {event.league:<24} {event.home} {event.score_text()} {event.away}"
+               f" [{event.status_text}{progress}]")
+    for event_id in delta["removed"]:
+        yield f"{stamp} {delta['sport']:<10} removed {event_id}"
+
+# Subcommands of build_parser(); live_sports_hub hands these to main() before importing Qt
+COMMANDS = ("poll", "export")
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="live_sports_hub", description="Live sports scores without the GUI")
+    commands = parser.add_subparsers(dest="command", required=True)
+    poll = commands.add_parser("poll", help="poll feeds and stream changes to stdout")
+    poll.add_argument("--sport", action="append", choices=[info["api"] for info in SPORT_MAPPING.values()],
+                      help="sport to follow (repeatable, default: all)")
+    poll.add_argument("--league", help="restrict every followed sport to one league")
+    poll.add_argument("--ndjson", action="store_true", help="write one JSON changeset per line")
+    poll.add_argument("--once", action="store_true", help="exit after every feed has been polled once")
+    poll.add_argument("--mock", action="store_true", help="generate offline data instead of calling the API")
+    poll.add_argument("--db", help="SQLite database used as the snapshot cache and score history (default: none)")
+    poll.add_argument("--record", metavar="PATH", help="record every snapshot to an NDJSON file for replay")
+    poll.add_argument("--serve", metavar="[HOST:]PORT",
+                      help="republish snapshots and deltas as Server-Sent Events on http://HOST:PORT/events")
+    add_metrics_arguments(poll)
+    export = commands.add_parser("export", help="write a range of the score history to a file")
+    export.add_argument("output", help="destination; .ndjson, .csv or .json, with .gz appended to compress")
+    export.add_argument("--db", required=True, help="SQLite database holding the score history")
+    export.add_argument("--since", type=local_time, required=True, help="start of the range (ISO date/time, local)")
+    export.add_argument("--until", type=local_time, help="end of the range (default: now)")
+    return parser
+
+def local_time(value):
+    return datetime.fromisoformat(value).timestamp()
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help=f"rewrite Prometheus text-format metrics here every {METRICS_WRITE_INTERVAL}s")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT", help="serve metrics on http://127.0.0.1:PORT/metrics")
+
+def start_metrics_exporter(args):
+    if not args.metrics_file and args.metrics_port is None:
+        return None
+    return MetricsExporter(path=args.metrics_file, port=args.metrics_port).start()
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.command == "export":
+        return export_history(args)
+    sports = args.sport or [info["api"] for info in SPORT_MAPPING.values()]
+    feeds = [(sport, args.league) for sport in sports]
+    db = DatabaseManager(args.db) if args.db else None
+    write_lock = threading.Lock()
+    polled = set()
+
+    def write(lines):
+        with write_lock:
+            try:
+                for line in lines:
+                    sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+            except BrokenPipeError:
+                # The reader went away (e.g. piped into head): stop quietly
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                poller.stop()
+
+    def on_data(data):
+        if recorder is not None:
+            recorder.write(data)
+        if server is not None:
+            server.publish(data)
+
+    def on_delta(delta):
+        if server is not None:
+            server.publish_delta(delta)
+        if args.ndjson:
+            write([json.dumps(delta_record(delta), ensure_ascii=False)])
+        else:
+            write(delta_lines(delta))
+
+    def on_schedule(schedule):
+        if args.ndjson:
+            write([json.dumps(dict({"type": "schedule"}, **schedule))])
+        polled.add((schedule["sport"], schedule["league"]))
+        if args.once and len(polled) == len(feeds):
+            poller.stop()
+
+    history = HistoryStore(db) if db is not None else None
+    recorder = SnapshotRecorder(args.record) if args.record else None
+    server = FanoutServer(*parse_address(args.serve)).start() if args.serve else None
+    poller = FeedPoller(feeds, db=db, offline=args.mock, history=history,
+                        on_data=on_data, on_delta=on_delta, on_schedule=on_schedule)
+    exporter = start_metrics_exporter(args)
+    try:
+        poller.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        poller.cancelled.set()
+        if exporter is not None:
+            exporter.stop()
+        if server is not None:
+            server.stop()
+        if recorder is not None:
+            recorder.close()
+        if db is not None:
+            db.close()
+    return 0
+
+def export_history(args):
+    db = DatabaseManager(args.db)
+    try:
+        rows, total, header = history_export(HistoryStore(db), args.since, args.until)
+        count = write_export(args.output, rows, EXPORT_HISTORY_FIELDS, total, header)
+    finally:
+        db.close()
+    print(f"Exported {count} changes to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,717 @@
+import csv
+import gzip
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import sports_core as core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_event(event_id, home_score=None, away_score=None, status="Scheduled", progress="", league="Premier League"):
+    return core.Event(str(event_id), "Soccer", league, f"Home {event_id}", f"Away {event_id}",
+                      home_score, away_score, status, progress, "15:00", "2026-01-01")
+
+
+def rows(events):
+    return [event.to_row() for event in events]
+
+
+def api_body(events):
+    return json.dumps({"events": [event.to_api() for event in events]}).encode()
+
+
+def drain(poller):
+    while not poller.commands.empty():
+        poller.handle_command(*poller.commands.get())
+
+
+class MemoryCacheTest(unittest.TestCase):
+    def test_hit_within_max_age(self):
+        cache = core.MemoryCache()
+        cache.put("k", {"events": []}, 10)
+        self.assertEqual(cache.get("k", 60), {"events": []})
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_expired_entry_is_dropped(self):
+        cache = core.MemoryCache()
+        cache.put("k", "value", 10, stored_at=time.time() - 120)
+        self.assertIsNone(cache.get("k", 60))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["expirations"], stats["misses"]), (0, 0, 1, 1))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = core.MemoryCache(max_entries=2)
+        cache.put("a", 1, 1)
+        cache.put("b", 2, 1)
+        cache.get("a", 60)
+        cache.put("c", 3, 1)
+        self.assertIsNone(cache.get("b", 60))
+        self.assertEqual((cache.get("a", 60), cache.get("c", 60)), (1, 3))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_budget(self):
+        cache = core.MemoryCache(max_bytes=100)
+        cache.put("a", 1, 60)
+        cache.put("b", 2, 60)
+        self.assertIsNone(cache.get("a", 60))
+        self.assertEqual(cache.stats()["bytes"], 60)
+        cache.put("huge", 3, 101)
+        self.assertIsNone(cache.get("huge", 60))
+        self.assertEqual(cache.get("b", 60), 2)
+
+    def test_replacing_a_key_keeps_the_byte_count(self):
+        cache = core.MemoryCache()
+        cache.put("k", 1, 40)
+        cache.put("k", 2, 30)
+        self.assertEqual(cache.stats()["bytes"], 30)
+        self.assertEqual(cache.get("k", 60), 2)
+
+
+class EventDeltaEngineTest(unittest.TestCase):
+    def test_first_diff_is_a_reset(self):
+        engine = core.EventDeltaEngine()
+        delta = engine.diff([make_event(1), make_event(2)], "2026-01-01T15:00:00")
+        self.assertTrue(delta["reset"])
+        self.assertEqual(delta["seq"], 1)
+        self.assertEqual(rows(delta["added"]), rows([make_event(1), make_event(2)]))
+        self.assertEqual(delta["timestamp"], "2026-01-01T15:00:00")
+
+    def test_empty_first_feed_still_resets(self):
+        delta = core.EventDeltaEngine().diff([])
+        self.assertTrue(delta["reset"])
+        self.assertEqual(delta["added"], [])
+
+    def test_unchanged_feed_gives_no_delta(self):
+        engine = core.EventDeltaEngine()
+        engine.diff([make_event(1)])
+        self.assertIsNone(engine.diff([make_event(1)]))
+
+    def test_changes(self):
+        engine = core.EventDeltaEngine()
+        engine.diff([make_event(1, 0, 0, "1H", "10'"), make_event(2), make_event(3)])
+        delta = engine.diff([make_event(1, 1, 0, "1H", "12'"), make_event(2, status="Postponed"), make_event(4)])
+        self.assertFalse(delta["reset"])
+        self.assertEqual(delta["seq"], 2)
+        self.assertEqual([event.event_id for event in delta["added"]], ["4"])
+        self.assertEqual(delta["removed"], ["3"])
+        self.assertEqual([event.event_id for event in delta["changed"]], ["1", "2"])
+        self.assertEqual(delta["score_changed"], ["1"])
+        self.assertEqual(delta["status_changed"], ["2"])
+
+    def test_progress_only_change(self):
+        engine = core.EventDeltaEngine()
+        engine.diff([make_event(1, 0, 0, "1H", "10'")])
+        delta = engine.diff([make_event(1, 0, 0, "1H", "11'")])
+        self.assertEqual([event.event_id for event in delta["changed"]], ["1"])
+        self.assertEqual((delta["score_changed"], delta["status_changed"]), ([], []))
+
+
+class PollSchedulerTest(unittest.TestCase):
+    # make_event kicks off at 15:00 UTC on 2026-01-01
+    KICKOFF = datetime(2026, 1, 1, 15, 0, tzinfo=timezone.utc).timestamp()
+
+    def test_live_match_sets_the_pace(self):
+        scheduler = core.PollScheduler()
+        events = [make_event(1, status="FT"), make_event(2), make_event(3, 0, 0, "2H", "70'")]
+        self.assertEqual(scheduler.interval_for(events, now=self.KICKOFF), (core.LIVE_POLL_INTERVAL, "live"))
+
+    def test_next_kickoff(self):
+        scheduler = core.PollScheduler()
+        events = [make_event(1, status="FT"), make_event(2)]
+        self.assertEqual(scheduler.interval_for(events, now=self.KICKOFF - 600), (600 - core.KICKOFF_LEAD, "kickoff"))
+        self.assertEqual(scheduler.interval_for(events, now=self.KICKOFF - 6 * 3600),
+                         (core.IDLE_POLL_INTERVAL, "kickoff"))
+        # Within the lead time and for a late kick-off the live pace applies
+        self.assertEqual(scheduler.interval_for(events, now=self.KICKOFF + 60), (core.LIVE_POLL_INTERVAL, "kickoff"))
+
+    def test_finished_and_idle(self):
+        scheduler = core.PollScheduler()
+        # A kick-off that never went live is given up on after STALE_KICKOFF
+        stale = self.KICKOFF + core.STALE_KICKOFF + 1
+        self.assertEqual(scheduler.interval_for([make_event(1, status="FT"), make_event(2)], now=stale),
+                         (core.FINISHED_POLL_INTERVAL, "finished"))
+        self.assertEqual(scheduler.interval_for([], now=stale), (core.IDLE_POLL_INTERVAL, "idle"))
+
+    def test_backoff_doubles_up_to_the_idle_interval(self):
+        scheduler = core.PollScheduler()
+        self.assertEqual([scheduler.backoff_for(failures)[0] for failures in (1, 2, 3)],
+                         [core.LIVE_POLL_INTERVAL * 2, core.LIVE_POLL_INTERVAL * 4, core.LIVE_POLL_INTERVAL * 8])
+        self.assertEqual(scheduler.backoff_for(20), (core.IDLE_POLL_INTERVAL, "retry"))
+
+    def test_jitter(self):
+        scheduler = core.PollScheduler(seed=1)
+        samples = [scheduler.jitter(100) for _ in range(1000)]
+        self.assertTrue(all(100 * (1 - core.POLL_JITTER) <= sample <= 100 * (1 + core.POLL_JITTER)
+                            for sample in samples))
+        self.assertGreater(len(set(samples)), 1)
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    DOCUMENT = json.dumps({
+        "skipped": {"events": [1, 2], "n": -1.5e-3},
+        "events": [1.5e10, -2.75, 0, 3, "Zürich – 東京", {"k": [True, False, None]}, 1e5, -0.0001]
+    }, ensure_ascii=False).encode()
+
+    def expected(self):
+        return json.loads(self.DOCUMENT)["events"]
+
+    def test_whole_document(self):
+        self.assertEqual(list(core.iter_json_array([self.DOCUMENT])), self.expected())
+
+    def test_every_split_point(self):
+        # Includes splits inside numbers ("1.|5e10", "1.5e|10") and inside multi-byte characters
+        for split in range(1, len(self.DOCUMENT)):
+            chunks = [self.DOCUMENT[:split], self.DOCUMENT[split:]]
+            self.assertEqual(list(core.iter_json_array(chunks)), self.expected(), split)
+
+    def test_byte_at_a_time(self):
+        chunks = [self.DOCUMENT[i:i + 1] for i in range(len(self.DOCUMENT))]
+        self.assertEqual(list(core.iter_json_array(chunks)), self.expected())
+
+    def test_number_split_after_point_or_exponent(self):
+        self.assertEqual(list(core.iter_json_array([b'{"events": [1.', b'5, 2]}'])), [1.5, 2])
+        self.assertEqual(list(core.iter_json_array([b'{"events": [1.5e', b'10]}'])), [1.5e10])
+
+    def test_missing_or_null_key(self):
+        self.assertEqual(list(core.iter_json_array([b'{"other": [1]}'])), [])
+        self.assertEqual(list(core.iter_json_array([b'{"events": null}'])), [])
+        self.assertEqual(list(core.iter_json_array([b'{}'])), [])
+        self.assertEqual(list(core.iter_json_array([b'{"events": []}'])), [])
+
+    def test_truncated_stream(self):
+        with self.assertRaises(ValueError):
+            list(core.iter_json_array([b'{"events": [1, 2']))
+        with self.assertRaises(ValueError):
+            list(core.iter_json_array([b'{"events": [1.5']))
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+class FeedPollerFetchTest(unittest.TestCase):
+    def poller(self, *responses):
+        published = []
+        poller = core.FeedPoller(feeds=[], on_data=published.append)
+        poller.session = FakeSession(*responses)
+        return poller, core.FeedState("Soccer"), published
+
+    def test_conditional_request(self):
+        modified = "Thu, 01 Jan 2026 15:00:00 GMT"
+        poller, feed, published = self.poller(
+            FakeResponse(200, api_body([make_event(1)]), {"ETag": '"v1"', "Last-Modified": modified}),
+            FakeResponse(304))
+        poller.fetch_live_events(feed)
+        poller.fetch_live_events(feed)
+        self.assertEqual(poller.session.sent_headers, [{}, {"If-None-Match": '"v1"', "If-Modified-Since": modified}])
+        self.assertEqual(len(published), 1)
+        self.assertEqual(poller.poll_stats, {"processed": 1, "unchanged": 0, "not_modified": 1, "failed": 0})
+
+    def test_unchanged_payload_is_skipped(self):
+        body = api_body([make_event(1, 0, 0, "1H", "10'")])
+        changed = [make_event(1, 1, 0, "1H", "12'")]
+        poller, feed, published = self.poller(FakeResponse(200, body), FakeResponse(200, body),
+                                              FakeResponse(200, api_body(changed)))
+        for _ in range(3):
+            poller.fetch_live_events(feed)
+        self.assertEqual(poller.poll_stats, {"processed": 2, "unchanged": 1, "not_modified": 0, "failed": 0})
+        self.assertEqual(len(published), 2)
+        self.assertEqual(rows(published[-1]["events"]), rows(changed))
+
+    def test_warm_payload_larger_than_the_spool(self):
+        first = [make_event(i, 0, 0, "1H", "10'") for i in range(300)]
+        second = [make_event(i, 1, 0, "1H", "12'") for i in range(300)]
+        poller, feed, published = self.poller(FakeResponse(200, api_body(first)), FakeResponse(200, api_body(second)))
+        with mock.patch.object(core, "STREAM_SPOOL_BYTES", 1024):
+            poller.fetch_live_events(feed)
+            poller.fetch_live_events(feed)
+        self.assertEqual(rows(published[-1]["events"]), rows(second))
+
+    def test_failure_publishes_mock_data(self):
+        poller, feed, published = self.poller(FakeResponse(503))
+        feed.payload_hash = b"old"
+        self.assertEqual(poller.poll_feed(feed)[1], "retry")
+        self.assertEqual((feed.failures, feed.payload_hash, poller.poll_stats["failed"]), (1, None, 1))
+        self.assertEqual(len(published), 1)
+
+
+class FeedPollerCommandTest(unittest.TestCase):
+    def test_pause_resume_and_refresh(self):
+        poller = core.FeedPoller(feeds=[("Soccer", None)], offline=True)
+        drain(poller)
+        feed = poller.feeds[("Soccer", None)]
+        feed.next_poll = time.monotonic() + 60
+        poller.pause()
+        drain(poller)
+        self.assertIsNone(poller.next_wakeup(time.monotonic()))
+        poller.refresh("Soccer")
+        poller.resume()
+        drain(poller)
+        self.assertTrue(feed.refresh_requested)
+        self.assertGreater(poller.next_wakeup(time.monotonic()), 50)
+
+    def test_watch_and_unwatch(self):
+        poller = core.FeedPoller(feeds=[], offline=True)
+        poller.watch_feed("Soccer", "Premier League")
+        drain(poller)
+        feed = poller.feeds[("Soccer", "Premier League")]
+        poller.unwatch_feed("Soccer", "Premier League")
+        drain(poller)
+        self.assertEqual(poller.feeds, {})
+        self.assertFalse(feed.active)
+
+    def test_refresh_while_paused_and_stop(self):
+        polls = []
+        polled = threading.Event()
+
+        def on_data(data):
+            polls.append(data)
+            polled.set()
+
+        poller = core.FeedPoller(feeds=[("Soccer", None)], offline=True, on_data=on_data)
+        poller.pause()
+        drain(poller)
+        thread = threading.Thread(target=poller.run)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(poller.stop)
+        self.assertFalse(polled.wait(0.2))
+        poller.refresh()
+        self.assertTrue(polled.wait(5))
+        started = time.monotonic()
+        poller.stop()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(polls), 1)
+
+    def test_stop_aborts_a_request_blocked_on_the_server(self):
+        # Accepts connections into the backlog and never answers
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        self.addCleanup(server.close)
+        published = []
+        poller = core.FeedPoller(feeds=[("Soccer", None)], use_cache=False, on_data=published.append)
+        with mock.patch.object(core, "API_BASE_URL", f"http://127.0.0.1:{server.getsockname()[1]}"):
+            thread = threading.Thread(target=poller.run)
+            thread.start()
+            deadline = time.monotonic() + 5
+            while not poller.connections and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(poller.connections)
+            started = time.monotonic()
+            poller.stop()
+            thread.join(5)
+            while any(t.name.startswith("feed") for t in threading.enumerate()) and time.monotonic() < started + 5:
+                time.sleep(0.01)
+        self.assertLess(time.monotonic() - started, 2)
+        # Cancellation is neither a failure nor a reason to show mock data
+        self.assertEqual((poller.poll_stats["failed"], published), (0, []))
+
+
+class TempDirTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def database(self):
+        db = core.DatabaseManager(self.path("test.db"))
+        self.addCleanup(db.close)
+        return db
+
+
+class FavoritesStoreTest(TempDirTest):
+    def test_toggles_are_written_behind_in_one_batch(self):
+        db = self.database()
+        saved = []
+        save_favorites = db.save_favorites
+        db.save_favorites = lambda added, removed: (saved.append(1), save_favorites(added, removed))
+        store = core.FavoritesStore(db)
+        store.toggle(make_event(1))
+        store.toggle(make_event(2))
+        store.toggle(make_event(2))
+        self.assertIn("1", store)
+        self.assertNotIn("2", store)
+        self.assertEqual(db.get_favorite_ids(), [])
+        store.flush()
+        store.flush()
+        self.assertEqual((db.get_favorite_ids(), len(saved)), (["1"], 1))
+
+    def test_removal_survives_a_reload(self):
+        db = self.database()
+        store = core.FavoritesStore(db)
+        store.toggle(make_event(1))
+        store.toggle(make_event(2))
+        store.flush()
+        reloaded = core.FavoritesStore(db)
+        self.assertEqual(len(reloaded), 2)
+        self.assertFalse(reloaded.toggle(make_event(1)))
+        reloaded.flush()
+        self.assertEqual(core.FavoritesStore(db).ids, {"2"})
+
+
+class HistoryStoreTest(TempDirTest):
+    def test_first_record_is_a_keyframe(self):
+        history = core.HistoryStore(self.database())
+        self.assertEqual(history.record([make_event(1, 0, 0, "1H", "5'")], timestamp=1000), 1)
+        [change] = history.changes(0)
+        self.assertEqual(change, {"event_id": "1", "sport": "Soccer", "league": "Premier League",
+                                  "home": "Home 1", "away": "Away 1", "timestamp": 1000.0,
+                                  "home_score": 0, "away_score": 0, "status_text": "1H", "progress": "5'"})
+
+    def test_only_changed_fields_are_stored(self):
+        history = core.HistoryStore(self.database())
+        history.record([make_event(1, 0, 0, "1H", "5'"), make_event(2)], timestamp=1000)
+        self.assertEqual(history.record([make_event(1, 1, 0, "1H", "5'"), make_event(2)], timestamp=1010), 1)
+        changes = list(history.changes(1005))
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["home_score"], 1)
+        self.assertNotIn("away_score", changes[0])
+        self.assertNotIn("status_text", changes[0])
+        self.assertEqual(history.count_changes(0), 3)
+        self.assertEqual(history.count_changes(1005, 1020), 1)
+
+    def test_timeline_folds_to_full_states(self):
+        history = core.HistoryStore(self.database())
+        history.record([make_event(1, 0, 0, "1H", "5'")], timestamp=1000)
+        history.record([make_event(1, 1, 0, "1H", "20'")], timestamp=1010)
+        history.record([make_event(1, 1, 0, "HT", "45'")], timestamp=1020)
+        timeline = history.timeline("1")
+        self.assertEqual([(entry["home_score"], entry["status_text"], entry["progress"]) for entry in timeline],
+                         [(0, "1H", "5'"), (1, "1H", "20'"), (1, "HT", "45'")])
+        self.assertEqual(timeline[1]["changed"], ["home_score", "progress"])
+        self.assertEqual([entry["timestamp"] for entry in history.timeline("1", start=1005, end=1015)], [1010.0])
+
+    def test_same_millisecond_records_stay_ordered(self):
+        history = core.HistoryStore(self.database())
+        history.record([make_event(1, 0, 0, "1H")], timestamp=1000)
+        history.record([make_event(1, 1, 0, "1H")], timestamp=1000)
+        self.assertEqual([entry["home_score"] for entry in history.timeline("1")], [0, 1])
+
+    def test_new_store_starts_with_a_keyframe(self):
+        db = self.database()
+        core.HistoryStore(db).record([make_event(1, 0, 0, "1H")], timestamp=1000)
+        reopened = core.HistoryStore(db)
+        reopened.record([make_event(1, 0, 0, "1H")], timestamp=1010)
+        self.assertEqual(reopened.timeline("1")[-1]["changed"], list(core.HISTORY_FIELDS))
+
+
+class CacheCounters:
+    def metrics(self):
+        return [("cache_lookups_total", {"tier": "memory"}, 3)]
+
+
+class MetricsTest(unittest.TestCase):
+    def test_quantile_interpolates_inside_the_bucket(self):
+        histogram = core.Histogram(buckets=(1, 2, 4))
+        self.assertEqual(histogram.quantile(0.5), 0.0)
+        for value in (0.5, 1.5, 1.5, 3):
+            histogram.observe(value)
+        self.assertEqual([histogram.quantile(q) for q in (0.25, 0.5, 1.0)], [1.0, 1.5, 4.0])
+        histogram.observe(10)
+        self.assertEqual(histogram.counts, [1, 2, 1, 1])
+        # The +Inf bucket has no upper bound to interpolate to
+        self.assertEqual(histogram.quantile(1.0), 4)
+
+    def test_prometheus_text(self):
+        registry = core.MetricsRegistry()
+        registry.inc("polls_total", outcome="processed")
+        registry.inc("polls_total", 2, outcome="processed")
+        registry.inc("polls_total", outcome="failed")
+        registry.observe("poll_seconds", 0.003, sport="Soccer")
+        lines = registry.render().splitlines()
+        self.assertEqual(lines[:3], ["# TYPE sports_hub_polls_total counter",
+                                     'sports_hub_polls_total{outcome="failed"} 1',
+                                     'sports_hub_polls_total{outcome="processed"} 3'])
+        self.assertEqual(lines[3], "# TYPE sports_hub_poll_seconds histogram")
+        self.assertIn('sports_hub_poll_seconds_bucket{sport="Soccer",le="0.0025"} 0', lines)
+        self.assertIn('sports_hub_poll_seconds_bucket{sport="Soccer",le="0.005"} 1', lines)
+        self.assertEqual(lines[-3:], ['sports_hub_poll_seconds_bucket{sport="Soccer",le="+Inf"} 1',
+                                      'sports_hub_poll_seconds_sum{sport="Soccer"} 0.003000',
+                                      'sports_hub_poll_seconds_count{sport="Soccer"} 1'])
+        self.assertEqual(len(lines), 4 + len(core.METRIC_BUCKETS) + 3)
+
+    def test_collectors_are_read_on_render_and_dropped_with_their_owner(self):
+        registry = core.MetricsRegistry()
+        counters = CacheCounters()
+        registry.register(counters.metrics)
+        registry.inc("cache_lookups_total", tier="memory")
+        self.assertIn('sports_hub_cache_lookups_total{tier="memory"} 4', registry.render().splitlines())
+        self.assertEqual(registry.summary()["counters"], {'cache_lookups_total{tier="memory"}': 4})
+        del counters
+        self.assertEqual(registry.summary()["counters"], {'cache_lookups_total{tier="memory"}': 1})
+
+
+class ExportImportTest(TempDirTest):
+    SUFFIXES = (".json", ".ndjson", ".csv", ".json.gz", ".ndjson.gz", ".csv.gz")
+
+    def snapshot(self):
+        events = [make_event(i, i % 3, 1, "2H", "70'") for i in range(1, 2500)]
+        # No scores; progress is the kick-off time, as from_api derives it
+        events.append(make_event("scheduled", progress="15:00", league="Ligue 1 – Zürich"))
+        return {"sport": "Soccer", "league": None, "timestamp": "2026-01-01T15:00:00", "events": events}
+
+    def import_all(self, path):
+        imported = []
+        counts = core.read_import(path, imported.extend)
+        return imported, counts
+
+    def read_back(self, path):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            if core.export_kind(path) == "csv":
+                return list(csv.DictReader(f))
+            if core.export_kind(path) == "ndjson":
+                return [json.loads(line) for line in f]
+            return json.load(f)["events"]
+
+    def as_text(self, rows):
+        # CSV has no types, so every field is compared as text
+        return [{key: "" if row[key] is None else str(row[key]) for key in core.EXPORT_EVENT_FIELDS} for row in rows]
+
+    def test_snapshot_formats(self):
+        snapshot = self.snapshot()
+        expected = [event.to_api() for event in snapshot["events"]]
+        for suffix in self.SUFFIXES:
+            with self.subTest(suffix=suffix):
+                path = self.path("export" + suffix)
+                self.assertEqual(core.write_export(path, *snapshot_rows(snapshot)), len(expected))
+                self.assertEqual(self.as_text(self.read_back(path)), self.as_text(expected))
+                self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_snapshot_round_trip(self):
+        snapshot = self.snapshot()
+        for suffix in self.SUFFIXES:
+            with self.subTest(suffix=suffix):
+                path = self.path("export" + suffix)
+                count = core.write_export(path, *snapshot_rows(snapshot))
+                self.assertEqual(count, len(snapshot["events"]))
+                imported, counts = self.import_all(path)
+                self.assertEqual(counts, (len(snapshot["events"]), 0))
+                self.assertEqual(rows(imported), rows(snapshot["events"]))
+                self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_json_export_keeps_the_header(self):
+        path = self.path("export.json.gz")
+        core.write_export(path, *snapshot_rows(self.snapshot()))
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            document = json.load(f)
+        self.assertEqual((document["sport"], document["timestamp"]), ("Soccer", "2026-01-01T15:00:00"))
+
+    def test_malformed_items_are_skipped(self):
+        path = self.path("import.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(make_event(1).to_api()) + "\n")
+            f.write(json.dumps({"strSport": "Soccer"}) + "\n\n")
+            f.write(json.dumps(make_event(2).to_api()) + "\n")
+        imported, counts = self.import_all(path)
+        self.assertEqual(counts, (2, 1))
+        self.assertEqual([event.event_id for event in imported], ["1", "2"])
+
+    def test_progress_and_cancel(self):
+        path = self.path("export.ndjson")
+        cancelled = threading.Event()
+        progress = []
+
+        def on_progress(count, total):
+            progress.append(count)
+            cancelled.set()
+
+        with self.assertRaises(core.ExportCancelled):
+            core.write_export(path, *snapshot_rows(self.snapshot()), on_progress=on_progress, cancelled=cancelled)
+        self.assertEqual(progress, [core.EXPORT_PROGRESS_ROWS])
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_history_export(self):
+        history = core.HistoryStore(self.database())
+        history.record([make_event(1, 0, 0, "1H"), make_event(2, 0, 0, "1H")], timestamp=1000)
+        history.record([make_event(1, 1, 0, "1H"), make_event(2, 0, 0, "1H")], timestamp=1010)
+        path = self.path("history.csv")
+        self.assertEqual(core.write_export(path, *history_rows(history, 1005)), 1)
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], ",".join(core.EXPORT_HISTORY_FIELDS))
+        self.assertEqual(lines[1], "1010.0,1,Soccer,Premier League,Home 1,Away 1,1,,,")
+
+
+def snapshot_rows(snapshot):
+    export_rows, total, header = core.snapshot_export(snapshot)
+    return export_rows, core.EXPORT_EVENT_FIELDS, total, header
+
+
+def history_rows(history, start, end=None):
+    export_rows, total, header = core.history_export(history, start, end)
+    return export_rows, core.EXPORT_HISTORY_FIELDS, total, header
+
+
+class FanoutTest(unittest.TestCase):
+    def setUp(self):
+        self.server = core.FanoutServer(port=0).start()
+        self.addCleanup(self.server.stop)
+        self.engine = core.EventDeltaEngine()
+
+    def publish(self, events, timestamp):
+        # What FeedPoller.publish hands its on_data / on_delta callbacks
+        self.server.publish(core.tag_snapshot({"events": events, "timestamp": timestamp}, "Soccer", None))
+        delta = self.engine.diff(events, timestamp)
+        delta["sport"], delta["league"] = "Soccer", None
+        self.server.publish_delta(delta)
+
+    def connect(self):
+        connection = socket.create_connection(("127.0.0.1", self.server.port), timeout=5)
+        self.addCleanup(connection.close)
+        connection.sendall(b"GET /events HTTP/1.1\r\nHost: test\r\n\r\n")
+        stream = connection.makefile("rb")
+        self.addCleanup(stream.close)
+        self.assertEqual(stream.readline(), b"HTTP/1.1 200 OK\r\n")
+        while stream.readline().strip():
+            pass
+        return stream
+
+    def frame(self, stream):
+        lines = []
+        while True:
+            line = stream.readline().rstrip(b"\n")
+            if not line and lines:
+                break
+            if line and not line.startswith(b":"):
+                lines.append(line.decode())
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("event: ") and lines[1].startswith("data: "))
+        return lines[0][7:], json.loads(lines[1][6:])
+
+    def test_snapshot_then_delta_frames(self):
+        self.publish([make_event(1, 0, 0, "1H", "10'"), make_event(2)], "2026-01-01T15:10:00")
+        stream = self.connect()
+        kind, payload = self.frame(stream)
+        self.assertEqual(kind, "snapshot")
+        self.assertEqual((payload["sport"], payload["league"], payload["timestamp"]),
+                         ("Soccer", None, "2026-01-01T15:10:00"))
+        self.assertEqual(payload["events"], rows([make_event(1, 0, 0, "1H", "10'"), make_event(2)]))
+        self.publish([make_event(1, 1, 0, "1H", "12'"), make_event(3)], "2026-01-01T15:12:00")
+        kind, payload = self.frame(stream)
+        self.assertEqual(kind, "delta")
+        self.assertEqual(payload, {"sport": "Soccer", "league": None, "timestamp": "2026-01-01T15:12:00",
+                                   "added": rows([make_event(3)]), "changed": rows([make_event(1, 1, 0, "1H", "12'")]),
+                                   "removed": ["2"]})
+
+    def test_subscriber_follows_the_server(self):
+        self.publish([make_event(1, 0, 0, "1H", "10'"), make_event(2, league="Serie A")], "2026-01-01T15:10:00")
+        received = []
+        changed = threading.Condition()
+
+        def on_data(data):
+            with changed:
+                received.append(data)
+                changed.notify_all()
+
+        def wait_for(check):
+            with changed:
+                self.assertTrue(changed.wait_for(lambda: any(check(data) for data in received), 5))
+
+        subscriber = core.FeedSubscriber(f"http://127.0.0.1:{self.server.port}/events", on_data=on_data)
+        subscriber.watch_league("Soccer", "Serie A")
+        thread = threading.Thread(target=subscriber.run)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(subscriber.stop)
+        wait_for(lambda data: data["league"] is None and len(data["events"]) == 2)
+        self.publish([make_event(1, 1, 0, "1H", "12'"), make_event(2, 0, 1, "1H", "5'", league="Serie A")],
+                     "2026-01-01T15:12:00")
+        wait_for(lambda data: data["league"] == "Serie A" and data["events"][0].away_score == 1)
+        sport = [data for data in received if data["league"] is None][-1]
+        self.assertEqual(rows(sport["events"]),
+                         rows([make_event(1, 1, 0, "1H", "12'"), make_event(2, 0, 1, "1H", "5'", league="Serie A")]))
+        subscriber.stop()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+
+class CommandLineTest(TempDirTest):
+    def history_db(self):
+        path = self.path("history.db")
+        db = core.DatabaseManager(path)
+        core.HistoryStore(db).record([make_event(1, 0, 0, "1H")], timestamp=time.time())
+        db.close()
+        return path
+
+    def test_commands_match_the_parser(self):
+        parser = core.build_parser()
+        [commands] = [action for action in parser._actions if action.dest == "command"]
+        self.assertEqual(tuple(commands.choices), core.COMMANDS)
+
+    def test_export_command(self):
+        output = self.path("out.ndjson")
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                code = core.main(["export", "--db", self.history_db(), "--since", "2000-01-01", output])
+            finally:
+                sys.stdout = stdout
+        self.assertEqual(code, 0)
+        with open(output, encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["event_id"] for line in f], ["1"])
+
+    def run_gui_entry_point(self, *args):
+        script = ("import runpy, sys; sys.argv = sys.argv[1:]\n"
+                  "try:\n"
+                  "    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+                  "except SystemExit as e:\n"
+                  "    assert not e.code, e.code\n"
+                  "assert 'PyQt6' not in sys.modules\n")
+        result = subprocess.run([sys.executable, "-c", script, os.path.join(ROOT, "live_sports_hub.py"), *args],
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result
+
+    def test_gui_entry_point_polls_without_qt(self):
+        result = self.run_gui_entry_point("poll", "--sport", "Soccer", "--once", "--mock")
+        self.assertIn("Soccer", result.stdout)
+
+    def test_gui_entry_point_runs_subcommands_without_qt(self):
+        output = self.path("out.csv")
+        self.run_gui_entry_point("export", "--db", self.history_db(), "--since", "2000-01-01", output)
+        self.assertTrue(os.path.exists(output))
+
+
+if __name__ == "__main__":
+    unittest.main()